@@ -0,0 +1,103 @@
+"""
+Row by row validation against validate_many on numeric/choice payloads.
+
+    PYTHONPATH=. python benchmarks/bench_batch.py
+"""
+import os
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django
+django.setup()
+
+from definable_serializer import batch
+from definable_serializer import serializers as definable_serializer
+from definable_serializer.validation import compile_validation
+
+from unittest import mock
+import gc
+import random
+import time
+
+
+ROWS = 20000
+
+DEFINITION = {
+    "main": {
+        "name": "Submission",
+        "fields": [
+            {"name": "score_{}".format(i), "field": "IntegerField",
+             "field_kwargs": {"min_value": 0, "max_value": 100}}
+            for i in range(10)
+        ] + [
+            {"name": "rate_{}".format(i), "field": "FloatField",
+             "field_kwargs": {"min_value": 0, "max_value": 1}}
+            for i in range(5)
+        ] + [
+            {"name": "question_{}".format(i), "field": "ChoiceField",
+             "field_args": [[[str(v), str(v)] for v in range(1, 6)]]}
+            for i in range(10)
+        ],
+    },
+}
+
+
+def _payloads():
+    rnd = random.Random(0)
+    payloads = list()
+    for _ in range(ROWS):
+        payload = dict()
+        for i in range(10):
+            payload["score_{}".format(i)] = str(rnd.randint(-5, 105))
+        for i in range(5):
+            payload["rate_{}".format(i)] = round(rnd.random() * 1.1, 2)
+        for i in range(10):
+            payload["question_{}".format(i)] = str(rnd.randint(1, 6))
+        payloads.append(payload)
+    return payloads
+
+
+def _measure(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    serializer_class = definable_serializer.build_serializer(DEFINITION)
+    payloads = _payloads()
+
+    def _is_valid():
+        results = list()
+        for data in payloads:
+            serializer = serializer_class(data=data)
+            serializer.is_valid()
+            results.append((serializer.validated_data, serializer.errors))
+        return results
+
+    def _compiled():
+        validate = compile_validation(serializer_class)
+        return [validate(data) for data in payloads]
+
+    def _without_numpy():
+        with mock.patch.object(batch, "np", None):
+            return batch.validate_many(serializer_class, payloads)
+
+    expected = None
+    for label, func in (("is_valid", _is_valid),
+                        ("compile_validation", _compiled),
+                        ("validate_many, no numpy", _without_numpy),
+                        ("validate_many", lambda: batch.validate_many(
+                            serializer_class, payloads))):
+        gc.collect()
+        elapsed, results = _measure(func)
+        results = [tuple(result) for result in results]
+        if expected is None:
+            expected = results
+        assert results == expected, label
+        del results
+
+        print("{:<26}{:>8.2f} s".format(label, elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Build and instantiation of a serializer with a 50k options field, with the
+choices in the definition and in a ChoiceStore.
+
+    PYTHONPATH=. python benchmarks/bench_choice_store.py
+"""
+import os
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django
+django.setup()
+
+from django.http import HttpRequest
+
+from definable_serializer.choices import register_choice_store
+from definable_serializer.serializers import build_serializer
+
+import gc
+import time
+import tracemalloc
+
+
+OPTIONS = 50000
+INSTANCES = 50
+
+CHOICES = [
+    ["{:07d}".format(i), {"default": "code {}".format(i), "ja": "郵便番号 {}".format(i)}]
+    for i in range(OPTIONS)
+]
+
+INLINE_DEFINITION = {
+    "main": {
+        "name": "Address",
+        "fields": [
+            {"name": "postal_code",
+             "field": "definable_serializer.extra_fields.RadioField",
+             "field_args": [CHOICES]},
+        ],
+    },
+}
+
+STORE_DEFINITION = {
+    "main": {
+        "name": "Address",
+        "fields": [
+            {"name": "postal_code",
+             "field": "definable_serializer.extra_fields.RadioField",
+             "choice_store": "PostalCodes"},
+        ],
+    },
+}
+
+
+def _measure(defn_data):
+    request = HttpRequest()
+    request.LANGUAGE_CODE = "ja"
+    context = {"request": request}
+    gc.collect()
+
+    start = time.perf_counter()
+    serializer_class = build_serializer(defn_data)
+    built = time.perf_counter() - start
+
+    # the first instance creates the translated choices
+    serializer_class(context=context).fields
+
+    start = time.perf_counter()
+    for _ in range(INSTANCES):
+        serializer_class(context=context).fields
+    elapsed = (time.perf_counter() - start) / INSTANCES
+
+    tracemalloc.start()
+    serializer = serializer_class(context=context)
+    serializer.fields
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return built, elapsed, allocated
+
+
+def main():
+    register_choice_store("PostalCodes", CHOICES)
+
+    results = dict()
+    results["inline"] = _measure(INLINE_DEFINITION)
+    results["choice_store"] = _measure(STORE_DEFINITION)
+
+    print("{} options".format(OPTIONS))
+    for name, (built, elapsed, allocated) in results.items():
+        print("{:<14}build {:>8.2f} ms{:>10.3f} ms{:>10.0f} KiB per instance".format(
+            name, built * 1000, elapsed * 1000, allocated / 1024))
+
+    print("speedup {:.0f}x".format(
+        results["inline"][1] / results["choice_store"][1]))
+
+
+if __name__ == "__main__":
+    main()
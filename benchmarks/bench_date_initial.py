@@ -0,0 +1,83 @@
+"""
+Build time of a definition with dozens of Date/Time/DateTime fields.
+
+    PYTHONPATH=. python benchmarks/bench_date_initial.py
+"""
+import os
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django
+django.setup()
+
+from django.conf import settings as dj_settings
+
+from definable_serializer import dateparse
+from definable_serializer import serializers as definable_serializer
+
+from unittest import mock
+import dateparser
+import timeit
+
+
+FIELD_COUNT = 60
+NUMBER = 20
+
+
+def _dateparser_only(value, use_tz=False, time_zone=None):
+    # the behavior before the fast path
+    parser_settings = dict()
+    if use_tz:
+        parser_settings = {
+            "TIMEZONE": time_zone,
+            "RETURN_AS_TIMEZONE_AWARE": True
+        }
+    return dateparser.parse(str(value), settings=parser_settings)
+
+
+def _definition():
+    fields = list()
+    for i in range(FIELD_COUNT):
+        field, initial = [
+            ("DateField", "2000-01-{:02d}".format(i % 28 + 1)),
+            ("TimeField", "12:{:02d}:00".format(i % 60)),
+            ("DateTimeField", "2000-01-02 03:04:{:02d}".format(i % 60)),
+            ("DateField", ""),
+        ][i % 4]
+        fields.append({
+            "name": "field_{}".format(i),
+            "field": field,
+            "field_kwargs": {"initial": initial},
+        })
+
+    return {"main": {"name": "DateSerializer", "fields": fields}}
+
+
+def _build(defn):
+    definable_serializer.build_serializer.cache_clear()
+    definable_serializer.build_serializer(defn)
+
+
+def main():
+    defn = _definition()
+
+    with mock.patch.object(
+            definable_serializer, "parse_datetime_value", _dateparser_only):
+        before = timeit.timeit(lambda: _build(defn), number=NUMBER)
+
+    def _cold():
+        dateparse._parsed_cache.clear()
+        _build(defn)
+
+    cold = timeit.timeit(_cold, number=NUMBER)
+    warm = timeit.timeit(lambda: _build(defn), number=NUMBER)
+
+    print("{} date fields, USE_TZ={}".format(FIELD_COUNT, dj_settings.USE_TZ))
+    for label, elapsed in (("dateparser only", before),
+                           ("fast path", cold),
+                           ("fast path, memoized", warm)):
+        print("{:<22}{:>10.2f} ms / build".format(
+            label, elapsed / NUMBER * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Instantiation time and allocations of a serializer with many fields, with
+and without FLYWEIGHT_FIELDS.
+
+    PYTHONPATH=. python benchmarks/bench_flyweight.py
+"""
+import os
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django
+django.setup()
+
+from django.test.utils import override_settings
+
+from definable_serializer.serializers import build_serializer
+
+import time
+import tracemalloc
+
+
+INSTANCES = 200
+
+CHOICES = [[str(v), {"default": "choice {}".format(v), "ja": "選択肢 {}".format(v)}]
+           for v in range(100)]
+
+DEFINITION = {
+    "main": {
+        "name": "LargeSurvey",
+        "fields": [
+            {"name": "text_{}".format(i), "field": "CharField",
+             "field_kwargs": {"max_length": 100, "label": {
+                 "default": "text {}".format(i), "ja": "テキスト {}".format(i)}}}
+            for i in range(100)
+        ] + [
+            {"name": "question_{}".format(i), "field": "ChoiceField",
+             "field_args": [CHOICES]}
+            for i in range(200)
+        ],
+    },
+}
+
+
+def _measure(serializer_class):
+    # the first instance creates the cached translations of the class
+    serializer_class().fields
+
+    start = time.perf_counter()
+    for _ in range(INSTANCES):
+        serializer_class().fields
+    elapsed = (time.perf_counter() - start) / INSTANCES
+
+    tracemalloc.start()
+    serializer = serializer_class()
+    serializer.fields
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return elapsed, allocated
+
+
+def main():
+    results = dict()
+    results["deepcopy"] = _measure(build_serializer(DEFINITION))
+
+    with override_settings(DEFINABLE_SERIALIZER_SETTINGS={"FLYWEIGHT_FIELDS": True}):
+        results["flyweight"] = _measure(build_serializer(DEFINITION))
+
+    print("{} fields".format(len(DEFINITION["main"]["fields"])))
+    for name, (elapsed, allocated) in results.items():
+        print("{:<12}{:>10.2f} ms{:>10.0f} KiB per instance".format(
+            name, elapsed * 1000, allocated / 1024))
+
+    print("speedup {:.1f}x".format(
+        results["deepcopy"][0] / results["flyweight"][0]))
+
+
+if __name__ == "__main__":
+    main()
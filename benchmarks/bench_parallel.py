@@ -0,0 +1,77 @@
+"""
+Throughput of validate_parallel by number of worker processes.
+
+    PYTHONPATH=. python benchmarks/bench_parallel.py
+"""
+import os
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django
+django.setup()
+
+from definable_serializer.parallel import validate_parallel
+
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import time
+
+
+ROWS = 50000
+CHUNKSIZE = 500
+
+DEFINITION = {
+    "main": {
+        "name": "Submission",
+        "fields": [
+            {"name": "name", "field": "CharField",
+             "field_kwargs": {"max_length": 50}},
+            {"name": "email", "field": "EmailField"},
+            {"name": "age", "field": "IntegerField",
+             "field_kwargs": {"min_value": 0, "max_value": 150}},
+            {"name": "score", "field": "DecimalField",
+             "field_kwargs": {"max_digits": 5, "decimal_places": 2}},
+            {"name": "birthday", "field": "DateField"},
+        ] + [
+            {"name": "question_{}".format(i), "field": "ChoiceField",
+             "field_args": [[[str(v), str(v)] for v in range(1, 6)]]}
+            for i in range(10)
+        ],
+    },
+}
+
+
+def _payloads():
+    return [dict({
+        "name": "user{}".format(i),
+        "email": "user{}@example.com".format(i),
+        "age": str(i % 160),
+        "score": "{}.25".format(i % 1000),
+        "birthday": "1990-01-{:02d}".format(i % 28 + 1),
+    }, **{"question_{}".format(q): str((i + q) % 6 + 1) for q in range(10)})
+        for i in range(ROWS)]
+
+
+def main():
+    payloads = _payloads()
+    context = multiprocessing.get_context("fork")
+
+    start = time.perf_counter()
+    expected = validate_parallel(DEFINITION, payloads, chunksize=CHUNKSIZE)
+    single = time.perf_counter() - start
+    print("{} rows, {} cpus".format(ROWS, os.cpu_count()))
+    print("{:<14}{:>8.2f} s".format("in process", single))
+
+    for workers in (1, 2, 4, 8):
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            start = time.perf_counter()
+            report = validate_parallel(
+                DEFINITION, payloads, executor=executor, chunksize=CHUNKSIZE)
+            elapsed = time.perf_counter() - start
+
+        assert report == expected
+        print("{:<14}{:>8.2f} s  {:.1f}x".format(
+            "{} workers".format(workers), elapsed, single / elapsed))
+
+
+if __name__ == "__main__":
+    main()
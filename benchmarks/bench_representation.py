@@ -0,0 +1,85 @@
+"""
+serializer(many=True).data against the compiled representation on 100k rows.
+
+    PYTHONPATH=. python benchmarks/bench_representation.py
+"""
+import os
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django
+django.setup()
+
+from definable_serializer import serializers as definable_serializer
+from definable_serializer.representation import compile_representation
+
+import datetime
+import decimal
+import time
+
+
+ROWS = 100000
+
+DEFINITION = {
+    "main": {
+        "name": "Submission",
+        "fields": [
+            {"name": "name", "field": "CharField"},
+            {"name": "email", "field": "EmailField"},
+            {"name": "age", "field": "IntegerField"},
+            {"name": "score", "field": "DecimalField",
+             "field_kwargs": {"max_digits": 5, "decimal_places": 2}},
+            {"name": "agree", "field": "BooleanField"},
+            {"name": "gender",
+             "field": "definable_serializer.extra_fields.RadioField",
+             "field_args": [[["male", "Male"], ["female", "Female"]]]},
+            {"name": "birthday", "field": "DateField"},
+            {"name": "comment",
+             "field": "definable_serializer.extra_fields.TextField"},
+        ] + [
+            {"name": "question_{}".format(i), "field": "ChoiceField",
+             "field_args": [[[str(v), str(v)] for v in range(1, 6)]]}
+            for i in range(10)
+        ],
+    },
+}
+
+
+def _rows():
+    return [dict({
+        "name": "user{}".format(i),
+        "email": "user{}@example.com".format(i),
+        "age": i % 100,
+        "score": decimal.Decimal("99.50"),
+        "agree": True,
+        "gender": "male",
+        "birthday": datetime.date(1990, 1, 1),
+        "comment": "",
+    }, **{"question_{}".format(q): str(q % 5 + 1) for q in range(10)})
+        for i in range(ROWS)]
+
+
+def _measure(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    serializer_class = definable_serializer.build_serializer(DEFINITION)
+    to_representation = compile_representation(serializer_class)
+    rows = _rows()
+
+    generic, expected = _measure(
+        lambda: serializer_class(rows, many=True).data)
+    compiled, rendered = _measure(lambda: to_representation(rows))
+    assert rendered == expected
+
+    print("{} rows".format(ROWS))
+    for label, elapsed in (("many=True .data", generic),
+                           ("compile_representation", compiled)):
+        print("{:<24}{:>10.2f} s".format(label, elapsed))
+    print("speedup {:.1f}x".format(generic / compiled))
+
+
+if __name__ == "__main__":
+    main()
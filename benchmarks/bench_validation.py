@@ -0,0 +1,96 @@
+"""
+is_valid against the compiled validation of the same serializer.
+
+    PYTHONPATH=. python benchmarks/bench_validation.py
+"""
+import os
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django
+django.setup()
+
+from definable_serializer import serializers as definable_serializer
+from definable_serializer.validation import compile_validation
+
+import timeit
+
+
+NUMBER = 2000
+
+DEFINITION = {
+    "main": {
+        "name": "Submission",
+        "fields": [
+            {"name": "name", "field": "CharField",
+             "field_kwargs": {"max_length": 50}},
+            {"name": "email", "field": "EmailField"},
+            {"name": "age", "field": "IntegerField",
+             "field_kwargs": {"min_value": 0, "max_value": 150}},
+            {"name": "score", "field": "DecimalField",
+             "field_kwargs": {"max_digits": 5, "decimal_places": 2}},
+            {"name": "agree",
+             "field": "definable_serializer.extra_fields.CheckRequiredField"},
+            {"name": "gender",
+             "field": "definable_serializer.extra_fields.RadioField",
+             "field_args": [[["male", "Male"], ["female", "Female"]]]},
+            {"name": "birthday", "field": "DateField"},
+            {"name": "comment",
+             "field": "definable_serializer.extra_fields.TextField",
+             "field_kwargs": {"allow_blank": True}},
+            {"name": "members", "field": "Member",
+             "field_kwargs": {"many": True}},
+        ] + [
+            {"name": "question_{}".format(i), "field": "ChoiceField",
+             "field_args": [[[str(v), str(v)] for v in range(1, 6)]]}
+            for i in range(20)
+        ],
+    },
+    "depending_serializers": [{
+        "name": "Member",
+        "fields": [
+            {"name": "email", "field": "EmailField"},
+            {"name": "role", "field": "ChoiceField",
+             "field_args": [[["owner", "Owner"], ["member", "Member"]]]},
+        ],
+    }],
+}
+
+PAYLOAD = dict({
+    "name": "taro",
+    "email": "taro@example.com",
+    "age": "30",
+    "score": "99.50",
+    "agree": "true",
+    "gender": "male",
+    "birthday": "1990-01-01",
+    "comment": "",
+    "members": [
+        {"email": "a@example.com", "role": "owner"},
+        {"email": "b@example.com", "role": "member"},
+    ],
+}, **{"question_{}".format(i): str(i % 5 + 1) for i in range(20)})
+
+
+def main():
+    serializer_class = definable_serializer.build_serializer(DEFINITION)
+    validate = compile_validation(serializer_class)
+
+    def _is_valid():
+        serializer = serializer_class(data=PAYLOAD)
+        serializer.is_valid()
+        return serializer.validated_data
+
+    assert _is_valid() == validate(PAYLOAD).validated_data
+
+    generic = timeit.timeit(_is_valid, number=NUMBER)
+    compiled = timeit.timeit(lambda: validate(PAYLOAD), number=NUMBER)
+
+    for label, elapsed in (("is_valid", generic),
+                           ("compile_validation", compiled)):
+        print("{:<22}{:>10.1f} us / payload".format(
+            label, elapsed / NUMBER * 1000000))
+    print("speedup {:.1f}x".format(generic / compiled))
+
+
+if __name__ == "__main__":
+    main()
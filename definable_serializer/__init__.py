@@ -1 +1,3 @@
 __VERSION__ = "0.1.21"
+
+default_app_config = "definable_serializer.apps.DefinableSerializerConfig"
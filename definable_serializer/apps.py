@@ -1,5 +1,37 @@
 from django.apps import AppConfig
+from django.conf import settings as dj_settings
+
+import logging
+
+
+logger = logging.getLogger(__name__)
 
 
 class DefinableSerializerConfig(AppConfig):
     name = 'definable_serializer'
+
+    def ready(self):
+        defn_settings = getattr(
+            dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {})
+
+        if defn_settings.get("WARMUP_ON_READY", False):
+            from django.db import connections
+            from .warmup import warmup
+
+            # ready() runs for every management command too, the warm-up
+            # never stops them
+            try:
+                report = warmup()
+            except Exception:
+                logger.exception("can't warm up the definitions")
+                return
+            finally:
+                # the forked workers must not share the connections
+                connections.close_all()
+
+            logger.info(
+                "warmed %d definitions in %.2fs (gc frozen: %s)",
+                report.definitions, report.elapsed, report.frozen)
+
+            for name, error in report.errors:
+                logger.warning("can't warm up %s: %s", name, error)
@@ -0,0 +1,192 @@
+from django.core.validators import MaxValueValidator, MinValueValidator
+
+from rest_framework.fields import (
+    ChoiceField, Field, FloatField, IntegerField, empty)
+from rest_framework.utils import html
+
+from .validation import (
+    _as_result, _compile_field, _compile_serializer, _overrides)
+
+from collections.abc import Mapping
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+__all__ = (
+    "validate_many",
+)
+
+
+_MISSING = object()
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+# strings whose int()/float() conversion has no edge cases
+_INTEGER_RE = re.compile(r"-?[0-9]{1,18}\Z")
+_FLOAT_RE = re.compile(r"-?[0-9]{1,15}(\.[0-9]{1,15})?\Z")
+
+
+def _is_plain(field, field_class):
+    if type(field).to_internal_value is not field_class.to_internal_value:
+        return False
+
+    return not any(
+        _overrides(field, Field, name) for name in (
+            "get_value", "run_validation", "validate_empty_values",
+            "run_validators",
+        )
+    )
+
+
+def _range_validators(field, limit_types):
+    """
+    Return ``[(validator class, limit)]`` or None if a validator of the
+    field can't be vectorized.
+    """
+    ranges = list()
+    for validator in field.validators:
+        if type(validator) not in (MinValueValidator, MaxValueValidator):
+            return None
+        if type(validator.limit_value) not in limit_types:
+            return None
+        ranges.append((type(validator), validator.limit_value))
+    return ranges
+
+
+def _range_mask(values, ranges):
+    mask = np.ones(len(values), dtype=bool)
+    for validator_class, limit in ranges:
+        if validator_class is MinValueValidator:
+            mask &= values >= limit
+        else:
+            mask &= values <= limit
+    return mask
+
+
+def _passed(keys, values, mask):
+    by_type = dict()
+    for key, value, ok in zip(keys, values, mask.tolist()):
+        if ok:
+            by_type.setdefault(type(key), dict())[key] = value
+    return by_type
+
+
+def _integer_column(field, column):
+    ranges = _range_validators(field, (int,))
+    if ranges is None:
+        return None
+
+    ints = list({
+        v for v in column if type(v) is int and _INT64_MIN <= v <= _INT64_MAX})
+    strs = list({
+        v for v in column if type(v) is str and _INTEGER_RE.match(v)})
+
+    values = np.concatenate((
+        np.array(ints, dtype=np.int64),
+        np.array(strs, dtype=object).astype(np.int64),
+    ))
+    mask = _range_mask(values, ranges)
+    return _passed(ints + strs, values.tolist(), mask)
+
+
+def _float_column(field, column):
+    ranges = _range_validators(field, (int, float))
+    if ranges is None:
+        return None
+
+    # zero is left out, 0 and -0.0 are the same key but not the same result
+    numbers = list({
+        v for v in column if type(v) in (int, float) and v != 0})
+    strs = list({
+        v for v in column if type(v) is str and _FLOAT_RE.match(v)})
+
+    values = np.concatenate((
+        np.array(numbers, dtype=np.float64),
+        np.array(strs, dtype=object).astype(np.float64),
+    ))
+    mask = _range_mask(values, ranges)
+    return _passed(numbers + strs, values.tolist(), mask)
+
+
+def _choice_column(field, column):
+    if field.validators:
+        return None
+
+    choice_strings_to_values = field.choice_strings_to_values
+    strs = list({v for v in column if type(v) is str and v != ''})
+
+    mask = np.isin(
+        np.array(strs, dtype=object),
+        np.array(list(choice_strings_to_values), dtype=object)
+    )
+    return _passed(
+        strs, [choice_strings_to_values.get(v, None) for v in strs], mask)
+
+
+_VECTORIZERS = (
+    (IntegerField, _integer_column),
+    (FloatField, _float_column),
+    (ChoiceField, _choice_column),
+)
+
+
+def _vectorize(field, column):
+    for field_class, vectorizer in _VECTORIZERS:
+        if _is_plain(field, field_class):
+            return vectorizer(field, column)
+    return None
+
+
+def _vectorized_run_validation(run_validation, passed_by_type):
+    """
+    Return the validated value of the column when the vectorized checks
+    passed, otherwise validate the value as usual.
+    """
+    def vectorized_run_validation(data=empty):
+        passed = passed_by_type.get(type(data), None)
+        if passed is not None:
+            value = passed.get(data, _MISSING)
+            if value is not _MISSING:
+                return value
+
+        return run_validation(data)
+
+    return vectorized_run_validation
+
+
+def validate_many(serializer_class, payloads, context=None, partial=False):
+    """
+    Validate many payloads of the same serializer class and return a list
+    of ``ValidationResult(validated_data, errors)`` in the order of the
+    payloads, the same as calling ``is_valid`` for each of them.
+
+    With numpy installed, the values of IntegerField, FloatField (with
+    min_value/max_value) and ChoiceField are collected per column and
+    converted and checked at once. The values which don't pass, and all
+    the other fields, are validated row by row.
+    """
+    payloads = list(payloads)
+    prototype = serializer_class(context=context or {}, partial=partial)
+
+    run_validations = dict()
+    if np is not None:
+        rows = [
+            row for row in payloads
+            if isinstance(row, Mapping) and not html.is_html_input(row)
+        ]
+
+        for field in prototype._writable_fields:
+            field_name = field.field_name
+            passed_by_type = _vectorize(
+                field, [row.get(field_name, empty) for row in rows])
+
+            if passed_by_type:
+                run_validations[field_name] = _vectorized_run_validation(
+                    _compile_field(field), passed_by_type)
+
+    validate = _as_result(_compile_serializer(prototype, run_validations))
+    return [validate(data) for data in payloads]
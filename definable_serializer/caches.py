@@ -0,0 +1,594 @@
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+
+import concurrent.futures
+import hashlib
+import importlib.util
+import io
+import marshal
+import os
+import pickle
+import tempfile
+import threading
+import time
+import weakref
+
+
+__all__ = (
+    "ArtifactCache",
+    "CacheInfo",
+    "ClassRegistry",
+    "CodeCache",
+    "DirectoryStore",
+    "LRUCache",
+    "SingleFlight",
+    "make_defn_hash",
+)
+
+
+CacheInfo = namedtuple("CacheInfo", ("hits", "misses", "maxsize", "currsize"))
+
+
+_missing = object()
+
+
+def _canonical(value):
+    if isinstance(value, Mapping):
+        items = sorted(
+            "{}:{}".format(_canonical(k), _canonical(v))
+            for k, v in value.items()
+        )
+        return "{" + ",".join(items) + "}"
+
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_canonical(v) for v in value) + "]"
+
+    if isinstance(value, (set, frozenset)):
+        return "set(" + ",".join(sorted(_canonical(v) for v in value)) + ")"
+
+    return repr(value)
+
+
+def make_defn_hash(defn_data):
+    """
+    Return a hex digest of the definition data.
+
+    Mapping key order does not change the digest, so two definitions that
+    only differ by the order of their keys share the same hash.
+    """
+    canonical = _canonical(defn_data)
+    return hashlib.sha256(canonical.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe least recently used cache with hit/miss counters.
+
+    ``maxsize=None`` means unbounded and ``maxsize=0`` disables the cache.
+    ``get`` doesn't wait for the lock: a hit moves the entry to the most
+    recently used end only when no other thread holds the lock, and the
+    counters are approximate under contention.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        value = self._data.get(key, _missing)
+        if value is _missing:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        if self._lock.acquire(blocking=False):
+            try:
+                # the entry may have been evicted since the lookup
+                if key in self._data:
+                    self._data.move_to_end(key)
+            finally:
+                self._lock.release()
+
+        return value
+
+    def peek(self, key, default=None):
+        """
+        Return the value without counting a hit or miss or moving the entry.
+        """
+        return self._data.get(key, default)
+
+    def set(self, key, value):
+        if self.maxsize == 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+
+class ClassRegistry(LRUCache):
+    """
+    LRU cache of built classes with an entry budget (``maxsize``) and an
+    approximate memory budget (``maxbytes``, measured by ``sizeof``).
+
+    Evicted classes are only weakly referenced: a class which is still
+    used elsewhere, by a model instance or a running request, is found
+    and promoted again instead of being built twice, and is freed with
+    its fields and definition data when nothing uses it any more.
+    """
+
+    def __init__(self, maxsize=128, maxbytes=None, sizeof=None):
+        super().__init__(maxsize=maxsize)
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.currbytes = 0
+        self._sizes = dict()
+        self._weak = weakref.WeakValueDictionary()
+
+    def get(self, key, default=None):
+        value = super().get(key, _missing)
+        if value is not _missing:
+            return value
+
+        value = self._weak.get(key, None)
+        if value is None:
+            return default
+
+        # an evicted class which is still alive
+        self.misses -= 1
+        self.hits += 1
+        self.set(key, value)
+        return value
+
+    def peek(self, key, default=None):
+        value = self._data.get(key, _missing)
+        if value is _missing:
+            return self._weak.get(key, default)
+        return value
+
+    def _over_budget(self):
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            return True
+
+        # the newest entry is kept even if it is bigger than the budget
+        return (
+            self.maxbytes is not None and
+            self.currbytes > self.maxbytes and
+            len(self._data) > 1
+        )
+
+    def set(self, key, value):
+        if self.maxsize == 0:
+            return
+
+        size = 0
+        if self.maxbytes is not None and self.sizeof is not None:
+            size = self.sizeof(value)
+
+        with self._lock:
+            self._weak[key] = value
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self.currbytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+
+            while self._over_budget():
+                evicted_key, _ = self._data.popitem(last=False)
+                self.currbytes -= self._sizes.pop(evicted_key)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            value = self._weak.pop(key, None)
+            self.currbytes -= self._sizes.pop(key, 0)
+            value = self._data.pop(key, value)
+
+        return default if value is None else value
+
+    def evict(self, match):
+        """
+        Remove the entries whose key matches, including the weakly
+        referenced ones. Return the number of removed entries.
+        """
+        with self._lock:
+            keys = [key for key in list(self._weak.keys()) if match(key)]
+            for key in keys:
+                self._weak.pop(key, None)
+                self._data.pop(key, None)
+                self.currbytes -= self._sizes.pop(key, 0)
+
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._weak.clear()
+            self._sizes.clear()
+            self.currbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __contains__(self, key):
+        return key in self._data or key in self._weak
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time. Threads calling ``do`` with a
+    key which is already running wait for that call and share its result
+    or exception.
+    """
+
+    def __init__(self):
+        self._futures = dict()
+        self._lock = threading.Lock()
+
+    def do(self, key, func, *args, **kwargs):
+        with self._lock:
+            future = self._futures.get(key, None)
+            leader = future is None
+            if leader:
+                future = self._futures[key] = concurrent.futures.Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._futures[key]
+
+    def __len__(self):
+        return len(self._futures)
+
+
+class CodeCache:
+    """
+    Cache of code objects compiled from validate method sources.
+
+    Code objects are kept in memory by the hash of their source. When a
+    ``directory`` is given they are also written there with ``marshal`` so
+    other processes and restarted workers can skip the compile step.
+    """
+
+    filename = "<validate_method>"
+
+    def __init__(self, maxsize=256, directory=None):
+        self.directory = directory
+        self._cache = LRUCache(maxsize=maxsize)
+
+    @staticmethod
+    def source_hash(source):
+        return hashlib.sha256(source.encode("utf-8", "surrogatepass")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, "{}.marshal".format(key))
+
+    def _load(self, key):
+        if not self.directory:
+            return None
+
+        try:
+            with open(self._path(key), "rb") as fh:
+                data = fh.read()
+        except OSError:
+            return None
+
+        magic = importlib.util.MAGIC_NUMBER
+        if not data.startswith(magic):
+            return None
+
+        try:
+            return marshal.loads(data[len(magic):])
+        except (EOFError, ValueError, TypeError):
+            return None
+
+    def _dump(self, key, code):
+        if not self.directory:
+            return
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(importlib.util.MAGIC_NUMBER + marshal.dumps(code))
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            # the disk is only a second chance, the memory cache still works
+            pass
+
+    def compile(self, source):
+        key = self.source_hash(source)
+
+        code = self._cache.get(key)
+        if code is None:
+            code = self._load(key)
+            if code is None:
+                code = compile(source, self.filename, "exec")
+                self._dump(key, code)
+            self._cache.set(key, code)
+
+        return code
+
+    def add(self, key, code):
+        """
+        Keep a code object compiled elsewhere under its ``source_hash``.
+        """
+        self._cache.set(key, code)
+
+    def clear(self):
+        self._cache.clear()
+
+    def info(self):
+        return self._cache.info()
+
+
+class DirectoryStore:
+    """
+    Minimal cache backend keeping pickled values in the files of a
+    directory. Files written by another python version are ignored.
+
+    A value expires after ``timeout`` seconds (None never expires), and
+    the least recently used files are removed when there are more than
+    ``max_entries`` of them (None keeps every file).
+    """
+
+    def __init__(self, directory, timeout=None, max_entries=1024):
+        self.directory = directory
+        self.timeout = timeout
+        self.max_entries = max_entries
+
+    def _path(self, key):
+        filename = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, "{}.pickle".format(filename))
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                data = fh.read()
+        except OSError:
+            return default
+
+        magic = importlib.util.MAGIC_NUMBER
+        if not data.startswith(magic):
+            return default
+
+        try:
+            fh = io.BytesIO(data[len(magic):])
+            expires = pickle.load(fh)
+            if expires is not None and expires <= time.time():
+                self._remove(path)
+                return default
+
+            value = pickle.load(fh)
+        except Exception:
+            return default
+
+        # the modification time orders the files for the cleanup
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return value
+
+    def set(self, key, value, timeout=_missing):
+        if timeout is _missing:
+            timeout = self.timeout
+        expires = None if timeout is None else time.time() + timeout
+
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(importlib.util.MAGIC_NUMBER)
+                pickle.dump(expires, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        self._cull()
+
+    def _remove(self, path):
+        try:
+            os.unlink(path)
+        except OSError:
+            # removed by another process
+            pass
+
+    def _cull(self):
+        if self.max_entries is None:
+            return
+
+        entries = list()
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(".pickle"):
+                    continue
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    pass
+
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort()
+        for _, path in entries[:len(entries) - self.max_entries]:
+            self._remove(path)
+
+
+def _serializer_defns(defn_data):
+    return [defn_data["main"]] + list(
+        defn_data.get("depending_serializers", list()))
+
+
+def _method_sources(defn_data):
+    for serializer_defn in _serializer_defns(defn_data):
+        for key in ("serializer_validate_method", "validate_method"):
+            if serializer_defn.get(key, None):
+                yield serializer_defn[key]
+
+        for field_defn in serializer_defn["fields"]:
+            for key in ("field_validate_method", "validate_method"):
+                if field_defn.get(key, None):
+                    yield field_defn[key]
+
+
+def _class_paths(defn_data):
+    """
+    Dotted paths of the field and validator classes of the definition.
+    """
+    for serializer_defn in _serializer_defns(defn_data):
+        for field_defn in serializer_defn["fields"]:
+            if "." in field_defn["field"]:
+                yield field_defn["field"]
+
+            for validator_defn in field_defn.get("validators", list()):
+                yield validator_defn["validator"]
+
+
+class ArtifactCache:
+    """
+    Build artifacts shared by processes through a Django cache backend or
+    a ``DirectoryStore``.
+
+    An artifact is the checked definition data, the marshaled code of its
+    validate methods and the modules of its class paths, stored by the
+    hash of the definition. A process which finds it skips the check and
+    the compile steps and only creates the classes. Errors of the backend
+    are treated as misses.
+    """
+
+    key_prefix = "definable_serializer:artifact"
+
+    def __init__(self, backend, code_cache, resolver=None, timeout=_missing):
+        self.backend = backend
+        self.code_cache = code_cache
+        self.resolver = resolver
+        self.timeout = timeout
+
+    def _key(self, defn_hash):
+        # marshal data is only readable by the same python version
+        return "{}:{}:{}".format(
+            self.key_prefix, importlib.util.MAGIC_NUMBER.hex(), defn_hash)
+
+    def load(self, defn_hash):
+        """
+        Return the definition data of the artifact, or None.
+        """
+        artifact = self.get(self._key(defn_hash))
+        if not isinstance(artifact, Mapping):
+            return None
+
+        try:
+            codes = [
+                (key, marshal.loads(data))
+                for key, data in artifact["code"].items()
+            ]
+        except (KeyError, AttributeError, EOFError, ValueError, TypeError):
+            return None
+
+        for key, code in codes:
+            self.code_cache.add(key, code)
+
+        if self.resolver is not None:
+            try:
+                self.resolver.preload(artifact.get("paths", dict()))
+            except (AttributeError, TypeError, ValueError):
+                pass
+
+        return artifact.get("definition", None)
+
+    def store(self, defn_hash, defn_data):
+        code = dict()
+        for source in _method_sources(defn_data):
+            try:
+                compiled = self.code_cache.compile(source)
+            except SyntaxError:
+                continue
+            code[self.code_cache.source_hash(source)] = marshal.dumps(compiled)
+
+        paths = dict()
+        if self.resolver is not None:
+            paths = self.resolver.resolved_paths(_class_paths(defn_data))
+
+        artifact = {"definition": defn_data, "code": code, "paths": paths}
+
+        try:
+            self.set(self._key(defn_hash), artifact)
+        except Exception:
+            # the shared tier is optional, the build cache still works
+            pass
+
+    def _source_key(self, source, format):
+        if isinstance(source, str):
+            source = source.encode("utf-8", "surrogatepass")
+
+        return "{}:source:{}:{}".format(
+            self.key_prefix, format, hashlib.sha256(source).hexdigest())
+
+    def load_source(self, source, format):
+        """
+        Return ``(defn_data, defn_hash)`` parsed from a JSON or YAML source
+        by ``store_source``, or None.
+        """
+        loaded = self.get(self._source_key(source, format))
+        if not (isinstance(loaded, tuple) and len(loaded) == 2):
+            return None
+
+        return loaded
+
+    def store_source(self, source, format, defn_data, defn_hash):
+        try:
+            self.set(self._source_key(source, format), (defn_data, defn_hash))
+        except Exception:
+            pass
+
+    def get(self, key):
+        try:
+            return self.backend.get(key)
+        except Exception:
+            return None
+
+    def set(self, key, value):
+        kwargs = dict()
+        if self.timeout is not _missing:
+            kwargs["timeout"] = self.timeout
+
+        self.backend.set(key, value, **kwargs)
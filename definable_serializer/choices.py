@@ -0,0 +1,229 @@
+from django.conf import settings as dj_settings
+from django.utils.module_loading import import_string
+
+from rest_framework import fields as rf_fields
+
+from collections.abc import Sequence
+import threading
+import types
+
+
+__all__ = (
+    "ChoiceStore",
+    "ChoiceIndex",
+    "ChoiceStoreMixin",
+    "register_choice_store",
+    "get_choice_store",
+)
+
+
+class ChoiceIndex(Sequence):
+    """
+    Read-only choices of a ``ChoiceStore`` in one language.
+
+    A sequence of ``(value, label)`` pairs whose ``grouped_choices``,
+    ``choices`` and ``choice_strings_to_values`` mappings are used by the
+    fields as they are. Membership and label lookup are dict lookups.
+    """
+    __slots__ = ("store", "language", "choices", "choice_strings_to_values")
+
+    def __init__(self, store, language, choices):
+        self.store = store
+        self.language = language
+        self.choices = types.MappingProxyType(choices)
+        self.choice_strings_to_values = store.choice_strings_to_values
+
+    @property
+    def grouped_choices(self):
+        # a store has no groups
+        return self.choices
+
+    def label(self, value, default=None):
+        """
+        Return the label of the value or of its string representation.
+        """
+        value = self.choice_strings_to_values.get(str(value), value)
+        return self.choices.get(value, default)
+
+    def __contains__(self, value):
+        return str(value) in self.choice_strings_to_values
+
+    def __getitem__(self, index):
+        value = self.store.values[index]
+        if isinstance(index, slice):
+            return [(v, self.choices[v]) for v in value]
+        return value, self.choices[value]
+
+    def __iter__(self):
+        return iter(self.choices.items())
+
+    def __len__(self):
+        return len(self.choices)
+
+    # the index is shared by every field using it
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.store.language_choices, (self.language,)
+
+    def __repr__(self):
+        return "<ChoiceIndex {!r} {}: {} choices>".format(
+            self.store.name, self.language, len(self))
+
+
+class ChoiceStore:
+    """
+    Immutable choices ``[[value, label], ...]`` indexed by value. A label
+    is a string or a ``{language: label}`` dict with a "default" entry.
+
+    The choices of each language are built once, on first use, and shared
+    by every field and serializer instance using the store.
+    """
+
+    def __init__(self, choices, name=None):
+        labels = dict()
+        for choice in choices:
+            if not isinstance(choice, (list, tuple)) or len(choice) != 2:
+                raise ValueError(
+                    "choice must be [value, label]: {!r}".format(choice))
+
+            value, label = choice
+            if isinstance(label, dict) and label.get("default", None) is None:
+                raise ValueError(
+                    "'default' is required in the label of {!r}".format(value))
+            labels[value] = label
+
+        self.name = name
+        self.values = tuple(labels)
+        self._labels = tuple(labels.values())
+
+        self.languages = frozenset(
+            language for label in self._labels if isinstance(label, dict)
+            for language in label
+        ) | {"default"}
+
+        self.choice_strings_to_values = types.MappingProxyType({
+            str(value): value for value in self.values})
+
+        self._indexes = dict()
+        self._lock = threading.Lock()
+
+    def language_choices(self, language="default"):
+        """
+        Return the ``ChoiceIndex`` of the language. Languages without
+        labels use the "default" one.
+        """
+        if language not in self.languages:
+            language = "default"
+
+        index = self._indexes.get(language, None)
+        if index is not None:
+            return index
+
+        with self._lock:
+            index = self._indexes.get(language, None)
+            if index is None:
+                index = ChoiceIndex(self, language, {
+                    value: _translate(label, language)
+                    for value, label in zip(self.values, self._labels)
+                })
+                self._indexes[language] = index
+
+        return index
+
+    def label(self, value, language="default", default=None):
+        return self.language_choices(language).label(value, default)
+
+    def __contains__(self, value):
+        return str(value) in self.choice_strings_to_values
+
+    def __len__(self):
+        return len(self.values)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return ChoiceStore, (list(zip(self.values, self._labels)), self.name)
+
+    def __repr__(self):
+        return "<ChoiceStore {!r}: {} choices>".format(self.name, len(self))
+
+
+def _translate(label, language):
+    if isinstance(label, dict):
+        return label.get(language, None) or label["default"]
+    return label
+
+
+class ChoiceStoreMixin:
+    """
+    ChoiceField mixin which uses the mappings of a ``ChoiceIndex`` instead
+    of building its own.
+    """
+
+    def _set_choices(self, choices):
+        if isinstance(choices, ChoiceIndex):
+            self.grouped_choices = choices.grouped_choices
+            self._choices = choices.choices
+            self.choice_strings_to_values = choices.choice_strings_to_values
+        else:
+            super()._set_choices(choices)
+
+    choices = property(rf_fields.ChoiceField._get_choices, _set_choices)
+
+
+_stores = dict()
+_stores_lock = threading.Lock()
+
+
+def register_choice_store(name, choices, replace=False):
+    """
+    Register the choices, a ``ChoiceStore`` or ``[[value, label], ...]``,
+    as the store which definitions refer to with ``choice_store: name``.
+
+    The classes already built keep the store they were built with.
+    """
+    if not isinstance(choices, ChoiceStore):
+        choices = ChoiceStore(choices, name=name)
+    elif choices.name is None:
+        choices.name = name
+
+    with _stores_lock:
+        if name in _stores and not replace:
+            raise ValueError(
+                "choice store '{}' is already registered".format(name))
+        _stores[name] = choices
+
+    return choices
+
+
+def get_choice_store(name):
+    """
+    Return the registered store, or the one of the ``CHOICE_STORES``
+    setting: {name: "dotted.path.to.choices"}.
+    """
+    store = _stores.get(name, None)
+    if store is not None:
+        return store
+
+    path = getattr(
+        dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {}
+    ).get("CHOICE_STORES", {}).get(name, None)
+
+    if path is None:
+        raise LookupError("choice store '{}' is not registered".format(name))
+
+    choices = import_string(path)
+    if not isinstance(choices, ChoiceStore):
+        choices = ChoiceStore(choices, name=name)
+
+    with _stores_lock:
+        return _stores.setdefault(name, choices)
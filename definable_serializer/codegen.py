@@ -0,0 +1,337 @@
+from django.core.exceptions import ValidationError
+
+from .choices import ChoiceIndex
+from .resolvers import get_resolver
+from .serializers import (
+    BASE_CLASSES_BY_SETTINGS,
+    BaseDefinableSerializer,
+    DefinableSerializerMeta,
+    _bridge_async,
+    _sort_depending_serializers,
+    build_serializer,
+)
+
+from collections.abc import Mapping
+
+import datetime
+import decimal
+import inspect
+import keyword
+import re
+import textwrap
+
+
+__all__ = (
+    "generate_serializer_module",
+)
+
+
+HEADER = '''\
+# Generated by definable_serializer.codegen, do not edit by hand.
+# The classes are static versions of the serializers built by
+# build_serializer from the same definition.
+'''
+
+# the names of the generated module itself, the imports included, start
+# with the prefix so the names of a definition can't shadow them
+PRIVATE_PREFIX = "_dsg_"
+
+
+class _Source:
+    """
+    Python source emitted as is by _literal.
+    """
+
+    def __init__(self, source):
+        self.source = source
+
+
+class _DependingRef:
+
+    def __init__(self, source):
+        self.source = source
+
+
+def _import(module_path, imports):
+    """
+    Return the private name the module is imported as.
+    """
+    alias = imports.get(module_path, None)
+    if alias is None:
+        alias = PRIVATE_PREFIX + module_path.replace(".", "_")
+        while alias in imports.values():
+            alias += "_"
+        imports[module_path] = alias
+
+    return alias
+
+
+def _qualname(obj):
+    qualname = getattr(obj, "__qualname__", "")
+    if not qualname or "<locals>" in qualname:
+        raise ValidationError(
+            "cannot generate an import for {!r}".format(obj))
+
+    return qualname
+
+
+def _literal(value, imports):
+    if isinstance(value, _Source):
+        return value.source
+
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return repr(value)
+
+    if isinstance(value, decimal.Decimal):
+        return "{}.Decimal({!r})".format(
+            _import("decimal", imports), str(value))
+
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        naive = _literal(value.replace(tzinfo=None), imports)
+        zone = getattr(value.tzinfo, "zone", None)
+        if zone:
+            return "{}.timezone({!r}).localize({})".format(
+                _import("pytz", imports), zone, naive)
+
+        return "{0}.replace(tzinfo={1}.timezone({1}.timedelta(seconds={2!r})))".format(
+            naive, _import("datetime", imports),
+            value.utcoffset().total_seconds())
+
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time,
+                          datetime.timedelta)):
+        # "datetime.date(...)" of the imported module
+        return "{}.{}".format(
+            _import("datetime", imports), repr(value).partition(".")[2])
+
+    if isinstance(value, ChoiceIndex):
+        # the generated module uses the registered store too
+        return "{}.get_choice_store({!r}).language_choices({!r})".format(
+            _import("definable_serializer.choices", imports),
+            value.store.name, value.language)
+
+    if isinstance(value, Mapping):
+        return "{" + ", ".join(
+            "{}: {}".format(_literal(k, imports), _literal(v, imports))
+            for k, v in value.items()
+        ) + "}"
+
+    if isinstance(value, tuple):
+        items = [_literal(v, imports) for v in value]
+        if len(items) == 1:
+            return "(" + items[0] + ",)"
+        return "(" + ", ".join(items) + ")"
+
+    if isinstance(value, list):
+        return "[" + ", ".join(_literal(v, imports) for v in value) + "]"
+
+    if isinstance(value, (set, frozenset)):
+        return "{}.{}([{}])".format(
+            _import("builtins", imports),
+            type(value).__name__,
+            ", ".join(_literal(v, imports) for v in value)
+        )
+
+    raise ValidationError(
+        "cannot generate code for the value {!r}".format(value))
+
+
+def _reference(obj, imports):
+    qualname = _qualname(obj)
+    return "{}.{}".format(_import(obj.__module__, imports), qualname)
+
+
+def _validators_source(defn, imports):
+    resolver = get_resolver()
+    validators = list()
+
+    for validator_defn in defn.get("validators", list()):
+        validator_class = resolver.locate(validator_defn["validator"])
+
+        arguments = [
+            _literal(v, imports) for v in validator_defn.get("args", list())
+        ]
+        arguments += [
+            "{}={}".format(k, _literal(v, imports))
+            for k, v in validator_defn.get("kwargs", dict()).items()
+        ]
+        source = "{}({})".format(
+            _reference(validator_class, imports), ", ".join(arguments))
+        if inspect.iscoroutinefunction(
+                getattr(validator_class, "__call__", None)):
+            source = "{}({})".format(
+                _reference(_bridge_async, imports), source)
+        validators.append(source)
+
+    return _Source("[" + ", ".join(validators) + "]")
+
+
+def _method_source(method_str, function_name, imports):
+    body = textwrap.indent(textwrap.dedent(method_str).strip("\n"), "    ")
+    # _bridge_async returns the sync methods as they are
+    result = "{}(validate_method)".format(_reference(_bridge_async, imports))
+    return "def {}():\n{}\n    return {}\n".format(
+        function_name, body, result)
+
+
+def _is_identifier(name):
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _assign(name, source, imports):
+    if _is_identifier(name):
+        return "    {} = {}\n".format(name, source)
+
+    # names which can't be written as a class attribute
+    return "    {}.locals()[{!r}] = {}\n".format(
+        _import("builtins", imports), name, source)
+
+
+def _class_identifier(name, identifiers):
+    """
+    Return an unused identifier for the serializer class of the name.
+    """
+    identifier = re.sub(r"\W", "_", name)
+    if not identifier.isidentifier():
+        identifier = "_" + identifier
+    if not _is_identifier(identifier) or \
+            identifier.startswith(PRIVATE_PREFIX) or \
+            identifier == "serializer_class":
+        identifier += "_"
+
+    while identifier in identifiers:
+        identifier += "_"
+
+    identifiers.add(identifier)
+    return identifier
+
+
+def generate_serializer_module(defn_data,
+                               base_classes=list(),
+                               allow_validate_method=True):
+    """
+    Return the source of a python module defining the serializers of the
+    definition as plain classes. The main serializer is exported as
+    ``serializer_class``.
+    """
+    # check the definition the same way as build_serializer
+    build_serializer(
+        defn_data,
+        base_classes=base_classes,
+        allow_validate_method=allow_validate_method,
+    )
+
+    meta = DefinableSerializerMeta
+    imports = dict()
+    functions = list()
+    classes = list()
+    identifiers = set()
+
+    bases = [BaseDefinableSerializer] + BASE_CLASSES_BY_SETTINGS + list(base_classes)
+    bases_source = ", ".join(_reference(base, imports) for base in bases)
+
+    main_defn = defn_data["main"]
+    depending_defn = _sort_depending_serializers(
+        main_defn, defn_data.get("depending_serializers", list()))
+    depending_refs = dict()
+
+    def _add_method(method_str):
+        function_name = "{}make_validate_method_{}".format(
+            PRIVATE_PREFIX, len(functions))
+        functions.append(_method_source(method_str, function_name, imports))
+        return "{}()".format(function_name)
+
+    for serializer_defn in depending_defn + [main_defn]:
+        body = ""
+        field_classes = dict()
+
+        for defn in serializer_defn["fields"]:
+            field_name = defn["name"]
+            if field_name.startswith(PRIVATE_PREFIX):
+                raise ValidationError(
+                    "field names starting with '{}' are reserved: {}".format(
+                        PRIVATE_PREFIX, field_name))
+
+            field_class = meta._get_field_class(defn["field"], depending_refs)
+
+            if isinstance(field_class, _DependingRef):
+                class_source = field_class.source
+                field_class = BaseDefinableSerializer
+            else:
+                class_source = _reference(field_class, imports)
+
+            field_classes[field_name] = field_class
+
+            trans_dict = meta._get_translate_string(
+                defn, field_name, field_class, raise_exception=True)
+            field_args, field_kwargs = meta._get_field_arguments(
+                defn, field_class, trans_dict)
+
+            if "validators" in field_kwargs:
+                field_kwargs["validators"] = _validators_source(defn, imports)
+
+            arguments = [_literal(v, imports) for v in field_args]
+            arguments += [
+                "{}={}".format(k, _literal(v, imports))
+                for k, v in field_kwargs.items()
+            ]
+            body += _assign(
+                field_name,
+                "{}({})".format(class_source, ", ".join(arguments)),
+                imports
+            )
+
+            field_validate_method = defn.get(
+                "validate_method", None
+            ) or defn.get(
+                "field_validate_method", None
+            )
+            if field_validate_method:
+                body += _assign(
+                    "validate_{}".format(field_name),
+                    _add_method(field_validate_method),
+                    imports
+                )
+
+        serializer_validate_method = serializer_defn.get(
+            "serializer_validate_method", None
+        ) or serializer_defn.get(
+            "validate_method", None
+        )
+        if serializer_validate_method:
+            body += _assign(
+                "validate", _add_method(serializer_validate_method), imports)
+
+        translation_table = meta._build_translation_table(
+            serializer_defn["fields"], field_classes)
+
+        header = "    serializer_definition_data = {}\n".format(
+            _literal(serializer_defn, imports))
+        header += "    _translation_table = {}.MappingProxyType({})\n".format(
+            _import("types", imports),
+            _literal(dict(translation_table), imports))
+
+        name = serializer_defn["name"]
+        identifier = _class_identifier(name, identifiers)
+        class_source = "class {}({}):\n{}\n{}".format(
+            identifier, bases_source, header, body)
+        if identifier != name:
+            class_source += "\n\n{0}.__name__ = {0}.__qualname__ = {1!r}\n".format(
+                identifier, name)
+
+        # the fields refer to the class by a name they can't shadow
+        private_name = "{}serializer_{}".format(PRIVATE_PREFIX, len(classes))
+        class_source += "\n\n{} = {}\n".format(private_name, identifier)
+
+        classes.append(class_source)
+        depending_refs[name] = _DependingRef(private_name)
+
+    source = HEADER
+    source += "".join(
+        "import {} as {}\n".format(module_path, alias)
+        for module_path, alias in sorted(imports.items()))
+    source += "\n\n" + "\n\n".join(functions + classes)
+    source += "\n\nserializer_class = {}\n".format(identifier)
+
+    # make sure the module can be imported
+    compile(source, "<generated serializer module>", "exec")
+    return source
@@ -0,0 +1,121 @@
+from django.utils import dateparse as dj_dateparse
+
+from .caches import LRUCache
+
+import dateparser
+import datetime
+import pytz
+
+
+__all__ = (
+    "is_relative_datetime_value",
+    "parse_datetime_value",
+)
+
+
+_parsed_cache = LRUCache(maxsize=1024)
+
+
+def _localize(value, time_zone):
+    if not time_zone:
+        return value
+
+    tz = pytz.timezone(time_zone)
+    if value.tzinfo is None:
+        return tz.localize(value)
+    return value.astimezone(tz)
+
+
+def _parse_iso(value):
+    """
+    Return (datetime, absolute) of an ISO 8601 string, or (None, False).
+    A time without a date is relative to today, it is not absolute.
+    """
+    parsed = dj_dateparse.parse_datetime(value)
+    if parsed is not None:
+        return parsed, True
+
+    parsed = dj_dateparse.parse_date(value)
+    if parsed is not None:
+        return datetime.datetime.combine(parsed, datetime.time()), True
+
+    parsed = dj_dateparse.parse_time(value)
+    if parsed is not None:
+        return datetime.datetime.combine(datetime.date.today(), parsed), False
+
+    return None, False
+
+
+def is_relative_datetime_value(value, time_only=False):
+    """
+    Return True if the datetime of the value depends on when it is parsed,
+    such as "today", "2 days ago" or a time without a date. The date of an
+    ISO time doesn't matter when only the time is used (``time_only``).
+    """
+    if not isinstance(value, str) or value == "":
+        return False
+
+    if time_only and dj_dateparse.parse_time(value) is not None:
+        return False
+
+    try:
+        return not _parse_iso(value)[1]
+    except ValueError:
+        # out of range ISO strings go to dateparser too
+        return True
+
+
+def parse_datetime_value(value, use_tz=False, time_zone=None):
+    """
+    Convert an initial value of Date/Time/DateTime fields to a datetime.
+
+    Empty values, date/time objects and ISO 8601 strings are handled
+    without dateparser, which is only used for the remaining strings such
+    as "tomorrow". Only the absolute ISO dates and datetimes are memoized,
+    relative values such as "today" or "2 days ago" are parsed each time.
+    """
+    if value is None or value == "":
+        return None
+
+    time_zone = time_zone if use_tz else None
+
+    if isinstance(value, datetime.datetime):
+        return _localize(value, time_zone)
+
+    if isinstance(value, datetime.date):
+        return _localize(
+            datetime.datetime.combine(value, datetime.time()), time_zone)
+
+    if isinstance(value, datetime.time):
+        return _localize(
+            datetime.datetime.combine(datetime.date.today(), value), time_zone)
+
+    value = str(value)
+    cache_key = (value, time_zone)
+
+    parsed = _parsed_cache.get(cache_key)
+    if parsed is not None:
+        return parsed
+
+    try:
+        parsed, absolute = _parse_iso(value)
+    except ValueError:
+        # well formatted but out of range, e.g. "2000-02-30"
+        parsed, absolute = None, False
+
+    if parsed is not None:
+        parsed = _localize(parsed, time_zone)
+
+    else:
+        parser_settings = dict()
+        if time_zone:
+            parser_settings = {
+                "TIMEZONE": time_zone,
+                "RETURN_AS_TIMEZONE_AWARE": True
+            }
+        parsed = dateparser.parse(value, settings=parser_settings)
+
+    if absolute:
+        _parsed_cache.set(cache_key, parsed)
+
+    return parsed
@@ -3,6 +3,9 @@ from django.utils.translation import ugettext as _
 
 from rest_framework import serializers as rf_serializers
 from rest_framework import fields as rf_fields
+
+from ..choices import ChoiceStoreMixin
+
 from copy import copy
 import warnings
 
@@ -24,7 +27,7 @@ class CheckRequiredField(rf_fields.BooleanField):
         super().__init__(*args, **kwargs)
 
 
-class MultipleCheckboxField(rf_fields.MultipleChoiceField):
+class MultipleCheckboxField(ChoiceStoreMixin, rf_fields.MultipleChoiceField):
     """
     MultipleCheckboxField
 
@@ -73,7 +76,7 @@ class ChoiceWithBlankField(rf_fields.ChoiceField):
         return data
 
 
-class ChoiceRequiredField(rf_fields.ChoiceField):
+class ChoiceRequiredField(ChoiceStoreMixin, rf_fields.ChoiceField):
     """
     ChoiceRequiredField
 
@@ -95,7 +98,7 @@ class ChoiceRequiredField(rf_fields.ChoiceField):
         return data
 
 
-class RadioField(rf_fields.ChoiceField):
+class RadioField(ChoiceStoreMixin, rf_fields.ChoiceField):
     """
     RadioField
 
@@ -0,0 +1,104 @@
+from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from ...serializers import (
+    build_serializer_by_json_file,
+    build_serializer_by_yaml_file,
+)
+from ...streaming import validate_file
+
+import json
+import os
+
+
+class Command(BaseCommand):
+    help = (
+        "Validate the records of a NDJSON or CSV file against a definition "
+        "and print the errors as NDJSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("data_file")
+
+        source = parser.add_mutually_exclusive_group()
+        source.add_argument(
+            "--definition",
+            help="YAML or JSON definition file")
+        source.add_argument(
+            "--model",
+            help="app_label.ModelName of a model storing the definition")
+
+        parser.add_argument("--pk", help="primary key of the model instance")
+        parser.add_argument("--field", help="definition field of the model")
+        parser.add_argument(
+            "--format", choices=("ndjson", "csv"),
+            help="default: guessed from the extension of data_file")
+        parser.add_argument("--encoding", default="utf-8")
+        parser.add_argument(
+            "--max-errors", type=int, default=None,
+            help="stop after this number of invalid records")
+
+    def _get_serializer_class(self, options):
+        if options["definition"]:
+            path = options["definition"]
+            ext = os.path.splitext(path)[1].lower()
+            if ext == ".json":
+                return build_serializer_by_json_file(path)
+            return build_serializer_by_yaml_file(path)
+
+        if not options["model"]:
+            raise CommandError("--definition or --model is required")
+
+        if not (options["pk"] and options["field"]):
+            raise CommandError("--model requires --pk and --field")
+
+        try:
+            model = apps.get_model(options["model"])
+        except (LookupError, ValueError) as e:
+            raise CommandError(e)
+
+        try:
+            instance = model._default_manager.get(pk=options["pk"])
+        except model.DoesNotExist:
+            raise CommandError("{} with pk {} does not exist".format(
+                options["model"], options["pk"]))
+
+        method_name = "get_{}_serializer_class".format(options["field"])
+        try:
+            return getattr(instance, method_name)()
+        except AttributeError:
+            raise CommandError("{} is not a definition field of {}".format(
+                options["field"], options["model"]))
+
+    def handle(self, *args, **options):
+        try:
+            serializer_class = self._get_serializer_class(options)
+        except ValidationError as e:
+            raise CommandError("Invalid definition: {}".format(e))
+
+        records = invalid = 0
+        results = validate_file(
+            serializer_class,
+            options["data_file"],
+            format=options["format"],
+            encoding=options["encoding"],
+        )
+
+        for line_no, result in results:
+            records += 1
+            if not result.errors:
+                continue
+
+            invalid += 1
+            self.stdout.write(json.dumps(
+                {"line": line_no, "errors": result.errors},
+                ensure_ascii=False,
+            ))
+
+            if options["max_errors"] is not None and invalid >= options["max_errors"]:
+                break
+
+        self.stderr.write("{} records, {} invalid".format(records, invalid))
+        if invalid:
+            raise CommandError("{} invalid records".format(invalid))
@@ -20,6 +20,7 @@ class AbstractDefinitiveSerializerModel(models.Model):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._serializer_class_cache = dict()
         self.__get_class_serialier_methods()
 
     def __get_class_serialier_methods(self):
@@ -32,17 +33,42 @@ class AbstractDefinitiveSerializerModel(models.Model):
         def _func():
             field = self._meta.get_field(field_name)
             defn = getattr(self, field_name)
+
+            # the cached class is valid while the field keeps the same value
+            cached_defn, serializer_class = self._serializer_class_cache.get(
+                field_name, (None, None))
+            if serializer_class is not None and cached_defn is defn:
+                return serializer_class
+
             allow_validate_method = getattr(field, "allow_validate_method", False)
             base_classes = getattr(field, "base_classes", list())
 
-            return build_serializer(
+            serializer_class = build_serializer(
                 defn,
                 base_classes=base_classes,
                 allow_validate_method=allow_validate_method,
             )
+            self._serializer_class_cache[field_name] = (defn, serializer_class)
+            return serializer_class
 
         return _func
 
+    def refresh_serializer_cache(self, field_name=None):
+        """
+        Forget the serializer classes built for this instance.
+
+        Call it after mutating a definition in place, reassigning the field
+        is detected automatically.
+        """
+        if field_name is None:
+            self._serializer_class_cache.clear()
+        else:
+            self._serializer_class_cache.pop(field_name, None)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.refresh_serializer_cache()
+
     def __getattr__(self, name):
         result = get_serializer_regex.match(name)
         if result:
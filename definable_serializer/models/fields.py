@@ -46,12 +46,15 @@ class AbstractDefinableSerializerField:
     def clean(self, value, *args, **kwargs):
         try:
             cleaned_data = super().clean(value, *args, **kwargs)
-            build_serializer(
+            serializer_class = build_serializer(
                 cleaned_data,
                 base_classes=self.base_classes,
                 allow_validate_method=self.allow_validate_method
             )
 
+            # create all fields even if they are lazy
+            list(serializer_class().fields.values())
+
         except Exception as except_obj:
             raise ValidationError("Invalid define Format!: {}".format(except_obj))
 
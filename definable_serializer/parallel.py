@@ -0,0 +1,84 @@
+from .batch import validate_many
+from .caches import make_defn_hash
+from .serializers import _build_serializer
+
+from collections import OrderedDict, namedtuple
+import itertools
+
+
+__all__ = (
+    "ParallelResult",
+    "validate_parallel",
+)
+
+
+ParallelResult = namedtuple("ParallelResult", ("results", "errors"))
+
+
+def _chunks(payloads, chunksize):
+    iterator = iter(payloads)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _validate_chunk(defn_data, defn_hash, base_classes, allow_validate_method,
+                    partial, chunk):
+    # the build cache of the worker process makes this a dict lookup after
+    # the first chunk
+    serializer_class = _build_serializer(
+        defn_data,
+        base_classes,
+        allow_validate_method,
+        defn_hash=defn_hash,
+    )
+    return validate_many(serializer_class, chunk, partial=partial)
+
+
+def validate_parallel(defn_data, payloads,
+                      executor=None,
+                      chunksize=500,
+                      base_classes=list(),
+                      allow_validate_method=True,
+                      partial=False):
+    """
+    Validate payloads against a definition on a concurrent.futures
+    executor, typically a ``ProcessPoolExecutor``.
+
+    The definition data, not the built class, is sent to the workers with
+    each chunk of ``chunksize`` payloads; a worker builds the class once
+    and keeps it in its build cache. Returns ``ParallelResult(results,
+    errors)``: a ``ValidationResult`` per payload in input order, and an
+    ``OrderedDict`` of the errors by payload index.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be greater than 0")
+
+    defn_hash = make_defn_hash(defn_data)
+    base_classes = tuple(base_classes)
+
+    # raise the errors of the definition here rather than in every worker
+    _build_serializer(
+        defn_data, base_classes, allow_validate_method, defn_hash=defn_hash)
+
+    chunks = _chunks(payloads, chunksize)
+    args = (defn_data, defn_hash, base_classes, allow_validate_method, partial)
+
+    if executor is None:
+        chunk_results = (_validate_chunk(*args, chunk) for chunk in chunks)
+    else:
+        chunk_results = executor.map(
+            _validate_chunk, *[itertools.repeat(arg) for arg in args], chunks)
+
+    results = list()
+    errors = OrderedDict()
+
+    for chunk_result in chunk_results:
+        for result in chunk_result:
+            if result.errors:
+                errors[len(results)] = result.errors
+            results.append(result)
+
+    return ParallelResult(results, errors)
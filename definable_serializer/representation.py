@@ -0,0 +1,147 @@
+from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+
+from rest_framework import serializers as rf_serializers
+from rest_framework.fields import (
+    CharField, ChoiceField, Field, FloatField, IntegerField, ReadOnlyField,
+    SkipField, is_simple_callable)
+from rest_framework.relations import PKOnlyObject
+
+from .validation import _overrides
+
+from collections import OrderedDict
+from collections.abc import Mapping
+
+
+__all__ = (
+    "compile_representation",
+)
+
+
+_MISSING = object()
+
+
+def _identity(value):
+    return value
+
+
+def _choice_converter(field):
+    choice_strings_to_values = field.choice_strings_to_values
+
+    def to_representation(value):
+        if value in ('', None):
+            return value
+        return choice_strings_to_values.get(str(value), value)
+
+    return to_representation
+
+
+# converters equivalent to the to_representation of the stock fields
+_CONVERTERS = {
+    CharField.to_representation: lambda field: str,
+    IntegerField.to_representation: lambda field: int,
+    FloatField.to_representation: lambda field: float,
+    ReadOnlyField.to_representation: lambda field: _identity,
+    ChoiceField.to_representation: _choice_converter,
+}
+
+
+def _compile_field(field):
+    """
+    Return a function equivalent to ``field.to_representation``.
+    """
+    if isinstance(field, rf_serializers.ListSerializer):
+        return _compile_list_serializer(field)
+
+    if isinstance(field, rf_serializers.Serializer):
+        return _compile_serializer(field)
+
+    converter = _CONVERTERS.get(type(field).to_representation, None)
+    if converter is None:
+        return field.to_representation
+    return converter(field)
+
+
+def _compile_serializer(serializer):
+    if _overrides(serializer, rf_serializers.Serializer, "to_representation"):
+        return serializer.to_representation
+
+    entries = list()
+    for field in serializer._readable_fields:
+        source_attr = None
+        if (not _overrides(field, Field, "get_attribute") and
+                len(field.source_attrs) == 1):
+            source_attr = field.source_attrs[0]
+
+        entries.append((
+            field.field_name,
+            source_attr,
+            field.get_attribute,
+            _compile_field(field),
+        ))
+
+    def to_representation(instance):
+        ret = OrderedDict()
+        is_mapping = isinstance(instance, Mapping)
+
+        for field_name, source_attr, get_attribute, convert in entries:
+            attribute = _MISSING
+
+            if source_attr is not None:
+                try:
+                    if is_mapping:
+                        attribute = instance[source_attr]
+                    else:
+                        attribute = getattr(instance, source_attr)
+                except (KeyError, AttributeError, ObjectDoesNotExist):
+                    attribute = _MISSING
+                else:
+                    if callable(attribute) and is_simple_callable(attribute):
+                        attribute = _MISSING
+
+            if attribute is _MISSING:
+                # defaults, callables and missing values are left to the field
+                try:
+                    attribute = get_attribute(instance)
+                except SkipField:
+                    continue
+
+                if isinstance(attribute, PKOnlyObject) and attribute.pk is None:
+                    ret[field_name] = None
+                    continue
+
+            if attribute is None:
+                ret[field_name] = None
+            else:
+                ret[field_name] = convert(attribute)
+
+        return ret
+
+    return to_representation
+
+
+def _compile_list_serializer(list_serializer):
+    if _overrides(list_serializer, rf_serializers.ListSerializer,
+                  "to_representation"):
+        return list_serializer.to_representation
+
+    child_to_representation = _compile_field(list_serializer.child)
+
+    def to_representation(data):
+        iterable = data.all() if isinstance(data, models.Manager) else data
+        return [child_to_representation(item) for item in iterable]
+
+    return to_representation
+
+
+def compile_representation(serializer_class, context=None):
+    """
+    Return a function which renders a list of instances the same way as
+    ``serializer_class(instances, many=True).data``.
+
+    The attribute getters and the converters of the fields are resolved
+    once, so each row only costs a dict or attribute lookup and a
+    conversion per field. The result is a plain list of ``OrderedDict``.
+    """
+    prototype = serializer_class(many=True, context=context or {})
+    return _compile_field(prototype)
@@ -0,0 +1,190 @@
+from django.conf import settings as dj_settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from rest_framework.fields import Field
+
+from .caches import LRUCache
+
+import importlib
+import inspect
+import pydoc
+import threading
+
+
+__all__ = (
+    "ClassResolver",
+    "get_resolver",
+    "reset_resolver",
+)
+
+
+SHORT_NAME_MODULE = "rest_framework.serializers"
+
+DEFAULT_MODULES = (
+    SHORT_NAME_MODULE,
+    "definable_serializer.extra_fields",
+)
+
+
+def _defined_in(obj, module_path):
+    if getattr(obj, "__module__", None) == module_path:
+        return True
+
+    # restframework serializers re-export the field classes
+    return module_path == SHORT_NAME_MODULE and inspect.isclass(obj) and \
+        issubclass(obj, Field)
+
+
+class ClassResolver:
+    """
+    Resolve field and validator classes from definition strings.
+
+    Classes of the indexed modules are looked up by a dict hit. Any other
+    dotted path is imported once and memoized, unless ``strict`` is set, in
+    which case only indexed modules and ``allowed_paths`` can be resolved.
+    """
+
+    def __init__(self, modules=(), allowed_paths=(), strict=False,
+                 memo_size=1024):
+        self.strict = strict
+        self._short_names = dict()
+        self._paths = dict()
+        self._memo = LRUCache(maxsize=memo_size)
+
+        for module_path in tuple(DEFAULT_MODULES) + tuple(modules):
+            self.index_module(module_path)
+
+        for path in allowed_paths:
+            obj = pydoc.locate(path)
+            if obj is None:
+                raise ImportError("cannot import name '{}'".format(path))
+            self._paths[path] = obj
+
+    def index_module(self, module_path):
+        """
+        Index the classes and functions of the module's ``__all__``, or
+        the ones defined in the module. The names a module only imports
+        are not allowed in strict mode.
+        """
+        module = importlib.import_module(module_path)
+        public_names = getattr(module, "__all__", None)
+
+        for name, obj in vars(module).items():
+            if name.startswith("_"):
+                continue
+
+            if not (inspect.isclass(obj) or inspect.isfunction(obj)):
+                continue
+
+            if public_names is not None:
+                if name not in public_names:
+                    continue
+            elif not _defined_in(obj, module_path):
+                continue
+
+            self._paths["{}.{}".format(module_path, name)] = obj
+            if module_path == SHORT_NAME_MODULE and inspect.isclass(obj):
+                self._short_names[name] = obj
+
+    def get_field_class(self, name):
+        """
+        Return a django-restframework class by its short name ("CharField").
+        """
+        return self._short_names.get(name, None)
+
+    def locate(self, path):
+        """
+        Return the object for a dotted path or None.
+        """
+        try:
+            return self._paths[path]
+        except KeyError:
+            pass
+
+        if self.strict:
+            return None
+
+        obj = self._memo.get(path, self)
+        if obj is self:
+            obj = pydoc.locate(path)
+            self._memo.set(path, obj)
+
+        return obj
+
+    def resolved_paths(self, paths):
+        """
+        Return ``{path: (module, qualname)}`` of the paths resolved outside
+        of the indexed modules, for ``preload`` in another process.
+        """
+        resolved = dict()
+
+        for path in paths:
+            if path in self._paths:
+                continue
+
+            obj = self.locate(path)
+            module_path = getattr(obj, "__module__", None)
+            qualname = getattr(obj, "__qualname__", None)
+            if module_path and qualname:
+                resolved[path] = (module_path, qualname)
+
+        return resolved
+
+    def preload(self, resolved):
+        """
+        Memoize the paths of ``resolved_paths`` by importing their modules
+        directly instead of trying every prefix of the paths.
+        """
+        if self.strict:
+            return
+
+        for path, (module_path, qualname) in resolved.items():
+            if path in self._paths or path in self._memo:
+                continue
+
+            try:
+                obj = importlib.import_module(module_path)
+                for name in qualname.split("."):
+                    obj = getattr(obj, name)
+            except (ImportError, AttributeError):
+                continue
+
+            self._memo.set(path, obj)
+
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def get_resolver():
+    global _resolver
+
+    resolver = _resolver
+    if resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                defn_settings = getattr(
+                    dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {})
+                _resolver = ClassResolver(
+                    modules=defn_settings.get("RESOLVER_MODULES", []),
+                    allowed_paths=defn_settings.get(
+                        "RESOLVER_ALLOWED_PATHS", []),
+                    strict=defn_settings.get("RESOLVER_STRICT", False),
+                )
+            resolver = _resolver
+
+    return resolver
+
+
+def reset_resolver():
+    global _resolver
+
+    with _resolver_lock:
+        _resolver = None
+
+
+@receiver(setting_changed)
+def _reset_resolver_on_setting_changed(setting, **kwargs):
+    if setting == "DEFINABLE_SERIALIZER_SETTINGS":
+        reset_resolver()
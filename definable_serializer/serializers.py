@@ -1,18 +1,43 @@
 from django.conf import settings as dj_settings
+from django.core.cache import caches
 from django.utils.translation import ugettext as _
 from django.core.exceptions import ValidationError
 from django.utils.translation import get_language
+from django.utils.functional import cached_property
 
 from rest_framework import serializers as rf_serializers
 
-import dateparser
+from .caches import (
+    ArtifactCache,
+    ClassRegistry,
+    CodeCache,
+    DirectoryStore,
+    SingleFlight,
+    make_defn_hash,
+)
+from .choices import ChoiceIndex, ChoiceStoreMixin, get_choice_store
+from .dateparse import is_relative_datetime_value, parse_datetime_value
+from .resolvers import get_resolver
+from .validation import Validator
+
 import simplejson
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping, MutableMapping
+
+import asyncio
 import codecs
+import concurrent.futures
+import functools
+import inspect
+import itertools
 import pprint
 import pydoc
+import sys
 import types
 import yaml
+import threading
 import warnings
+import weakref
 import copy
 
 NOT_AVAILABLE_FIELDS = (
@@ -22,11 +47,16 @@ NOT_AVAILABLE_FIELDS = (
 )
 
 __all__ = (
+    "BuildResult",
+    "abuild_serializer",
+    "abuild_serializer_by_json",
+    "abuild_serializer_by_yaml",
     "build_serializer",
     "build_serializer_by_json",
     "build_serializer_by_json_file",
     "build_serializer_by_yaml",
     "build_serializer_by_yaml_file",
+    "build_serializers_many",
 )
 
 STR_TO_DATETIME_MAP = {
@@ -44,6 +74,229 @@ for c in getattr(dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {}).get("BASE_CLA
     BASE_CLASSES_BY_SETTINGS.append(kls)
 
 
+# None means unbounded, 0 disables the cache
+BUILD_CACHE_SIZE = getattr(
+    dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {}
+).get("BUILD_CACHE_SIZE", 128)
+
+# None means no memory budget
+BUILD_CACHE_MAX_BYTES = getattr(
+    dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {}
+).get("BUILD_CACHE_MAX_BYTES", None)
+
+
+def _deep_sizeof(value):
+    size = sys.getsizeof(value)
+
+    # the read-only choices of a ChoiceStore are shared, not kept by a class
+    if isinstance(value, types.MappingProxyType):
+        return size
+
+    if isinstance(value, Mapping):
+        for k, v in value.items():
+            size += _deep_sizeof(k) + _deep_sizeof(v)
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for v in value:
+            size += _deep_sizeof(v)
+
+    return size
+
+
+def _approximate_size(serializer_class):
+    """
+    Rough number of bytes kept by a built class: the class, its definition
+    data and its declared fields. Depending serializers are counted by
+    every class using them.
+    """
+    size = sys.getsizeof(serializer_class)
+    size += sum(sys.getsizeof(v) for v in vars(serializer_class).values())
+    size += _deep_sizeof(
+        getattr(serializer_class, "serializer_definition_data", None))
+
+    declared_fields = getattr(serializer_class, "_declared_fields", {})
+    if isinstance(declared_fields, LazyDeclaredFields):
+        # measuring must not create the lazy fields
+        declared_fields = {
+            name: field for name, field in declared_fields._fields.items()
+            if field is not None
+        }
+
+    for field in declared_fields.values():
+        size += sys.getsizeof(field) + _deep_sizeof(vars(field))
+        if isinstance(field, rf_serializers.BaseSerializer):
+            size += _approximate_size(type(field))
+
+    return size
+
+
+_build_cache = ClassRegistry(
+    maxsize=BUILD_CACHE_SIZE,
+    maxbytes=BUILD_CACHE_MAX_BYTES,
+    sizeof=_approximate_size,
+)
+
+# builds running in the threads, by cache key of the build cache
+_build_flight = SingleFlight()
+
+# depending serializers shared between definitions, they are dropped when
+# no built main serializer uses them any more
+_depending_registry = weakref.WeakValueDictionary()
+
+_code_cache = CodeCache(
+    maxsize=getattr(
+        dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {}
+    ).get("CODE_CACHE_SIZE", 256),
+    directory=getattr(
+        dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {}
+    ).get("CODE_CACHE_DIR", None),
+)
+
+
+def _get_artifact_caches():
+    """
+    Return the artifact caches to look up in order: the directory of
+    ``ARTIFACT_DIR``, then the django cache named by ``ARTIFACT_CACHE``.
+    """
+    defn_settings = getattr(dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {})
+    artifact_caches = list()
+
+    directory = defn_settings.get("ARTIFACT_DIR", None)
+    if directory:
+        store = DirectoryStore(
+            directory,
+            timeout=defn_settings.get("ARTIFACT_DIR_TIMEOUT", None),
+            max_entries=defn_settings.get("ARTIFACT_DIR_MAX_ENTRIES", 1024),
+        )
+        artifact_caches.append(ArtifactCache(
+            store, _code_cache, resolver=get_resolver()))
+
+    alias = defn_settings.get("ARTIFACT_CACHE", None)
+    if alias:
+        kwargs = dict()
+        if "ARTIFACT_CACHE_TIMEOUT" in defn_settings:
+            kwargs["timeout"] = defn_settings["ARTIFACT_CACHE_TIMEOUT"]
+
+        artifact_caches.append(ArtifactCache(
+            caches[alias], _code_cache, resolver=get_resolver(), **kwargs))
+
+    return artifact_caches
+
+
+def _parse_definition(source, format):
+    """
+    Return ``(defn_data, defn_hash)`` of a JSON or YAML source. Sources
+    found in the artifact caches are not parsed again.
+    """
+    artifact_caches = _get_artifact_caches()
+
+    for artifact_cache in artifact_caches:
+        loaded = artifact_cache.load_source(source, format)
+        if loaded is not None:
+            return loaded
+
+    if format == "json":
+        defn_data = simplejson.loads(source)
+    else:
+        defn_data = yaml.load(source, Loader=yaml.SafeLoader)
+
+    if not artifact_caches:
+        return defn_data, None
+
+    defn_hash = make_defn_hash(defn_data)
+    for artifact_cache in artifact_caches:
+        artifact_cache.store_source(source, format, defn_data, defn_hash)
+
+    return defn_data, defn_hash
+
+
+# executor of the async API, created on first use
+_async_executor = None
+_async_executor_lock = threading.Lock()
+
+# concurrent futures of the builds running for abuild_serializer
+_inflight_builds = dict()
+_inflight_builds_lock = threading.Lock()
+
+# event loop of the ais_valid call running in the current thread
+_async_context = threading.local()
+
+
+def _get_async_executor():
+    global _async_executor
+
+    with _async_executor_lock:
+        if _async_executor is None:
+            _async_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=getattr(
+                    dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {}
+                ).get("ASYNC_MAX_WORKERS", None),
+                thread_name_prefix="definable_serializer",
+            )
+        return _async_executor
+
+
+# asyncio.run and asyncio.get_running_loop are new in python 3.7
+def _asyncio_run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+
+def _run_coroutine(coro):
+    loop = getattr(_async_context, "loop", None)
+    if loop is not None:
+        # called by ais_valid in a worker thread, the loop is free
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+    if asyncio._get_running_loop() is None:
+        return _asyncio_run(coro)
+
+    coro.close()
+    raise RuntimeError(
+        "async validators can't run in is_valid() called from an event "
+        "loop, use ais_valid() instead")
+
+
+def _is_coroutine_callable(obj):
+    return inspect.iscoroutinefunction(obj) or inspect.iscoroutinefunction(
+        getattr(obj, "__call__", None))
+
+
+class AsyncValidator:
+    """
+    Call an async validator from the synchronous DRF validation.
+    """
+
+    def __init__(self, validator):
+        self.validator = validator
+
+    def __call__(self, value):
+        return _run_coroutine(self.validator(value))
+
+    def __repr__(self):
+        return repr(self.validator)
+
+
+def _bridge_async(obj):
+    """
+    Return a sync version of an async validator or validate method, and
+    anything else as is.
+    """
+    if not _is_coroutine_callable(obj):
+        return obj
+
+    if isinstance(obj, types.FunctionType):
+        @functools.wraps(obj)
+        def validate_method(self, value):
+            return _run_coroutine(obj(self, value))
+        return validate_method
+
+    return AsyncValidator(obj)
+
+
 class TranslationMixin:
 
     @classmethod
@@ -93,7 +346,13 @@ class TranslationMixin:
             not issubclass(field_class, rf_serializers.FilePathField),
             issubclass(field_class, rf_serializers.ChoiceField),
         ])
-        if can_trans_choices:
+        store_name = field_defn.get("choice_store", None)
+        if store_name is not None:
+            # shared by the fields, not copied
+            result[target] = get_choice_store(
+                store_name).language_choices(language)
+
+        elif can_trans_choices:
             new_choice_list = list()
             for i, choice in enumerate(field_args[0]):
                 choice_value, choice_label = choice[0], choice[1]
@@ -106,6 +365,198 @@ class TranslationMixin:
 
         return result
 
+    @classmethod
+    def _get_languages(metacls, fields_defn):
+        languages = set()
+
+        def _add(v):
+            if isinstance(v, dict):
+                languages.update(v.keys())
+
+        for field_defn in fields_defn:
+            field_kwargs = field_defn.get("field_kwargs", {})
+            for target in ("label", "help_text", "initial"):
+                _add(field_kwargs.get(target, None))
+            _add(field_kwargs.get("style", {}).get("placeholder", None))
+
+            field_args = field_defn.get("field_args", [])
+            if len(field_args) and isinstance(field_args[0], (list, tuple)):
+                for choice in field_args[0]:
+                    if isinstance(choice, (list, tuple)) and len(choice) > 1:
+                        _add(choice[1])
+
+            if field_defn.get("choice_store", None) is not None:
+                languages.update(
+                    get_choice_store(field_defn["choice_store"]).languages)
+
+        languages.add("default")
+        return languages
+
+    @classmethod
+    def _build_translation_table(metacls, fields_defn, field_classes):
+        """
+        Return {language: ((field_name, target, value), ...)} with the
+        translated texts to apply on instantiation. The fallback to
+        'default' is already resolved and languages which don't appear in
+        the definition use the 'default' entry.
+        """
+        table = dict()
+
+        for language in metacls._get_languages(fields_defn):
+            patches = list()
+
+            for field_defn in fields_defn:
+                field_name = field_defn["name"]
+                field_class = field_classes[field_name]
+
+                trans_dict = metacls._get_translate_string(
+                    field_defn, field_name, field_class, language=language)
+
+                for target in ("label", "help_text", "initial",
+                               "placeholder", "choices"):
+                    trans_text = trans_dict.get(target, None)
+                    if not trans_text:
+                        continue
+
+                    if target == "initial" and not issubclass(
+                            field_class, rf_serializers.CharField):
+                        continue
+
+                    if target == "choices" and not isinstance(
+                            trans_text, ChoiceIndex):
+                        trans_text = tuple(tuple(c) for c in trans_text)
+
+                    patches.append((field_name, target, trans_text))
+
+            table[language] = tuple(patches)
+
+        return types.MappingProxyType(table)
+
+
+class LazyDeclaredFields(MutableMapping):
+    """
+    _declared_fields whose fields are created on first access.
+
+    ``factories`` maps field names to callables returning the field.
+    """
+
+    def __init__(self, fields, factories):
+        self._fields = OrderedDict(
+            (name, field) for name, field in fields.items()
+            if name not in factories
+        )
+        self._factories = dict()
+        self._lock = threading.Lock()
+
+        for name, factory in factories.items():
+            self._fields[name] = None
+            self._factories[name] = factory
+
+    def __getitem__(self, key):
+        field = self._fields[key]
+
+        if field is None and key in self._factories:
+            with self._lock:
+                field = self._fields[key]
+                if field is None:
+                    # keep the factory when the field can't be created, the
+                    # next access raises the same error
+                    field = self._factories[key]()
+                    self._fields[key] = field
+                    del self._factories[key]
+
+        return field
+
+    def __setitem__(self, key, value):
+        self._factories.pop(key, None)
+        self._fields[key] = value
+
+    def __delitem__(self, key):
+        self._factories.pop(key, None)
+        del self._fields[key]
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __deepcopy__(self, memo):
+        return OrderedDict(
+            (name, copy.deepcopy(field, memo)) for name, field in self.items()
+        )
+
+    def copy(self):
+        return OrderedDict(self.items())
+
+    @property
+    def materialized(self):
+        return [name for name in self._fields if name not in self._factories]
+
+
+class LazyBindingDict(rf_serializers.BindingDict):
+    """
+    ``fields`` of a serializer instance with lazy fields: a declared field
+    is copied, bound and translated on first access.
+    """
+
+    def __init__(self, serializer, copy_field):
+        super().__init__(serializer)
+        self._names = list(serializer._declared_fields)
+        self._copy_field = copy_field
+        self._pending = dict()
+
+    def apply(self, key, func):
+        """
+        Call ``func(field)`` now, or when the field is created.
+        """
+        if key in self.fields:
+            func(self.fields[key])
+        else:
+            self._pending.setdefault(key, list()).append(func)
+
+    def __getitem__(self, key):
+        field = self.fields.get(key, None)
+        if field is not None:
+            return field
+
+        if key not in self._names:
+            raise KeyError(key)
+
+        field = self._copy_field(self.serializer._declared_fields[key])
+        super().__setitem__(key, field)
+        for func in self._pending.pop(key, list()):
+            func(field)
+
+        return field
+
+    def __setitem__(self, key, field):
+        self._pending.pop(key, None)
+        super().__setitem__(key, field)
+        if key not in self._names:
+            self._names.append(key)
+
+    def __delitem__(self, key):
+        if key not in self._names:
+            raise KeyError(key)
+
+        self._names.remove(key)
+        self._pending.pop(key, None)
+        self.fields.pop(key, None)
+
+    def __iter__(self):
+        return iter(list(self._names))
+
+    def __len__(self):
+        return len(self._names)
+
+    def __repr__(self):
+        return dict.__repr__(OrderedDict(self.items()))
+
+    @property
+    def materialized(self):
+        return [name for name in self._names if name in self.fields]
+
 
 class DefinableSerializerMeta(rf_serializers.SerializerMetaclass,
                               TranslationMixin):
@@ -115,7 +566,7 @@ class DefinableSerializerMeta(rf_serializers.SerializerMetaclass,
         global_var, local_var = dict(), dict()
 
         try:
-            exec(method_str, global_var, local_var)
+            exec(_code_cache.compile(method_str), global_var, local_var)
             validate_method = local_var["validate_method"]
 
         except Exception as e:
@@ -124,13 +575,15 @@ class DefinableSerializerMeta(rf_serializers.SerializerMetaclass,
         if not isinstance(validate_method, types.FunctionType):
             raise ValidationError("Not a function")
 
-        return validate_method
+        return _bridge_async(validate_method)
 
     @classmethod
     def _get_field_class(metacls, field_class_str, serializer_classes):
 
+        resolver = get_resolver()
+
         # get from Django Restframework serializers
-        field_class = getattr(rf_serializers, field_class_str, None)
+        field_class = resolver.get_field_class(field_class_str)
 
         # get from builded depending serializers
         if not field_class:
@@ -138,67 +591,112 @@ class DefinableSerializerMeta(rf_serializers.SerializerMetaclass,
 
         # You can get "<< package>>.<< module >>.<< class >>" string
         if not field_class:
-            field_class = pydoc.locate(field_class_str)
+            field_class = resolver.locate(field_class_str)
 
         return field_class
 
     @classmethod
-    def _build_fields(metacls, fields_defn, serializer_classes,
-                      allow_validate_method):
+    def _build_validators(metacls, defn):
+        field_name = defn["name"]
+        validators = list()
+        resolver = get_resolver()
 
-        fields = dict()
-        validate_methods = dict()
+        for validator_defn in defn.get("validators", list()):
+            validator_class_path = validator_defn["validator"]
+            validator_class = resolver.locate(validator_class_path)
 
-        def _build_validators(defn):
-            field_name = defn["name"]
-            validators = list()
+            if not validator_class:
+                raise ValidationError({
+                    field_name: "cannot import name '{}'".format(
+                        validator_class_path
+                    )
+                })
 
-            for validator_defn in defn.get("validators", list()):
-                validator_class_path = validator_defn["validator"]
-                validator_class = pydoc.locate(validator_class_path)
+            try:
+                validators.append(_bridge_async(
+                    validator_class(
+                        *validator_defn.get("args", list()),
+                        **validator_defn.get("kwargs", dict())
+                    )
+                ))
+            except Exception as e:
+                raise ValidationError({field_name: e})
 
-                if not validator_class:
-                    raise ValidationError({
-                        field_name: "cannot import name '{}'".format(
-                            validator_class_path
-                        )
-                    })
+        return validators
 
-                try:
-                    validators.append(
-                        validator_class(
-                            *validator_defn.get("args", list()),
-                            **validator_defn.get("kwargs", dict())
-                        )
-                    )
-                except Exception as e:
-                    raise ValidationError({field_name: e})
+    @classmethod
+    def _convert_str_to_datetime(metacls, field_name, datetime_str):
+        try:
+            return parse_datetime_value(
+                datetime_str,
+                use_tz=getattr(dj_settings, "USE_TZ", None),
+                time_zone=getattr(dj_settings, "TIME_ZONE", None),
+            )
 
-            return validators
+        except Exception as e:
+            msg = "Can't parser date or time format: {}"
+            raise ValidationError({field_name: msg.format(e)})
+
+    @classmethod
+    def _get_field_arguments(metacls, defn, field_class, trans_dict):
+        """
+        Return the args and kwargs to create the field of the definition.
+        """
+        field_name = defn["name"]
+
+        field_args = copy.deepcopy(defn.get("field_args", list()))
+        field_kwargs = copy.deepcopy(defn.get("field_kwargs", dict()))
+
+        for target in ("label", "help_text",):
+            trans_text = trans_dict.get(target, None)
+            if trans_text:
+                field_kwargs[target] = trans_text
+
+        trans_text = trans_dict.get("placeholder", None)
+        if trans_text:
+            field_kwargs["style"]["placeholder"] = trans_text
+
+        trans_choices = trans_dict.get("choices", None)
+        if isinstance(trans_choices, ChoiceIndex):
+            field_args.insert(0, trans_choices)
+        elif trans_choices:
+            field_args[0] = trans_choices
+
+        validators = metacls._build_validators(defn)
+        if validators:
+            field_kwargs["validators"] = validators
+
+        # convert str to object when Dates Field
+        if issubclass(field_class, tuple(STR_TO_DATETIME_MAP.keys())):
+            field_kwargs["initial"] = STR_TO_DATETIME_MAP[field_class](
+                metacls._convert_str_to_datetime(
+                    field_name, field_kwargs.get("initial", "")))
+
+        return field_args, field_kwargs
+
+    @classmethod
+    def _build_fields(metacls, fields_defn, serializer_classes,
+                      allow_validate_method, lazy_fields=False):
+
+        fields = OrderedDict()
+        field_classes = dict()
+        validate_methods = dict()
+
+        def _create_field(defn, field_class, trans_dict):
+            field_args, field_kwargs = metacls._get_field_arguments(
+                defn, field_class, trans_dict)
 
-        def _convert_str_to_datetime(field_name, datetime_str):
-            datetime_str = str(datetime_str)
+            # create field class
             try:
-                parser_settings = dict()
-                if getattr(dj_settings, "USE_TZ", None):
-                    parser_settings = {
-                        "TIMEZONE": getattr(dj_settings, "TIME_ZONE", None),
-                        "RETURN_AS_TIMEZONE_AWARE": True
-                    }
-                return dateparser.parse(
-                    datetime_str, settings=parser_settings)
+                return field_class(*field_args, **field_kwargs)
 
             except Exception as e:
-                msg = "Can't parser date or time format: {}"
-                raise ValidationError({field_name: msg.format(e)})
+                raise ValidationError({defn["name"]: e})
 
         for defn in fields_defn:
             field_class_str = defn["field"]
             field_name = defn["name"]
 
-            field_args = copy.deepcopy(defn.get("field_args", list()))
-            field_kwargs = copy.deepcopy(defn.get("field_kwargs", dict()))
-
             field_class = metacls._get_field_class(
                 field_class_str, serializer_classes)
 
@@ -210,39 +708,31 @@ class DefinableSerializerMeta(rf_serializers.SerializerMetaclass,
                 e_str = "Can't find '{}' field class".format(field_class_str)
                 raise ValidationError({field_name: e_str})
 
-            # set trans result(label, help_text, placeholder, choices)
-            trans_dict = metacls._get_translate_string(
-                defn, field_name, field_class, raise_exception=True)
+            field_classes[field_name] = field_class
 
-            for target in ("label", "help_text",):
-                trans_text = trans_dict.get(target, None)
-                if trans_text:
-                    field_kwargs[target] = trans_text
-
-            trans_text = trans_dict.get("placeholder", None)
-            if trans_text:
-                field_kwargs["style"]["placeholder"] = trans_text
-
-            trans_choices = trans_dict.get("choices", None)
-            if trans_choices:
-                field_args[0] = trans_choices
-
-            validators = _build_validators(defn)
-            if validators:
-                field_kwargs["validators"] = validators
+            store_name = defn.get("choice_store", None)
+            if store_name is not None:
+                if not issubclass(field_class, ChoiceStoreMixin):
+                    e_str = "'{}' field can't use choice_store.".format(
+                        field_class_str)
+                    raise ValidationError({field_name: e_str})
 
-            # convert str to object when Dates Field
-            if issubclass(field_class, tuple(STR_TO_DATETIME_MAP.keys())):
-                field_kwargs["initial"] = STR_TO_DATETIME_MAP[field_class](
-                    _convert_str_to_datetime(
-                        field_name, field_kwargs.get("initial", "")))
+                try:
+                    get_choice_store(store_name)
+                except (LookupError, ImportError, ValueError) as e:
+                    raise ValidationError({field_name: str(e)})
 
-            # create field class
-            try:
-                fields[field_name] = field_class(*field_args, **field_kwargs)
+            # set trans result(label, help_text, placeholder, choices)
+            trans_dict = metacls._get_translate_string(
+                defn, field_name, field_class, raise_exception=True)
 
-            except Exception as e:
-                raise ValidationError({field_name: e})
+            # lazy fields are created on first access of _declared_fields
+            if lazy_fields:
+                fields[field_name] = functools.partial(
+                    _create_field, defn, field_class, trans_dict)
+            else:
+                fields[field_name] = _create_field(
+                    defn, field_class, trans_dict)
 
             # Field validate method
             if defn.get("validate_method", None):
@@ -280,7 +770,7 @@ class DefinableSerializerMeta(rf_serializers.SerializerMetaclass,
                         field_name, e)
                     raise ValidationError({field_name: e_str})
 
-        return fields, validate_methods
+        return fields, field_classes, validate_methods
 
     @classmethod
     def __prepare__(metacls, name, bases, **kwargs):
@@ -293,13 +783,22 @@ class DefinableSerializerMeta(rf_serializers.SerializerMetaclass,
         fields_defn = serializer_defn["fields"]
         serializer_classes = kwargs.pop("serializer_classes")
         allow_validate_method = kwargs.pop("allow_validate_method", True)
+        lazy_fields = kwargs.pop("lazy_fields", False)
+        flyweight_fields = kwargs.pop("flyweight_fields", False)
 
         # build fields
-        fields, field_validate_methods = metacls._build_fields(
-            fields_defn, serializer_classes, allow_validate_method)
+        fields, field_classes, field_validate_methods = metacls._build_fields(
+            fields_defn, serializer_classes, allow_validate_method,
+            lazy_fields=lazy_fields)
 
         # set fields
-        namespace.update(fields)
+        if not lazy_fields:
+            namespace.update(fields)
+
+        if flyweight_fields:
+            namespace["flyweight_fields"] = True
+            # translated choices by (language, field name)
+            namespace["_shared_choices"] = dict()
 
         # field validate methods
         for field_name, validate_method in field_validate_methods.items():
@@ -342,7 +841,24 @@ class DefinableSerializerMeta(rf_serializers.SerializerMetaclass,
         kls = super().__new__(
             metacls, serializer_name, bases, namespace, *kwargs)
 
+        if lazy_fields:
+            setattr(kls, "_declared_fields", LazyDeclaredFields(
+                kls._declared_fields, fields))
+
+        # initial values such as "today" are parsed by each build, the
+        # class can't be cached
+        setattr(kls, "_relative_initial", any(
+            issubclass(field_classes[defn["name"]],
+                       tuple(STR_TO_DATETIME_MAP.keys())) and
+            is_relative_datetime_value(
+                defn.get("field_kwargs", {}).get("initial", None),
+                time_only=issubclass(
+                    field_classes[defn["name"]], rf_serializers.TimeField))
+            for defn in fields_defn
+        ))
         setattr(kls, "serializer_definition_data", serializer_defn)
+        setattr(kls, "_translation_table", metacls._build_translation_table(
+            fields_defn, field_classes))
         return kls
 
     def __init__(cls, name, bases, namespace, **kwargs):
@@ -381,56 +897,203 @@ def _defn_pre_checker(defn_data):
             _serializer_checker(defn)
 
 
+def _get_depending_references(defn, depending_names):
+    """
+    Return the names of the depending serializers used by the definition.
+    """
+    resolver = get_resolver()
+    references = list()
+
+    for field_defn in defn["fields"]:
+        name = field_defn["field"]
+        # restframework fields win over depending serializers
+        if name in depending_names and not resolver.get_field_class(name):
+            if name not in references:
+                references.append(name)
+
+    return references
+
+
+def _sort_depending_serializers(main_defn, depending_defn):
+    """
+    Return the depending serializer definitions used by the main serializer,
+    ordered so that every serializer comes after the ones it refers to.
+    """
+    defn_by_name = OrderedDict((defn["name"], defn) for defn in depending_defn)
+
+    def _references(defn):
+        return _get_depending_references(defn, defn_by_name)
+
+    ordered = list()
+    done = set()
+    path = list()
+
+    def _visit(name):
+        if name in done:
+            return
+
+        if name in path:
+            cycle = path[path.index(name):] + [name]
+            raise ValidationError(
+                "Circular reference in depending_serializers: {}".format(
+                    " -> ".join(cycle)))
+
+        path.append(name)
+        for reference in _references(defn_by_name[name]):
+            _visit(reference)
+        path.pop()
+
+        done.add(name)
+        ordered.append(defn_by_name[name])
+
+    for name in _references(main_defn):
+        _visit(name)
+
+    return ordered
+
+
+# attributes set by ChoiceField._set_choices
+_CHOICE_ATTRIBUTES = ("grouped_choices", "_choices", "choice_strings_to_values")
+
+
+def _flyweight_copy(field):
+    """
+    Shallow copy of a declared field: the copy shares the immutable state
+    of the field (choices, validators, error messages and style) and
+    ``bind`` only sets attributes of the copy.
+    """
+    # nested serializers and container fields bind their children to
+    # themselves, they need their own children
+    if isinstance(field, rf_serializers.BaseSerializer) or any(
+            hasattr(field, name) for name in ("child", "child_relation")):
+        return copy.deepcopy(field)
+
+    field_copy = copy.copy(field)
+    if "_validators" in vars(field):
+        field_copy._validators = list(field._validators)
+
+    return field_copy
+
+
 class BaseDefinableSerializer(rf_serializers.Serializer, TranslationMixin):
 
+    # copy the declared fields shallowly instead of deeply for each instance
+    flyweight_fields = False
+
+    @cached_property
+    def fields(self):
+        if not isinstance(self._declared_fields, LazyDeclaredFields):
+            return super().fields
+
+        # only the fields used by the instance are copied
+        return LazyBindingDict(
+            self,
+            _flyweight_copy if self.flyweight_fields else copy.deepcopy
+        )
+
+    def get_fields(self):
+        if not self.flyweight_fields:
+            return super().get_fields()
+
+        return OrderedDict(
+            (name, _flyweight_copy(field))
+            for name, field in self._declared_fields.items()
+        )
+
     def trans_text(self, **kwargs):
         request = kwargs.get("context", {}).get("request", {})
         lang = getattr(request, "LANGUAGE_CODE", get_language())
 
-        for field_defn in self.serializer_definition_data["fields"]:
-            field_name = field_defn["name"]
-            field = self.fields[field_name]
-            field_class = field.__class__
+        table = self._translation_table
+        patches = table.get(lang, None)
+        if patches is None:
+            lang = "default"
+            patches = table[lang]
 
-            trans_dict = self.__class__._get_translate_string(
-                field_defn, field_name, field_class, language=lang)
+        fields = self.fields
+        for field_name, target, trans_text in patches:
+            translate = functools.partial(
+                self._translate_field, lang, field_name, target, trans_text)
 
-            # label and help_text
-            for target in ("label", "help_text",):
-                trans_text = trans_dict.get(target, None)
-                if trans_text:
-                    setattr(field, target, trans_text)
+            if isinstance(fields, LazyBindingDict):
+                fields.apply(field_name, translate)
+            else:
+                translate(fields[field_name])
 
-            # initial
-            target = "initial"
-            trans_text = trans_dict.get(target, None)
-            if trans_text and issubclass(field_class, rf_serializers.CharField):
-                setattr(field, target, trans_text)
+    def _translate_field(self, lang, field_name, target, trans_text, field):
+        if target == "placeholder":
+            # the style dict may be shared with the declared field
+            field.style = dict(field.style, placeholder=trans_text)
 
-            # placeholder
-            target = "placeholder"
-            trans_text = trans_dict.get(target, None)
-            if trans_text:
-                field.style["placeholder"] = trans_text
+        elif isinstance(trans_text, ChoiceIndex):
+            field._set_choices(trans_text)
+
+        elif target == "choices" and self.flyweight_fields:
+            self._set_shared_choices(field, lang, field_name, trans_text)
+
+        elif target == "choices":
+            field._set_choices(trans_text)
 
-            # choices
-            trans_choices = trans_dict.get("choices", None)
-            if trans_choices:
-                field._set_choices(trans_choices)
+        else:
+            setattr(field, target, trans_text)
+
+    @classmethod
+    def validator(cls, context=None, partial=False):
+        """
+        Return a thread-safe ``Validator`` whose ``validate(data)`` returns
+        ``(validated_data, errors)`` without creating a serializer per
+        payload.
+        """
+        return Validator(cls, context=context, partial=partial)
+
+    def _set_shared_choices(self, field, lang, field_name, trans_text):
+        # the choices of the first instance are shared by the next ones
+        shared_choices = self.__class__.__dict__.get("_shared_choices", None)
+        if shared_choices is None:
+            field._set_choices(trans_text)
+            return
+
+        state = shared_choices.get((lang, field_name), None)
+        if state is None:
+            field._set_choices(trans_text)
+            shared_choices[(lang, field_name)] = {
+                name: vars(field)[name] for name in _CHOICE_ATTRIBUTES
+                if name in vars(field)
+            }
+        else:
+            vars(field).update(state)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.trans_text(**kwargs)
 
+    async def ais_valid(self, raise_exception=False):
+        """
+        ``is_valid`` running on the executor of the async API, so the event
+        loop is not blocked. Async validators are awaited on the loop.
+        """
+        # the running loop, also on python 3.6
+        loop = asyncio.get_event_loop()
+
+        def _is_valid():
+            _async_context.loop = loop
+            try:
+                return self.is_valid(raise_exception=raise_exception)
+            finally:
+                _async_context.loop = None
+
+        return await loop.run_in_executor(_get_async_executor(), _is_valid)
 
-def build_serializer(defn_data,
-                     base_classes=list(),
-                     allow_validate_method=True):
+
+def _build_serializer(defn_data, base_classes, allow_validate_method,
+                      defn_hash=None, checked=False):
 
     def _build_serializer_class(serializer_defn):
         kwargs = {
             "serializer_classes": serializer_classes,
             "allow_validate_method": allow_validate_method,
+            "lazy_fields": lazy_fields,
+            "flyweight_fields": flyweight_fields,
         }
 
         serializer_name = serializer_defn["name"]
@@ -443,41 +1106,237 @@ def build_serializer(defn_data,
             serializer_defn, _base_classes, **namespace, **kwargs)
 
     _base_classes = tuple(
-        [BaseDefinableSerializer, ] + BASE_CLASSES_BY_SETTINGS + base_classes
+        [BaseDefinableSerializer, ] + BASE_CLASSES_BY_SETTINGS + list(base_classes)
     )
 
+    lazy_fields = getattr(
+        dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {}
+    ).get("LAZY_FIELDS", False)
+
+    flyweight_fields = getattr(
+        dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {}
+    ).get("FLYWEIGHT_FIELDS", False)
+
+    cache_key = (
+        defn_hash or make_defn_hash(defn_data), _base_classes,
+        allow_validate_method, lazy_fields, flyweight_fields)
+
+    main_serializer = _build_cache.get(cache_key)
+    if main_serializer is not None:
+        return main_serializer
+
+    def _build():
+        # a build of the same definition may have finished since the lookup
+        main_serializer = _build_cache.peek(cache_key)
+        if main_serializer is not None:
+            return main_serializer
+
+        # a definition checked and compiled by another process, or before
+        # a restart
+        missed_caches = list()
+        copied_defn = None
+        for artifact_cache in _get_artifact_caches():
+            copied_defn = artifact_cache.load(cache_key[0])
+            if copied_defn is not None:
+                break
+            missed_caches.append(artifact_cache)
+
+        if copied_defn is None:
+            if not checked:
+                _defn_pre_checker(defn_data)
+
+            # the built classes keep the definition, don't share it with
+            # the caller
+            copied_defn = copy.deepcopy(defn_data)
+
+        main_defn = copied_defn.get("main")
+
+        # build depending_serializers, or reuse the ones built by other
+        # definitions with the same content
+        depending_keys = dict()
+        relative_initial = False
+
+        try:
+            depending_defn = _sort_depending_serializers(
+                main_defn, copied_defn.get("depending_serializers", list()))
+
+            for defn in depending_defn:
+                references = _get_depending_references(defn, depending_keys)
+                depending_key = (
+                    make_defn_hash(defn),
+                    tuple((name, depending_keys[name]) for name in references),
+                    _base_classes,
+                    allow_validate_method,
+                    lazy_fields,
+                    flyweight_fields,
+                )
+
+                depending_class = _depending_registry.get(depending_key, None)
+                if depending_class is None:
+                    depending_class = _build_serializer_class(defn)
+                    if depending_class._relative_initial:
+                        relative_initial = True
+                    else:
+                        depending_class = _depending_registry.setdefault(
+                            depending_key, depending_class)
+
+                serializer_classes[defn["name"]] = depending_class
+                depending_keys[defn["name"]] = depending_key
+
+            # build main serializer
+            main_serializer = _build_serializer_class(main_defn)
+
+        except Exception as e:
+            raise ValidationError(e)
+
+        for artifact_cache in missed_caches:
+            artifact_cache.store(cache_key[0], defn_data)
+
+        # the next build parses the relative initial values again
+        if not (relative_initial or main_serializer._relative_initial):
+            _build_cache.set(cache_key, main_serializer)
+
+        return main_serializer
+
     serializer_classes = dict()
 
-    _defn_pre_checker(defn_data)
+    # only one thread builds a definition, the others wait for its result
+    return _build_flight.do(cache_key, _build)
+
+
+def build_serializer(defn_data,
+                     base_classes=list(),
+                     allow_validate_method=True):
+
+    return _build_serializer(
+        defn_data,
+        base_classes,
+        allow_validate_method,
+    )
 
-    main_defn = defn_data.get("main")
-    depending_defn = defn_data.get("depending_serializers", list())
 
-    main_serializer = None
+def _cache_evict(defn_data):
+    """
+    Forget the classes built from the definition with any base classes, so
+    the next build creates new ones. Return the number of evicted classes.
+    """
+    defn_hash = make_defn_hash(defn_data)
+    return _build_cache.evict(lambda key: key[0] == defn_hash)
 
-    # build depending_serializers
+
+build_serializer.cache_info = _build_cache.info
+build_serializer.cache_clear = _build_cache.clear
+build_serializer.cache_evict = _cache_evict
+
+
+BuildResult = namedtuple("BuildResult", ("serializer_class", "error"))
+
+
+def _load_and_check(item, format=None):
     try:
-        for defn in depending_defn:
-            serializer_classes[defn["name"]] = _build_serializer_class(defn)
+        defn_hash = None
+        if format in ("json", "yaml"):
+            defn_data, defn_hash = _parse_definition(item, format)
+        else:
+            defn_data = item
 
-        # build main serializer
-        main_serializer = _build_serializer_class(main_defn)
+        _defn_pre_checker(defn_data)
+        return defn_data, defn_hash or make_defn_hash(defn_data), None
+
+    except ValidationError as e:
+        return None, None, e
 
     except Exception as e:
-        raise ValidationError(e)
+        return None, None, ValidationError(str(e))
+
+
+def build_serializers_many(defns,
+                           executor=None,
+                           format=None,
+                           base_classes=list(),
+                           allow_validate_method=True,
+                           chunksize=16):
+    """
+    Build serializer classes from many definitions.
+
+    ``defns`` are dicts, or JSON/YAML strings when ``format`` is "json" or
+    "yaml". Parsing and pre-checking run on ``executor`` (a
+    concurrent.futures executor, a process pool spreads the parsing over
+    the cores) and the classes are built in the calling process. Returns
+    a BuildResult(serializer_class, error) per definition in order.
+    """
+    if format not in (None, "json", "yaml"):
+        raise ValueError("format must be None, 'json' or 'yaml'")
+
+    # identical inputs are loaded once
+    unique_items = list()
+    positions = list()
+    index_by_key = dict()
+
+    for item in defns:
+        key = item if isinstance(item, (str, bytes)) else id(item)
+        if key not in index_by_key:
+            index_by_key[key] = len(unique_items)
+            unique_items.append(item)
+        positions.append(index_by_key[key])
+
+    formats = itertools.repeat(format, len(unique_items))
+    if executor is None:
+        loaded = map(_load_and_check, unique_items, formats)
+    else:
+        loaded = executor.map(
+            _load_and_check, unique_items, formats, chunksize=chunksize)
+
+    # identical definitions are built once
+    built = dict()
+    unique_results = list()
+
+    for defn_data, defn_hash, error in loaded:
+        if error is None and defn_hash not in built:
+            try:
+                built[defn_hash] = BuildResult(
+                    _build_serializer(
+                        defn_data,
+                        base_classes,
+                        allow_validate_method,
+                        defn_hash=defn_hash,
+                        checked=True,
+                    ),
+                    None
+                )
+            except ValidationError as e:
+                built[defn_hash] = BuildResult(None, e)
 
-    return main_serializer
+            # one broken definition doesn't abort the others
+            except Exception as e:
+                built[defn_hash] = BuildResult(None, ValidationError(e))
+
+        if error is None:
+            unique_results.append(built[defn_hash])
+        else:
+            unique_results.append(BuildResult(None, error))
+
+    return [unique_results[position] for position in positions]
+
+
+def _build_serializer_by_source(source, format, base_classes,
+                                allow_validate_method):
+
+    defn_data, defn_hash = _parse_definition(source, format)
+    return _build_serializer(
+        defn_data,
+        base_classes,
+        allow_validate_method,
+        defn_hash=defn_hash,
+    )
 
 
 def build_serializer_by_json(json_data,
                              base_classes=list(),
                              allow_validate_method=True):
 
-    return build_serializer(
-        simplejson.loads(json_data),
-        base_classes=base_classes,
-        allow_validate_method=allow_validate_method,
-    )
+    return _build_serializer_by_source(
+        json_data, "json", base_classes, allow_validate_method)
 
 
 def build_serializer_by_json_file(json_file_path,
@@ -486,22 +1345,16 @@ def build_serializer_by_json_file(json_file_path,
 
     with open(json_file_path, "rb") as fh:
         reader = codecs.getreader("utf-8")
-        return build_serializer(
-            simplejson.load(reader(fh)),
-            base_classes=base_classes,
-            allow_validate_method=allow_validate_method,
-        )
+        return _build_serializer_by_source(
+            reader(fh).read(), "json", base_classes, allow_validate_method)
 
 
 def build_serializer_by_yaml(yaml_data,
                              base_classes=list(),
                              allow_validate_method=True):
 
-    return build_serializer(
-        yaml.load(yaml_data, Loader=yaml.SafeLoader),
-        base_classes=base_classes,
-        allow_validate_method=allow_validate_method,
-    )
+    return _build_serializer_by_source(
+        yaml_data, "yaml", base_classes, allow_validate_method)
 
 
 def build_serializer_by_yaml_file(yaml_file_path,
@@ -510,8 +1363,75 @@ def build_serializer_by_yaml_file(yaml_file_path,
 
     with open(yaml_file_path, "rb") as fh:
         reader = codecs.getreader("utf-8")
-        return build_serializer(
-            yaml.load(reader(fh), Loader=yaml.SafeLoader),
-            base_classes=base_classes,
-            allow_validate_method=allow_validate_method,
-        )
+        return _build_serializer_by_source(
+            reader(fh).read(), "yaml", base_classes, allow_validate_method)
+
+
+async def abuild_serializer(defn_data,
+                            base_classes=list(),
+                            allow_validate_method=True):
+    """
+    ``build_serializer`` running on a bounded executor. Concurrent calls
+    for the same definition share one build.
+    """
+    return await _abuild_serializer(
+        defn_data, base_classes, allow_validate_method)
+
+
+async def _abuild_serializer(defn_data, base_classes, allow_validate_method,
+                             defn_hash=None):
+
+    defn_hash = defn_hash or make_defn_hash(defn_data)
+    key = (defn_hash, tuple(base_classes), allow_validate_method)
+
+    with _inflight_builds_lock:
+        future = _inflight_builds.get(key, None)
+        submitted = future is None
+        if submitted:
+            future = _get_async_executor().submit(
+                _build_serializer,
+                defn_data,
+                base_classes,
+                allow_validate_method,
+                defn_hash=defn_hash,
+            )
+            _inflight_builds[key] = future
+
+    def _done(done_future):
+        with _inflight_builds_lock:
+            if _inflight_builds.get(key, None) is done_future:
+                del _inflight_builds[key]
+
+    # outside of the lock, a finished future runs the callback right away
+    if submitted:
+        future.add_done_callback(_done)
+
+    # a cancelled caller must not cancel the build of the other callers
+    return await asyncio.shield(asyncio.wrap_future(future))
+
+
+async def _abuild_serializer_by_source(source, format, base_classes,
+                                       allow_validate_method):
+
+    loop = asyncio.get_event_loop()
+    defn_data, defn_hash = await loop.run_in_executor(
+        _get_async_executor(), _parse_definition, source, format)
+
+    return await _abuild_serializer(
+        defn_data, base_classes, allow_validate_method, defn_hash=defn_hash)
+
+
+async def abuild_serializer_by_json(json_data,
+                                    base_classes=list(),
+                                    allow_validate_method=True):
+
+    return await _abuild_serializer_by_source(
+        json_data, "json", base_classes, allow_validate_method)
+
+
+async def abuild_serializer_by_yaml(yaml_data,
+                                    base_classes=list(),
+                                    allow_validate_method=True):
+
+    return await _abuild_serializer_by_source(
+        yaml_data, "yaml", base_classes, allow_validate_method)
@@ -0,0 +1,113 @@
+from django.utils.datastructures import MultiValueDict
+
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.settings import api_settings
+
+from .validation import ValidationResult, compile_validation
+
+import csv
+import json
+import os
+
+
+__all__ = (
+    "iter_csv",
+    "iter_ndjson",
+    "validate_file",
+    "validate_stream",
+)
+
+
+class ParseError(ValueError):
+    pass
+
+
+def iter_ndjson(fileobj):
+    """
+    Yield ``(line_no, record)`` for each non blank line of a NDJSON file.
+    A line which can't be decoded is yielded as a ``ParseError``.
+    """
+    for line_no, line in enumerate(fileobj, 1):
+        if not line.strip():
+            continue
+
+        try:
+            yield line_no, json.loads(line)
+        except ValueError as e:
+            yield line_no, ParseError("Invalid JSON: {}".format(e))
+
+
+def iter_csv(fileobj, **csv_options):
+    """
+    Yield ``(line_no, record)`` for each row of a CSV file with a header.
+
+    Records are ``MultiValueDict`` so the serializer treats them like
+    HTML form input: empty cells of optional fields are omitted and
+    ``address.city`` style columns fill nested serializers.
+    """
+    reader = csv.reader(fileobj, **csv_options)
+
+    try:
+        header = next(reader)
+    except StopIteration:
+        return
+
+    line_no = reader.line_num + 1
+    for row in reader:
+        if row:
+            if len(row) != len(header):
+                yield line_no, ParseError(
+                    "Expected {} columns but got {}.".format(
+                        len(header), len(row)))
+            else:
+                yield line_no, MultiValueDict(
+                    (name, [value]) for name, value in zip(header, row))
+
+        line_no = reader.line_num + 1
+
+
+_READERS = {
+    "ndjson": iter_ndjson,
+    "csv": iter_csv,
+}
+
+
+def validate_stream(serializer_class, fileobj, format="ndjson", context=None,
+                    partial=False, **reader_options):
+    """
+    Validate the records of a NDJSON or CSV file object one by one and
+    yield ``(line_no, ValidationResult(validated_data, errors))``.
+
+    The file is read incrementally, so memory use does not depend on the
+    size of the file.
+    """
+    try:
+        reader = _READERS[format]
+    except KeyError:
+        raise ValueError("Unknown format: {}".format(format))
+
+    validate = compile_validation(
+        serializer_class, context=context, partial=partial)
+
+    for line_no, record in reader(fileobj, **reader_options):
+        if isinstance(record, ParseError):
+            yield line_no, ValidationResult({}, {
+                api_settings.NON_FIELD_ERRORS_KEY: [
+                    ErrorDetail(str(record), code="parse_error")]
+            })
+        else:
+            yield line_no, validate(record)
+
+
+def validate_file(serializer_class, path, format=None, encoding="utf-8",
+                  **kwargs):
+    """
+    ``validate_stream`` for a file path. The format is guessed from the
+    extension when not given, ``.csv`` is CSV and anything else NDJSON.
+    """
+    if format is None:
+        ext = os.path.splitext(path)[1].lower()
+        format = "csv" if ext == ".csv" else "ndjson"
+
+    with open(path, encoding=encoding, newline="") as fh:
+        yield from validate_stream(serializer_class, fh, format=format, **kwargs)
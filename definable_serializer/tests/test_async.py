@@ -0,0 +1,196 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from rest_framework import serializers
+
+from .. import serializers as definable_serializer
+from ..serializers import _asyncio_run
+from ..codegen import generate_serializer_module
+
+from unittest import mock
+import asyncio
+import copy
+import threading
+
+
+class AsyncPositiveValidator:
+
+    def __init__(self, message="must be positive"):
+        self.message = message
+
+    async def __call__(self, value):
+        await asyncio.sleep(0)
+        if value <= 0:
+            raise serializers.ValidationError(self.message)
+
+
+DEFINITION = {
+    "main": {
+        "name": "AsyncSerializer",
+        "fields": [
+            {
+                "name": "count",
+                "field": "IntegerField",
+                "validators": [{
+                    "validator": "definable_serializer.tests.test_async."
+                                 "AsyncPositiveValidator",
+                }],
+            },
+            {
+                "name": "name",
+                "field": "CharField",
+                "validate_method": (
+                    "async def validate_method(self, value):\n"
+                    "    import asyncio\n"
+                    "    from rest_framework import serializers\n"
+                    "    await asyncio.sleep(0)\n"
+                    "    if value == 'admin':\n"
+                    "        raise serializers.ValidationError('reserved')\n"
+                    "    return value.upper()\n"
+                ),
+            },
+        ],
+    },
+}
+
+
+YAML_DEFINITION = """
+main:
+  name: YamlSerializer
+  fields:
+  - name: title
+    field: CharField
+"""
+
+
+class TestAsyncBuild(TestCase):
+
+    def setUp(self):
+        definable_serializer._build_cache.clear()
+
+    def test_abuild_serializer(self):
+        serializer_class = _asyncio_run(
+            definable_serializer.abuild_serializer(DEFINITION))
+
+        self.assertIs(
+            serializer_class, definable_serializer.build_serializer(DEFINITION))
+
+    def test_concurrent_builds_are_coalesced(self):
+        started = threading.Event()
+        release = threading.Event()
+        build = definable_serializer._build_serializer
+
+        def _slow_build(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            return build(*args, **kwargs)
+
+        async def _build_all():
+            tasks = [
+                asyncio.ensure_future(
+                    definable_serializer.abuild_serializer(DEFINITION))
+                for _ in range(5)
+            ]
+            await asyncio.get_event_loop().run_in_executor(
+                None, started.wait, 5)
+            release.set()
+            return await asyncio.gather(*tasks)
+
+        with mock.patch.object(
+                definable_serializer, "_build_serializer",
+                side_effect=_slow_build) as mocked:
+            results = _asyncio_run(_build_all())
+
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(definable_serializer._inflight_builds, {})
+
+    def test_invalid_definition(self):
+        with self.assertRaises(ValidationError):
+            _asyncio_run(definable_serializer.abuild_serializer(
+                {"main": {"name": "Broken", "fields": [
+                    {"name": "field", "field": "NoSuchField"}]}}
+            ))
+        self.assertEqual(definable_serializer._inflight_builds, {})
+
+    def test_abuild_serializer_by_yaml(self):
+        serializer_class = _asyncio_run(
+            definable_serializer.abuild_serializer_by_yaml(YAML_DEFINITION))
+        self.assertEqual(serializer_class.__name__, "YamlSerializer")
+
+    def test_abuild_serializer_by_json(self):
+        serializer_class = _asyncio_run(
+            definable_serializer.abuild_serializer_by_json(
+                '{"main": {"name": "JsonSerializer", "fields": '
+                '[{"name": "title", "field": "CharField"}]}}'))
+        self.assertEqual(serializer_class.__name__, "JsonSerializer")
+
+
+class TestAsyncValidation(TestCase):
+
+    def setUp(self):
+        self.serializer_class = definable_serializer.build_serializer(
+            DEFINITION)
+
+    def test_ais_valid(self):
+        async def _validate(data):
+            serializer = self.serializer_class(data=data)
+            return await serializer.ais_valid(), serializer
+
+        is_valid, serializer = _asyncio_run(
+            _validate({"count": 3, "name": "taro"}))
+        self.assertTrue(is_valid)
+        self.assertEqual(
+            serializer.validated_data, {"count": 3, "name": "TARO"})
+
+        is_valid, serializer = _asyncio_run(
+            _validate({"count": 0, "name": "admin"}))
+        self.assertFalse(is_valid)
+        self.assertEqual(serializer.errors["count"], ["must be positive"])
+        self.assertEqual(serializer.errors["name"], ["reserved"])
+
+    def test_ais_valid_raise_exception(self):
+        serializer = self.serializer_class(data={"count": -1, "name": "taro"})
+        with self.assertRaises(serializers.ValidationError):
+            _asyncio_run(serializer.ais_valid(raise_exception=True))
+
+    def test_is_valid_without_event_loop(self):
+        serializer = self.serializer_class(data={"count": 0, "name": "taro"})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("count", serializer.errors)
+
+    def test_is_valid_in_event_loop(self):
+        async def _validate():
+            self.serializer_class(
+                data={"count": 1, "name": "taro"}).is_valid()
+
+        with self.assertRaises(RuntimeError):
+            _asyncio_run(_validate())
+
+    def test_generated_module(self):
+        namespace = dict()
+        exec(generate_serializer_module(DEFINITION), namespace)
+        serializer = namespace["serializer_class"](
+            data={"count": 0, "name": "taro"})
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors["count"], ["must be positive"])
+
+        serializer = namespace["serializer_class"](
+            data={"count": 1, "name": "taro"})
+        self.assertTrue(_asyncio_run(serializer.ais_valid()))
+        self.assertEqual(serializer.validated_data["name"], "TARO")
+
+    def test_generated_module_async_spellings(self):
+        for spelling in ("async  def", "async\tdef"):
+            defn_data = copy.deepcopy(DEFINITION)
+            name_defn = defn_data["main"]["fields"][1]
+            name_defn["validate_method"] = name_defn["validate_method"].replace(
+                "async def", spelling)
+
+            namespace = dict()
+            exec(generate_serializer_module(defn_data), namespace)
+            serializer = namespace["serializer_class"](
+                data={"count": 1, "name": "admin"})
+
+            self.assertFalse(serializer.is_valid())
+            self.assertEqual(serializer.errors["name"], ["reserved"])
@@ -0,0 +1,111 @@
+from django.test import TestCase
+
+from .. import batch
+from .. import serializers as definable_serializer
+
+from unittest import mock, skipIf
+import itertools
+import json
+
+
+DEFINITION = {
+    "main": {
+        "name": "Submission",
+        "fields": [
+            {"name": "age", "field": "IntegerField",
+             "field_kwargs": {"min_value": 0, "max_value": 150}},
+            {"name": "count", "field": "IntegerField",
+             "field_kwargs": {"required": False, "allow_null": True}},
+            {"name": "rate", "field": "FloatField",
+             "field_kwargs": {"min_value": -1, "max_value": 1.5}},
+            {"name": "score", "field": "DecimalField",
+             "field_kwargs": {"max_digits": 5, "decimal_places": 2,
+                              "min_value": 0, "max_value": 100}},
+            {"name": "gender",
+             "field": "definable_serializer.extra_fields.RadioField",
+             "field_args": [[["male", "Male"], ["female", "Female"]]]},
+            {"name": "level", "field": "ChoiceField",
+             "field_args": [[[1, "One"], [2, "Two"], [3, "Three"]]],
+             "field_kwargs": {"allow_blank": True}},
+            {"name": "name", "field": "CharField"},
+        ],
+        "serializer_validate_method": (
+            "def validate_method(self, data):\n"
+            "    from rest_framework import serializers\n"
+            "    if data.get('age') == 99:\n"
+            "        raise serializers.ValidationError('age 99 is reserved')\n"
+            "    return data\n"
+        ),
+    },
+}
+
+
+AGES = [20, "20", 0, 150, 151, -1, "-1", "1.0", 1.0, 1.5, True, "abc",
+        "", None, 2 ** 70, " 3", 99]
+RATES = [0.5, "0.5", 1, "1.50", 1.6, -1, -2, 0, -0.0, "-0", float("nan"),
+         "1e-3", None, False]
+GENDERS = ["male", "female", "other", "", None, 1]
+LEVELS = [1, "1", "3", "4", "", None, 1.0]
+
+
+def _payloads():
+    payloads = list()
+    values = itertools.product(AGES, RATES, GENDERS, LEVELS)
+    for i, (age, rate, gender, level) in enumerate(values):
+        if i % 5:
+            continue
+
+        payloads.append({
+            "age": age,
+            "count": str(i) if i % 3 else i,
+            "rate": rate,
+            "score": "12.50" if i % 2 else 101,
+            "gender": gender,
+            "level": level,
+            "name": "user{}".format(i),
+        })
+
+    payloads += [{}, [], "not a mapping", {"age": 20}]
+    return payloads
+
+
+class TestValidateMany(TestCase):
+
+    def assertSameAsIsValid(self, serializer_class, payloads):
+        results = batch.validate_many(serializer_class, payloads)
+        self.assertEqual(len(results), len(payloads))
+
+        for data, result in zip(payloads, results):
+            serializer = serializer_class(data=data)
+            serializer.is_valid()
+
+            self.assertEqual(
+                json.dumps(result.validated_data, default=repr),
+                json.dumps(serializer.validated_data, default=repr)
+            )
+            self.assertEqual(
+                json.dumps(result.errors, sort_keys=True, default=repr),
+                json.dumps(serializer.errors, sort_keys=True, default=repr)
+            )
+
+    @skipIf(batch.np is None, "numpy is not installed")
+    def test_vectorized(self):
+        serializer_class = definable_serializer.build_serializer(DEFINITION)
+
+        with mock.patch.object(
+                batch, "_vectorized_run_validation",
+                wraps=batch._vectorized_run_validation) as vectorized:
+            self.assertSameAsIsValid(serializer_class, _payloads())
+
+        # age, count, rate, gender and level, but not the DecimalField
+        self.assertEqual(vectorized.call_count, 5)
+
+    def test_without_numpy(self):
+        serializer_class = definable_serializer.build_serializer(DEFINITION)
+
+        with mock.patch.object(batch, "np", None):
+            self.assertSameAsIsValid(serializer_class, _payloads())
+
+    def test_empty(self):
+        serializer_class = definable_serializer.build_serializer(DEFINITION)
+        self.assertEqual(batch.validate_many(serializer_class, []), [])
@@ -0,0 +1,403 @@
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import TestCase
+
+from ..caches import (
+    ArtifactCache,
+    ClassRegistry,
+    CodeCache,
+    DirectoryStore,
+    LRUCache,
+    SingleFlight,
+    make_defn_hash,
+)
+from ..resolvers import ClassResolver
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from unittest import mock
+import os
+import gc
+import tempfile
+import threading
+import time
+
+
+class TestMakeDefnHash(TestCase):
+
+    def test_key_order_does_not_matter(self):
+        defn_one = OrderedDict([("main", {"name": "A", "fields": []}), ("x", 1)])
+        defn_two = OrderedDict([("x", 1), ("main", {"fields": [], "name": "A"})])
+        self.assertEqual(make_defn_hash(defn_one), make_defn_hash(defn_two))
+
+    def test_different_value(self):
+        self.assertNotEqual(
+            make_defn_hash({"main": {"name": "A"}}),
+            make_defn_hash({"main": {"name": "B"}}),
+        )
+
+        # keep types apart
+        self.assertNotEqual(make_defn_hash({1: "a"}), make_defn_hash({"1": "a"}))
+        self.assertNotEqual(make_defn_hash([True]), make_defn_hash([1]))
+
+
+class TestLRUCache(TestCase):
+
+    def test_get_and_set(self):
+        cache = LRUCache(maxsize=2)
+        self.assertIsNone(cache.get("a"))
+
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.info(), (1, 1, 2, 1))
+
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        # "a" is now the most recently used entry
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_disabled_and_unbounded(self):
+        cache = LRUCache(maxsize=0)
+        cache.set("a", 1)
+        self.assertNotIn("a", cache)
+
+        cache = LRUCache(maxsize=None)
+        for i in range(1000):
+            cache.set(i, i)
+        self.assertEqual(len(cache), 1000)
+
+    def test_clear(self):
+        cache = LRUCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 128, 0))
+
+    def test_peek(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        self.assertEqual(cache.peek("a"), 1)
+        self.assertIsNone(cache.peek("c"))
+        self.assertEqual(cache.info(), (0, 0, 2, 2))
+
+        # peek doesn't make "a" the most recently used entry
+        cache.set("c", 3)
+        self.assertNotIn("a", cache)
+
+
+class TestClassRegistry(TestCase):
+
+    def _classes(self, n):
+        return [type("Class{}".format(i), (), {}) for i in range(n)]
+
+    def test_weak_references(self):
+        registry = ClassRegistry(maxsize=2)
+        a, b, c = self._classes(3)
+        for key, value in (("a", a), ("b", b), ("c", c)):
+            registry.set(key, value)
+
+        # "a" is evicted but still alive, a lookup promotes it again
+        self.assertEqual(len(registry), 2)
+        self.assertIn("a", registry)
+        self.assertIs(registry.peek("a"), a)
+        self.assertIs(registry.get("a"), a)
+        self.assertEqual(registry.info(), (1, 0, 2, 2))
+
+        # "b" is evicted and freed
+        del b
+        gc.collect()
+        self.assertNotIn("b", registry)
+        self.assertIsNone(registry.get("b"))
+
+    def test_memory_budget(self):
+        registry = ClassRegistry(maxsize=None, maxbytes=25, sizeof=lambda v: 10)
+        classes = self._classes(5)
+        for i, value in enumerate(classes):
+            registry.set(i, value)
+
+        self.assertEqual(len(registry), 2)
+        self.assertEqual(registry.currbytes, 20)
+
+        # the newest entry is kept even if it doesn't fit
+        registry = ClassRegistry(maxsize=None, maxbytes=5, sizeof=lambda v: 10)
+        registry.set("a", classes[0])
+        self.assertEqual(len(registry), 1)
+
+    def test_evict(self):
+        registry = ClassRegistry(maxsize=1, maxbytes=100, sizeof=lambda v: 10)
+        classes = self._classes(3)
+        for i, value in enumerate(classes):
+            registry.set(("hash{}".format(i % 2), i), value)
+
+        self.assertEqual(registry.evict(lambda key: key[0] == "hash0"), 2)
+        self.assertNotIn(("hash0", 0), registry)
+        self.assertNotIn(("hash0", 2), registry)
+        self.assertIn(("hash1", 1), registry)
+        self.assertEqual(registry.currbytes, 0)
+
+        self.assertIs(registry.pop(("hash1", 1)), classes[1])
+        self.assertIsNone(registry.pop(("hash1", 1)))
+
+        registry.set("a", classes[0])
+        registry.clear()
+        self.assertNotIn("a", registry)
+        self.assertEqual(registry.currbytes, 0)
+
+
+class TestSingleFlight(TestCase):
+
+    def test_do(self):
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = list()
+
+        def _func(value):
+            calls.append(value)
+            started.set()
+            release.wait(5)
+            return value * 2
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(flight.do, "key", _func, 1)
+            started.wait(5)
+            followers = [
+                executor.submit(flight.do, "key", _func, 2) for _ in range(3)]
+
+            # the followers are waiting for the running call
+            time.sleep(0.1)
+            self.assertEqual(len(flight), 1)
+            release.set()
+
+            self.assertEqual(leader.result(), 2)
+            self.assertEqual([f.result() for f in followers], [2, 2, 2])
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(len(flight), 0)
+
+        # the next call runs again
+        self.assertEqual(flight.do("key", _func, 3), 6)
+
+    def test_exception(self):
+        flight = SingleFlight()
+
+        def _func():
+            raise ValueError("broken")
+
+        with self.assertRaises(ValueError):
+            flight.do("key", _func)
+        self.assertEqual(len(flight), 0)
+
+
+_VALIDATE_METHOD = """
+def validate_method(self, value):
+    return value.upper()
+"""
+
+
+class TestCodeCache(TestCase):
+
+    def test_compile(self):
+        cache = CodeCache()
+        code = cache.compile(_VALIDATE_METHOD)
+        self.assertIs(cache.compile(_VALIDATE_METHOD), code)
+        self.assertEqual(cache.info().hits, 1)
+
+        local_var = dict()
+        exec(code, dict(), local_var)
+        self.assertEqual(local_var["validate_method"](None, "a"), "A")
+
+        with self.assertRaises(SyntaxError):
+            cache.compile("It's not a func!!")
+
+    def test_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            code = CodeCache(directory=directory).compile(_VALIDATE_METHOD)
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+            # another process only reads the marshaled code
+            other_cache = CodeCache(directory=directory)
+            self.assertEqual(other_cache.compile(_VALIDATE_METHOD), code)
+
+            # broken files are compiled again
+            for filename in os.listdir(directory):
+                with open(os.path.join(directory, filename), "wb") as fh:
+                    fh.write(b"broken")
+            self.assertEqual(
+                CodeCache(directory=directory).compile(_VALIDATE_METHOD), code)
+
+
+_DEFINITION = {
+    "main": {
+        "name": "Upper",
+        "fields": [{
+            "name": "name",
+            "field": "CharField",
+            "field_validate_method": _VALIDATE_METHOD,
+        }],
+    },
+}
+
+
+class TestArtifactCache(TestCase):
+
+    def _backends(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        return [
+            LocMemCache("test-artifacts", {}),
+            FileBasedCache(tmp_dir.name, {}),
+        ]
+
+    def test_store_and_load(self):
+        defn_hash = make_defn_hash(_DEFINITION)
+
+        for backend in self._backends():
+            ArtifactCache(backend, CodeCache()).store(defn_hash, _DEFINITION)
+
+            # another process starts with an empty code cache
+            code_cache = CodeCache()
+            artifacts = ArtifactCache(backend, code_cache)
+            self.assertEqual(artifacts.load(defn_hash), _DEFINITION)
+            self.assertIsNone(artifacts.load(make_defn_hash({})))
+
+            with mock.patch("builtins.compile") as mocked:
+                code = code_cache.compile(_VALIDATE_METHOD)
+            mocked.assert_not_called()
+            self.assertEqual(code, compile(
+                _VALIDATE_METHOD, CodeCache.filename, "exec"))
+
+    def test_broken_artifacts(self):
+        backend = LocMemCache("test-broken-artifacts", {})
+        artifacts = ArtifactCache(backend, CodeCache())
+        key = artifacts._key("hash")
+
+        for value in ("broken", {"definition": {}}, {"code": {"a": b"x"}}):
+            backend.set(key, value)
+            self.assertIsNone(artifacts.load("hash"))
+
+        # errors of the backend are misses
+        broken_backend = mock.Mock()
+        broken_backend.get.side_effect = ConnectionError
+        broken_backend.set.side_effect = ConnectionError
+        artifacts = ArtifactCache(broken_backend, CodeCache())
+        artifacts.store("hash", _DEFINITION)
+        self.assertIsNone(artifacts.load("hash"))
+
+    def test_timeout(self):
+        backend = mock.Mock()
+        ArtifactCache(backend, CodeCache()).store("hash", _DEFINITION)
+        self.assertNotIn("timeout", backend.set.call_args[1])
+
+        ArtifactCache(backend, CodeCache(), timeout=60).store(
+            "hash", _DEFINITION)
+        self.assertEqual(backend.set.call_args[1]["timeout"], 60)
+
+
+class TestDirectoryStore(TestCase):
+
+    def test_get_and_set(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "artifacts")
+            store = DirectoryStore(path)
+            self.assertIsNone(store.get("a:b"))
+
+            store.set("a:b", {"value": [1, 2]})
+            self.assertEqual(store.get("a:b"), {"value": [1, 2]})
+            self.assertEqual(
+                DirectoryStore(path).get("a:b"), {"value": [1, 2]})
+
+            # broken files and files of other python versions are misses
+            for data in (b"broken", b"\x00\x00\r\nbroken"):
+                for filename in os.listdir(path):
+                    with open(os.path.join(path, filename), "wb") as fh:
+                        fh.write(data)
+                self.assertEqual(store.get("a:b", "missing"), "missing")
+
+    def test_timeout(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = DirectoryStore(directory, timeout=60)
+            store.set("a", 1)
+            store.set("b", 2, timeout=None)
+            store.set("c", 3, timeout=-1)
+
+            self.assertEqual(store.get("a"), 1)
+            self.assertEqual(store.get("b"), 2)
+            self.assertIsNone(store.get("c"))
+
+            # the expired file is removed
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+            with mock.patch("time.time", return_value=time.time() + 120):
+                self.assertIsNone(store.get("a"))
+                self.assertEqual(store.get("b"), 2)
+
+    def test_max_entries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = DirectoryStore(directory, max_entries=3)
+            for i, key in enumerate("abc"):
+                store.set(key, i)
+                os.utime(store._path(key), (i, i))
+
+            # "a" is used, "b" is the least recently used file
+            self.assertEqual(store.get("a"), 0)
+            store.set("d", 3)
+
+            self.assertEqual(len(os.listdir(directory)), 3)
+            self.assertIsNone(store.get("b"))
+            self.assertEqual(
+                [store.get(key) for key in "acd"], [0, 2, 3])
+
+            unbounded = DirectoryStore(directory, max_entries=None)
+            for key in "efgh":
+                unbounded.set(key, key)
+            self.assertEqual(len(os.listdir(directory)), 7)
+
+    def test_artifacts(self):
+        resolver = ClassResolver()
+        definition = deepcopy(_DEFINITION)
+        definition["main"]["fields"][0]["validators"] = [{
+            "validator": "definable_serializer.tests.test_caches.TestDirectoryStore",
+        }]
+        defn_hash = make_defn_hash(definition)
+
+        with tempfile.TemporaryDirectory() as directory:
+            ArtifactCache(
+                DirectoryStore(directory), CodeCache(), resolver=resolver
+            ).store(defn_hash, definition)
+            ArtifactCache(DirectoryStore(directory), CodeCache()).store_source(
+                "main: {}", "yaml", definition, defn_hash)
+
+            # a restarted process
+            other_resolver = ClassResolver()
+            artifacts = ArtifactCache(
+                DirectoryStore(directory), CodeCache(), resolver=other_resolver)
+
+            with mock.patch("pydoc.locate") as locate:
+                self.assertEqual(artifacts.load(defn_hash), definition)
+                self.assertIs(
+                    other_resolver.locate(
+                        "definable_serializer.tests.test_caches."
+                        "TestDirectoryStore"),
+                    TestDirectoryStore
+                )
+            locate.assert_not_called()
+
+            self.assertEqual(
+                artifacts.load_source("main: {}", "yaml"),
+                (definition, defn_hash)
+            )
+            self.assertIsNone(artifacts.load_source("main: {}", "json"))
+            self.assertIsNone(artifacts.load_source(b"main: []", "yaml"))
@@ -0,0 +1,211 @@
+from django.core.exceptions import ValidationError
+from django.http import HttpRequest
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from .. import serializers as definable_serializer
+from .. import choices as choice_stores
+from ..choices import ChoiceStore, get_choice_store, register_choice_store
+from ..codegen import generate_serializer_module
+
+import copy
+import pickle
+
+
+POSTAL_CODES = [
+    [None, {"default": "select", "ja": "選択してください"}],
+] + [
+    ["{:07d}".format(i), {"default": "code {}".format(i), "ja": "郵便番号 {}".format(i)}]
+    for i in range(1, 1001)
+]
+
+
+def _definition(field, name="PostalCodes"):
+    return {
+        "main": {
+            "name": "Address",
+            "fields": [
+                {"name": "postal_code", "field": field, "choice_store": name},
+            ],
+        },
+    }
+
+
+def _request(language):
+    request = HttpRequest()
+    request.LANGUAGE_CODE = language
+    return request
+
+
+class TestChoiceStore(TestCase):
+
+    def setUp(self):
+        self.store = ChoiceStore([
+            [1, {"default": "one", "ja": "いち"}],
+            [2, "two"],
+            [1, {"default": "uno"}],
+        ])
+
+    def test_lookup(self):
+        self.assertEqual(len(self.store), 2)
+        self.assertIn(1, self.store)
+        self.assertIn("2", self.store)
+        self.assertNotIn(3, self.store)
+
+        # the last label of a duplicated value wins, as in ChoiceField
+        self.assertEqual(self.store.label(1), "uno")
+        self.assertEqual(self.store.label("2", language="ja"), "two")
+        self.assertIsNone(self.store.label(3))
+
+    def test_language_choices(self):
+        store = ChoiceStore([[1, {"default": "one", "ja": "いち"}], [2, "two"]])
+        index = store.language_choices("ja")
+
+        self.assertEqual(list(index), [(1, "いち"), (2, "two")])
+        self.assertEqual(index[0], (1, "いち"))
+        self.assertEqual(index.label("1"), "いち")
+        self.assertIs(store.language_choices("ja"), index)
+        self.assertIs(store.language_choices("fr"), store.language_choices())
+
+        with self.assertRaises(TypeError):
+            index.choices[3] = "three"
+
+    def test_invalid_choices(self):
+        with self.assertRaises(ValueError):
+            ChoiceStore([[1, "one", "extra"]])
+        with self.assertRaises(ValueError):
+            ChoiceStore([[1, {"ja": "いち"}]])
+
+    def test_copy_and_pickle(self):
+        index = self.store.language_choices()
+        self.assertIs(copy.deepcopy(self.store), self.store)
+        self.assertIs(copy.deepcopy(index), index)
+
+        loaded = pickle.loads(pickle.dumps(index))
+        self.assertEqual(list(loaded), list(index))
+        self.assertEqual(loaded.language, "default")
+
+
+class TestChoiceStoreRegistry(TestCase):
+
+    def tearDown(self):
+        for name in ("PostalCodes", "FromSettings"):
+            choice_stores._stores.pop(name, None)
+
+    def test_register(self):
+        store = register_choice_store("PostalCodes", POSTAL_CODES)
+        self.assertIs(get_choice_store("PostalCodes"), store)
+        self.assertEqual(store.name, "PostalCodes")
+
+        with self.assertRaises(ValueError):
+            register_choice_store("PostalCodes", POSTAL_CODES)
+
+        replaced = register_choice_store(
+            "PostalCodes", [[1, "one"]], replace=True)
+        self.assertIs(get_choice_store("PostalCodes"), replaced)
+
+    def test_settings(self):
+        with self.assertRaises(LookupError):
+            get_choice_store("FromSettings")
+
+        stores = {"FromSettings": "{}.POSTAL_CODES".format(__name__)}
+        with override_settings(
+                DEFINABLE_SERIALIZER_SETTINGS={"CHOICE_STORES": stores}):
+            store = get_choice_store("FromSettings")
+
+        self.assertEqual(len(store), len(POSTAL_CODES))
+        self.assertIs(get_choice_store("FromSettings"), store)
+
+
+class TestChoiceStoreFields(TestCase):
+
+    def setUp(self):
+        self.store = register_choice_store("PostalCodes", POSTAL_CODES)
+
+    def tearDown(self):
+        choice_stores._stores.pop("PostalCodes", None)
+        definable_serializer.build_serializer.cache_clear()
+
+    def test_fields_share_the_store(self):
+        for field in ("definable_serializer.extra_fields.RadioField",
+                      "definable_serializer.extra_fields.ChoiceRequiredField",
+                      "definable_serializer.extra_fields.MultipleCheckboxField"):
+            serializer_class = definable_serializer.build_serializer(
+                _definition(field))
+
+            index = self.store.language_choices()
+            for serializer in (serializer_class(), serializer_class()):
+                postal_code = serializer.fields["postal_code"]
+                self.assertIs(postal_code.choices, index.choices)
+                self.assertIs(postal_code.grouped_choices, index.choices)
+                self.assertIs(
+                    postal_code.choice_strings_to_values,
+                    self.store.choice_strings_to_values)
+
+    def test_validation(self):
+        serializer_class = definable_serializer.build_serializer(
+            _definition("definable_serializer.extra_fields.ChoiceRequiredField"))
+
+        serializer = serializer_class(data={"postal_code": "0000100"})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(serializer.validated_data["postal_code"], "0000100")
+
+        for value in ("9999999", None):
+            serializer = serializer_class(data={"postal_code": value})
+            self.assertFalse(serializer.is_valid())
+
+        serializer_class = definable_serializer.build_serializer(
+            _definition("definable_serializer.extra_fields.MultipleCheckboxField"))
+        serializer = serializer_class(
+            data={"postal_code": ["0000001", "0000002"]})
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(
+            serializer.validated_data["postal_code"], {"0000001", "0000002"})
+
+    def test_translation(self):
+        serializer_class = definable_serializer.build_serializer(
+            _definition("definable_serializer.extra_fields.RadioField"))
+
+        serializer = serializer_class(context={"request": _request("ja")})
+        postal_code = serializer.fields["postal_code"]
+        self.assertIs(
+            postal_code.choices, self.store.language_choices("ja").choices)
+        self.assertEqual(postal_code.choices["0000001"], "郵便番号 1")
+
+        serializer = serializer_class(context={"request": _request("en")})
+        self.assertEqual(
+            serializer.fields["postal_code"].choices["0000001"], "code 1")
+
+    def test_flyweight_fields(self):
+        with override_settings(
+                DEFINABLE_SERIALIZER_SETTINGS={"FLYWEIGHT_FIELDS": True}):
+            serializer_class = definable_serializer.build_serializer(
+                _definition("definable_serializer.extra_fields.RadioField"))
+
+        serializer = serializer_class(context={"request": _request("ja")})
+        self.assertIs(
+            serializer.fields["postal_code"].choices,
+            self.store.language_choices("ja").choices)
+        self.assertEqual(serializer_class._shared_choices, {})
+
+    def test_invalid_definitions(self):
+        with self.assertRaises(ValidationError):
+            definable_serializer.build_serializer(
+                _definition("definable_serializer.extra_fields.RadioField",
+                            name="NoSuchStore"))
+
+        # ChoiceField builds its own mappings
+        with self.assertRaises(ValidationError):
+            definable_serializer.build_serializer(_definition("ChoiceField"))
+
+    def test_generate_serializer_module(self):
+        defn_data = _definition("definable_serializer.extra_fields.RadioField")
+        source = generate_serializer_module(defn_data)
+        self.assertLess(len(source), 4096)
+
+        namespace = dict()
+        exec(compile(source, "<generated>", "exec"), namespace)
+        serializer = namespace["serializer_class"]()
+        self.assertIs(
+            serializer.fields["postal_code"].choices,
+            self.store.language_choices().choices)
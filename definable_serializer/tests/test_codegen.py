@@ -0,0 +1,183 @@
+from django.test import TestCase
+from django.core.exceptions import ValidationError
+from django.http import HttpRequest
+
+from .. import serializers as definable_serializer
+from ..codegen import generate_serializer_module
+
+import json
+import os
+import yaml
+
+
+TEST_DATA_FILE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "data"
+)
+
+
+def _load(file_name):
+    with open(os.path.join(TEST_DATA_FILE_DIR, file_name)) as fh:
+        if file_name.endswith(".json"):
+            return json.load(fh)
+        return yaml.safe_load(fh)
+
+
+def _exec_module(source):
+    namespace = dict()
+    exec(compile(source, "<generated>", "exec"), namespace)
+    return namespace
+
+
+class TestGenerateSerializerModule(TestCase):
+
+    def assertSameSerializer(self, defn_data):
+        built = definable_serializer.build_serializer(defn_data)
+        generated = _exec_module(
+            generate_serializer_module(defn_data))["serializer_class"]
+
+        self.assertEqual(generated.__name__, built.__name__)
+        self.assertTrue(
+            issubclass(generated, definable_serializer.BaseDefinableSerializer))
+        self.assertEqual(repr(generated()), repr(built()))
+        return generated
+
+    def test_all_type_fields(self):
+        self.assertSameSerializer(_load("test_all_type_fields.json"))
+
+    def test_depending_serializers(self):
+        generated = self.assertSameSerializer(_load("test_need_depending.json"))
+
+        data = {
+            "group_name": "group",
+            "person_list": [
+                {"username_field": "user", "email_field": "user@example.com"},
+            ]
+        }
+        serializer = generated(data=data)
+        self.assertTrue(serializer.is_valid())
+
+    def test_translation(self):
+        generated = self.assertSameSerializer(_load("test_translation.yml"))
+
+        request = HttpRequest()
+        request.LANGUAGE_CODE = "ja"
+        serializer = generated(context={"request": request})
+        self.assertEqual(
+            serializer.fields["test_field"].label, "test_field_label_ja")
+
+    def test_validate_method(self):
+        generated = self.assertSameSerializer(
+            _load("test_field_and_serializer_validate_method.yml"))
+
+        serializer = generated(data={
+            "test_field_one": "wrong_data", "test_field_two": "correct_data"})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("test_field_one", serializer.errors)
+
+        serializer = generated(data={
+            "test_field_one": "correct_data", "test_field_two": "wrong_data"})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("test_field_two", serializer.errors)
+
+        serializer = generated(data={
+            "test_field_one": "correct_data", "test_field_two": "correct_data"})
+        self.assertTrue(serializer.is_valid())
+
+    def test_validators(self):
+        generated = self.assertSameSerializer(_load("using_validator.yml"))
+
+        serializer = generated(data={"using_validator_field": "wrong_data"})
+        self.assertFalse(serializer.is_valid())
+        serializer = generated(data={"using_validator_field": "correct_data"})
+        self.assertTrue(serializer.is_valid())
+
+    def test_not_an_identifier(self):
+        source = generate_serializer_module({
+            "main": {
+                "name": "TestSerializer",
+                "fields": [{"name": "test-field", "field": "CharField"}]
+            }
+        })
+        generated = _exec_module(source)["serializer_class"]
+        self.assertIn("test-field", generated().fields)
+
+    def test_class_names(self):
+        defn_data = {
+            "main": {
+                "name": "class",
+                "fields": [
+                    {"name": "a", "field": "my-serializer"},
+                    {"name": "b", "field": "my_serializer"},
+                    {"name": "c", "field": "serializer_class"},
+                ]
+            },
+            "depending_serializers": [
+                {
+                    "name": name,
+                    "fields": [{"name": "test_field", "field": "CharField"}]
+                } for name in ("my-serializer", "my_serializer",
+                               "serializer_class")
+            ]
+        }
+        generated = self.assertSameSerializer(defn_data)
+        self.assertEqual(generated.__qualname__, "class")
+
+        fields = generated().fields
+        self.assertEqual(type(fields["a"]).__name__, "my-serializer")
+        self.assertEqual(type(fields["b"]).__name__, "my_serializer")
+        self.assertEqual(type(fields["c"]).__name__, "serializer_class")
+
+    def test_shadowing_names(self):
+        names = ("types", "decimal", "datetime", "pytz", "builtins",
+                 "definable_serializer", "locals")
+        defn_data = {
+            "main": {
+                "name": "MainSerializer",
+                "fields": [
+                    {"name": name, "field": name} for name in names
+                ] + [
+                    {"name": "not-an-identifier", "field": "types"},
+                    {"name": "amount", "field": "DecimalField",
+                     "field_kwargs": {"max_digits": 5, "decimal_places": 2,
+                                      "initial": "1.50"}},
+                ]
+            },
+            "depending_serializers": [
+                {
+                    "name": name,
+                    "fields": [
+                        {"name": "date", "field": "DateTimeField",
+                         "field_kwargs": {"initial": "2020-01-01T00:00:00"}},
+                        {"name": "tags", "field": "MultipleChoiceField",
+                         "field_args": [[[1, "one"], [2, "two"]]]},
+                    ]
+                } for name in names
+            ]
+        }
+        generated = self.assertSameSerializer(defn_data)
+
+        fields = generated().fields
+        self.assertEqual(
+            sorted(fields), sorted(names + ("not-an-identifier", "amount")))
+        self.assertEqual(type(fields["types"]).__name__, "types")
+        self.assertEqual(
+            fields["types"].fields["date"].initial.year, 2020)
+
+    def test_reserved_field_name(self):
+        with self.assertRaises(ValidationError):
+            generate_serializer_module({
+                "main": {
+                    "name": "TestSerializer",
+                    "fields": [{"name": "_dsg_types", "field": "CharField"}]
+                }
+            })
+
+    def test_invalid_definition(self):
+        with self.assertRaises(ValidationError):
+            generate_serializer_module({
+                "main": {
+                    "name": "TestSerializer",
+                    "fields": [{"name": "test_field", "field": "NoSuchField"}]
+                }
+            })
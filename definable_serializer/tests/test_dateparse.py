@@ -0,0 +1,107 @@
+from django.test import TestCase
+
+from ..dateparse import (
+    _parsed_cache, is_relative_datetime_value, parse_datetime_value)
+
+from unittest import mock
+import datetime
+import dateparser
+
+
+class TestParseDatetimeValue(TestCase):
+
+    def test_empty(self):
+        with mock.patch("dateparser.parse") as parse:
+            self.assertIsNone(parse_datetime_value(None))
+            self.assertIsNone(parse_datetime_value(""))
+            self.assertFalse(parse.called)
+
+    def test_iso_same_as_dateparser(self):
+        parser_settings = {
+            "TIMEZONE": "Asia/Tokyo",
+            "RETURN_AS_TIMEZONE_AWARE": True
+        }
+        for value in ("2000-01-02 03:04:05",
+                      "2000-01-02T03:04:05",
+                      "2000-01-02T03:04:05+00:00",
+                      "2000-01-31"):
+            with mock.patch("dateparser.parse") as parse:
+                parsed = parse_datetime_value(
+                    value, use_tz=True, time_zone="Asia/Tokyo")
+                self.assertFalse(parse.called)
+
+            self.assertEqual(
+                parsed, dateparser.parse(value, settings=parser_settings))
+            self.assertEqual(parsed.utcoffset(), datetime.timedelta(hours=9))
+
+        self.assertEqual(
+            parse_datetime_value("2000-01-02 03:04:05"),
+            datetime.datetime(2000, 1, 2, 3, 4, 5)
+        )
+        self.assertEqual(
+            parse_datetime_value("12:01:02").time(),
+            datetime.time(12, 1, 2)
+        )
+
+    def test_date_and_time_objects(self):
+        self.assertEqual(
+            parse_datetime_value(datetime.date(2000, 1, 2)),
+            datetime.datetime(2000, 1, 2)
+        )
+        self.assertEqual(
+            parse_datetime_value(datetime.time(3, 4, 5)).time(),
+            datetime.time(3, 4, 5)
+        )
+
+        parsed = parse_datetime_value(
+            datetime.datetime(2000, 1, 2, 3, 4, 5),
+            use_tz=True, time_zone="Asia/Tokyo"
+        )
+        self.assertEqual(parsed.utcoffset(), datetime.timedelta(hours=9))
+
+    def test_fallback_to_dateparser(self):
+        value = "January 2, 2000 3:04 am"
+        parsed = parse_datetime_value(
+            value, use_tz=True, time_zone="Asia/Tokyo")
+        self.assertEqual(
+            parsed.replace(tzinfo=None), datetime.datetime(2000, 1, 2, 3, 4))
+
+        # the results of dateparser may be relative, they aren't memoized
+        with mock.patch("dateparser.parse", return_value=parsed) as parse:
+            self.assertEqual(
+                parse_datetime_value(value, use_tz=True, time_zone="Asia/Tokyo"),
+                parsed
+            )
+            self.assertTrue(parse.called)
+
+        self.assertIsNone(parse_datetime_value(
+            "It's not a date", use_tz=True, time_zone="Asia/Tokyo"))
+
+    def test_memoize_absolute_values_only(self):
+        _parsed_cache.clear()
+        parse_datetime_value("2000-01-02")
+        parse_datetime_value("12:01:02")
+        parse_datetime_value("today")
+
+        self.assertIsNotNone(_parsed_cache.get(("2000-01-02", None)))
+        self.assertIsNone(_parsed_cache.get(("12:01:02", None)))
+        self.assertIsNone(_parsed_cache.get(("today", None)))
+
+    def test_relative_value(self):
+        today = datetime.datetime(2000, 1, 2)
+        with mock.patch("dateparser.parse", return_value=today):
+            self.assertEqual(parse_datetime_value("today"), today)
+
+        tomorrow = datetime.datetime(2000, 1, 3)
+        with mock.patch("dateparser.parse", return_value=tomorrow):
+            self.assertEqual(parse_datetime_value("today"), tomorrow)
+
+    def test_is_relative_datetime_value(self):
+        for value in (None, "", "2000-01-02", "2000-01-02 03:04:05"):
+            self.assertFalse(is_relative_datetime_value(value))
+
+        for value in ("today", "2 days ago", "12:01:02", "2000-02-30"):
+            self.assertTrue(is_relative_datetime_value(value))
+
+        self.assertFalse(is_relative_datetime_value("12:01:02", time_only=True))
+        self.assertTrue(is_relative_datetime_value("now", time_only=True))
@@ -78,6 +78,20 @@ class TestSpecifyBaseClasses(TestCase):
 
 
 
+class TestLazyFields(TestCase):
+
+    def test_clean_creates_lazy_fields(self):
+        defn = deepcopy(BASE_DEFN)
+        defn["main"]["fields"][0]["field_args"] = [["lotus", 1, 2, 3]]
+
+        m = ExampleJSONModelWithAllowValidateMethod()
+        m.serializer_defn = defn
+
+        with self.settings(DEFINABLE_SERIALIZER_SETTINGS={"LAZY_FIELDS": True}):
+            with self.assertRaises(ValidationError):
+                m.full_clean()
+
+
 class TestDefinableSerializerByJSONField(TestCase):
 
     allow_class = ExampleJSONModelWithAllowValidateMethod
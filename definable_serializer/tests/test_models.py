@@ -128,6 +128,38 @@ class AbstractTestModel:
         with self.assertRaises(AttributeError):
             serializer = test_model.get_hoge_moge_piyo_serializer_class()
 
+    def test_serializer_class_cache(self):
+        test_model = self.model_class(
+            foo_bar_baz=deepcopy(_correct_single_definition_data))
+
+        serializer = test_model.get_foo_bar_baz_serializer_class()
+        self.assertIs(test_model.get_foo_bar_baz_serializer_class(), serializer)
+
+        # reassign the field
+        data = deepcopy(_correct_single_definition_data)
+        data["main"]["fields"][0]["name"] = "renamed_char_field"
+        test_model.foo_bar_baz = data
+        serializer = test_model.get_foo_bar_baz_serializer_class()
+        self.assertIn("renamed_char_field", serializer().fields)
+
+        # mutate in place
+        test_model.foo_bar_baz["main"]["fields"][0]["name"] = "char_field"
+        self.assertIs(test_model.get_foo_bar_baz_serializer_class(), serializer)
+        test_model.refresh_serializer_cache()
+        self.assertIn(
+            "char_field",
+            test_model.get_foo_bar_baz_serializer_class()().fields
+        )
+
+        # save
+        serializer = test_model.get_foo_bar_baz_serializer_class()
+        test_model.foo_bar_baz["main"]["fields"][0]["name"] = "saved_char_field"
+        test_model.save()
+        self.assertIn(
+            "saved_char_field",
+            test_model.get_foo_bar_baz_serializer_class()().fields
+        )
+
 
 class TestModelForJSON(AbstractTestModel, TestCase):
     model_class = ExampleJSONModel
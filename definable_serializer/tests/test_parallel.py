@@ -0,0 +1,94 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from .. import serializers as definable_serializer
+from ..parallel import validate_parallel
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+import pickle
+
+
+DEFINITION = {
+    "main": {
+        "name": "Submission",
+        "fields": [
+            {"name": "name", "field": "CharField",
+             "field_kwargs": {"max_length": 10}},
+            {"name": "age", "field": "IntegerField",
+             "field_kwargs": {"min_value": 0}},
+            {"name": "score", "field": "DecimalField",
+             "field_kwargs": {"max_digits": 5, "decimal_places": 2}},
+            {"name": "birthday", "field": "DateField",
+             "field_kwargs": {"required": False}},
+        ],
+    },
+}
+
+
+def _payloads():
+    return [{
+        "name": "user{}".format(i) if i % 11 else "too long name",
+        "age": i if i % 7 else -i,
+        "score": "{}.5".format(i % 1000),
+        "birthday": "2000-01-{:02d}".format(i % 28 + 1),
+    } for i in range(1, 301)]
+
+
+class TestValidateParallel(TestCase):
+
+    def assertSameAsIsValid(self, report, payloads):
+        serializer_class = definable_serializer.build_serializer(DEFINITION)
+        self.assertEqual(len(report.results), len(payloads))
+
+        expected_errors = dict()
+        for i, (data, result) in enumerate(zip(payloads, report.results)):
+            serializer = serializer_class(data=data)
+            if not serializer.is_valid():
+                expected_errors[i] = serializer.errors
+
+            self.assertEqual(result.validated_data, serializer.validated_data)
+            self.assertEqual(result.errors, serializer.errors)
+
+        self.assertEqual(report.errors, expected_errors)
+        self.assertEqual(list(report.errors), sorted(report.errors))
+
+    def test_in_process(self):
+        payloads = _payloads()
+        self.assertSameAsIsValid(
+            validate_parallel(DEFINITION, payloads, chunksize=64), payloads)
+
+    def test_executors(self):
+        payloads = _payloads()
+        executors = [
+            ThreadPoolExecutor(max_workers=2),
+            ProcessPoolExecutor(
+                max_workers=2, mp_context=multiprocessing.get_context("fork")),
+        ]
+
+        for executor in executors:
+            with executor:
+                report = validate_parallel(
+                    DEFINITION, iter(payloads), executor=executor, chunksize=32)
+            self.assertSameAsIsValid(report, payloads)
+
+    def test_results_can_be_pickled(self):
+        report = validate_parallel(DEFINITION, _payloads()[:20])
+        loaded = pickle.loads(pickle.dumps(report))
+
+        self.assertEqual(loaded, report)
+        field_errors = loaded.errors[10]["name"]
+        self.assertEqual(field_errors[0].code, "max_length")
+
+    def test_invalid_definition(self):
+        with self.assertRaises(ValidationError):
+            validate_parallel(
+                {"main": {"name": "Broken", "fields": [
+                    {"name": "field", "field": "NoSuchField"}]}},
+                [{}]
+            )
+
+    def test_chunksize(self):
+        with self.assertRaises(ValueError):
+            validate_parallel(DEFINITION, [], chunksize=0)
+        self.assertEqual(validate_parallel(DEFINITION, []), ([], {}))
@@ -0,0 +1,181 @@
+from django.test import TestCase
+
+from .. import serializers as definable_serializer
+from ..representation import compile_representation
+
+from types import SimpleNamespace
+import datetime
+import decimal
+import json
+import os
+
+
+TEST_DATA_FILE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "data"
+)
+
+
+DEFINITION = """
+main:
+  name: Survey
+  fields:
+  - name: name
+    field: CharField
+  - name: comment
+    field: definable_serializer.extra_fields.TextField
+    field_kwargs:
+      required: false
+  - name: age
+    field: IntegerField
+    field_kwargs:
+      allow_null: true
+  - name: rate
+    field: FloatField
+    field_kwargs:
+      default: 0.5
+  - name: score
+    field: DecimalField
+    field_kwargs:
+      max_digits: 5
+      decimal_places: 2
+  - name: agree
+    field: BooleanField
+  - name: gender
+    field: definable_serializer.extra_fields.RadioField
+    field_args:
+    - [[1, Male], [2, Female]]
+  - name: fruits
+    field: definable_serializer.extra_fields.MultipleCheckboxField
+    field_args:
+    - [[apple, Apple], [orange, Orange]]
+  - name: birthday
+    field: DateField
+  - name: secret
+    field: CharField
+    field_kwargs:
+      write_only: true
+  - name: address
+    field: Address
+  - name: members
+    field: Member
+    field_kwargs:
+      many: true
+depending_serializers:
+- name: Address
+  fields:
+  - name: city
+    field: CharField
+- name: Member
+  fields:
+  - name: email
+    field: EmailField
+  - name: role
+    field: ChoiceField
+    field_args:
+    - [[owner, Owner], [member, Member]]
+"""
+
+
+def _rows():
+    rows = [{
+        "name": "taro",
+        "comment": "hello",
+        "age": 20,
+        "rate": 1.5,
+        "score": decimal.Decimal("12.5"),
+        "agree": True,
+        "gender": "1",
+        "fruits": ["apple"],
+        "birthday": datetime.date(2000, 1, 1),
+        "secret": "secret",
+        "address": {"city": "tokyo"},
+        "members": [{"email": "a@example.com", "role": "owner"}],
+    }, {
+        # missing optional fields, null values and defaults
+        "name": 10,
+        "age": None,
+        "score": "1",
+        "agree": "false",
+        "gender": 2,
+        "fruits": [],
+        "birthday": None,
+        "address": None,
+        "members": [],
+    }]
+
+    rows.append(SimpleNamespace(
+        name=lambda: "callable",
+        comment=None,
+        age="30",
+        rate=2,
+        score=1,
+        agree=1,
+        gender=3,
+        fruits={"orange"},
+        birthday=datetime.date(2000, 1, 2),
+        address=SimpleNamespace(city="osaka"),
+        members=[SimpleNamespace(email="b@example.com", role="member")],
+    ))
+    return rows
+
+
+class TestCompileRepresentation(TestCase):
+
+    def assertSameAsData(self, serializer_class, rows):
+        expected = serializer_class(rows, many=True).data
+        rendered = compile_representation(serializer_class)(rows)
+
+        self.assertEqual(rendered, expected)
+        self.assertEqual(
+            json.dumps(rendered, default=repr),
+            json.dumps(expected, default=repr)
+        )
+
+    def test_same_as_data(self):
+        serializer_class = definable_serializer.build_serializer_by_yaml(
+            DEFINITION)
+        self.assertSameAsData(serializer_class, _rows())
+
+    def test_empty(self):
+        serializer_class = definable_serializer.build_serializer_by_yaml(
+            DEFINITION)
+        self.assertEqual(compile_representation(serializer_class)([]), [])
+
+    def test_missing_required_attribute(self):
+        serializer_class = definable_serializer.build_serializer_by_yaml(
+            DEFINITION)
+        to_representation = compile_representation(serializer_class)
+
+        with self.assertRaises(KeyError):
+            serializer_class([{}], many=True).data
+        with self.assertRaises(KeyError):
+            to_representation([{}])
+
+    def test_all_type_fields(self):
+        serializer_class = definable_serializer.build_serializer_by_json_file(
+            os.path.join(TEST_DATA_FILE_DIR, "test_all_type_fields.json"))
+        self.assertSameAsData(serializer_class, [{
+            "boolean_field": True,
+            "nullboolean_field": None,
+            "char_field": "char",
+            "email_field": "test@example.com",
+            "regex_field": "abc",
+            "slug_field": "slug-slug",
+            "url_field": "http://example.com",
+            "uuid_field": "2a47a0e4-65e1-4b64-b1a5-31e3a6f4f1b1",
+            "filepath_field": "/tmp",
+            "ipaddress_field": "127.0.0.1",
+            "integer_field": 1,
+            "decimal_field": "1.00",
+            "datetime_field": datetime.datetime(2000, 1, 1),
+            "date_field": datetime.date(2000, 1, 1),
+            "time_field": datetime.time(0, 0),
+            "duration_field": datetime.timedelta(days=1),
+            "choice_field": 1,
+            "multiple_choice_field": [1, 2],
+            "file_field": None,
+            "image_field": None,
+            "json_field": {"a": 1},
+            "readonly_field": "read only",
+        }])
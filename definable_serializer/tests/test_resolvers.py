@@ -0,0 +1,92 @@
+from django.test import TestCase
+from django.core.exceptions import ValidationError
+from django.core.validators import MaxLengthValidator
+
+from rest_framework import serializers as rf_serializers
+
+from .. import extra_fields
+from .. import serializers as definable_serializer
+from ..resolvers import ClassResolver, get_resolver
+
+
+class TestClassResolver(TestCase):
+
+    def test_short_name(self):
+        resolver = ClassResolver()
+        self.assertIs(resolver.get_field_class("CharField"), rf_serializers.CharField)
+        self.assertIsNone(resolver.get_field_class("RadioField"))
+        self.assertIsNone(resolver.get_field_class("No Field.. Sorry! :P"))
+
+    def test_indexed_path(self):
+        resolver = ClassResolver()
+        self.assertIs(
+            resolver.locate("definable_serializer.extra_fields.RadioField"),
+            extra_fields.RadioField
+        )
+        self.assertIs(
+            resolver.locate("rest_framework.serializers.CharField"),
+            rf_serializers.CharField
+        )
+
+    def test_locate_not_indexed_path(self):
+        resolver = ClassResolver()
+        path = "django.core.validators.MaxLengthValidator"
+        self.assertIs(resolver.locate(path), MaxLengthValidator)
+        self.assertIs(resolver.locate(path), MaxLengthValidator)
+        self.assertEqual(resolver._memo.info().hits, 1)
+
+        self.assertIsNone(resolver.locate("foo.bar.NotExistValidator"))
+
+    def test_strict(self):
+        resolver = ClassResolver(
+            modules=["django.core.validators"],
+            allowed_paths=["definable_serializer.tests.test_serializers.CorrectDataValidator"],
+            strict=True,
+        )
+        self.assertIs(
+            resolver.locate("django.core.validators.MaxLengthValidator"),
+            MaxLengthValidator
+        )
+        self.assertIsNotNone(resolver.locate(
+            "definable_serializer.tests.test_serializers.CorrectDataValidator"))
+        self.assertIsNone(resolver.locate("decimal.Decimal"))
+
+        # names imported by an indexed module are not allowed
+        for name in ("ValidationError", "deconstructible", "SimpleLazyObject",
+                     "is_valid_ipv6_address"):
+            self.assertIsNone(
+                resolver.locate("django.core.validators.{}".format(name)))
+        self.assertIsNone(
+            resolver.locate("rest_framework.serializers.OrderedDict"))
+        self.assertIsNone(resolver.get_field_class("OrderedDict"))
+
+        # the modules with __all__ are indexed by it
+        resolver = ClassResolver(modules=["definable_serializer.validation"],
+                                 strict=True)
+        self.assertIsNotNone(
+            resolver.locate("definable_serializer.validation.Validator"))
+        self.assertIsNone(
+            resolver.locate("definable_serializer.validation._overrides"))
+
+        with self.assertRaises(ImportError):
+            ClassResolver(allowed_paths=["foo.bar.NotExist"], strict=True)
+
+    def test_strict_by_settings(self):
+        base_defn = {
+            "main": {
+                "name": "TestSerializer",
+                "fields": [{
+                    "name": "test_field",
+                    "field": "rest_framework.fields.CharField",
+                }]
+            }
+        }
+        definable_serializer.build_serializer.cache_clear()
+
+        with self.settings(DEFINABLE_SERIALIZER_SETTINGS={"RESOLVER_STRICT": True}):
+            self.assertTrue(get_resolver().strict)
+            with self.assertRaises(ValidationError):
+                definable_serializer.build_serializer(base_defn)
+
+        self.assertFalse(get_resolver().strict)
+        definable_serializer.build_serializer(base_defn)
@@ -2,16 +2,25 @@ import django
 from django.test import TestCase
 from django.http import HttpRequest
 from django.core.exceptions import ValidationError
-from rest_framework.serializers import CharField
+from rest_framework.serializers import CharField, ListField
 
 from .. import serializers as definable_serializer
+from ..resolvers import reset_resolver
 
 import os
 import yaml
 from copy import deepcopy
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
 import datetime
+import gc
 import importlib
+import multiprocessing
+import sys
+import tempfile
+import threading
+import time
 
 
 TEST_DATA_FILE_DIR = os.path.join(
@@ -199,6 +208,201 @@ class TestSerializer(TestCase):
         )
 
 
+    def test_depending_order(self):
+        base_defn = {
+            "main": {
+                "name": "GroupSerializer",
+                "fields": [
+                    {"name": "leader", "field": "PersonSerializer"},
+                ]
+            },
+            "depending_serializers": [
+                {
+                    "name": "PersonSerializer",
+                    "fields": [
+                        {"name": "name", "field": "CharField"},
+                        {"name": "address", "field": "AddressSerializer"},
+                    ]
+                },
+                {
+                    "name": "AddressSerializer",
+                    "fields": [{"name": "city", "field": "CharField"}]
+                },
+                {
+                    # not referenced, so it isn't built
+                    "name": "UnusedSerializer",
+                    "fields": [{"name": "foo", "field": "No Field.. Sorry! :P"}]
+                },
+            ]
+        }
+        serializer = definable_serializer.build_serializer(base_defn)(data={
+            "leader": {"name": "Alice", "address": {"city": "Tokyo"}}
+        })
+        self.assertTrue(serializer.is_valid())
+        self.assertEqual(
+            serializer.validated_data["leader"]["address"]["city"], "Tokyo")
+
+    def test_depending_circular_reference(self):
+        base_defn = {
+            "main": {
+                "name": "MainSerializer",
+                "fields": [{"name": "a", "field": "ASerializer"}]
+            },
+            "depending_serializers": [
+                {
+                    "name": "ASerializer",
+                    "fields": [{"name": "b", "field": "BSerializer"}]
+                },
+                {
+                    "name": "BSerializer",
+                    "fields": [{"name": "a", "field": "ASerializer"}]
+                },
+            ]
+        }
+        with self.assertRaises(ValidationError) as e:
+            definable_serializer.build_serializer(base_defn)
+
+        self.assertIn("ASerializer -> BSerializer -> ASerializer", str(e.exception))
+
+    def test_invalid_field_type(self):
+        base_defn = {
+            "main": {
+                "name": "MainSerializer",
+                "fields": [{"name": "a", "field": ["CharField"]}]
+            },
+            "depending_serializers": [
+                {
+                    "name": "ASerializer",
+                    "fields": [{"name": "b", "field": "CharField"}]
+                },
+            ]
+        }
+        with self.assertRaises(ValidationError):
+            definable_serializer.build_serializer(base_defn)
+
+        del base_defn["depending_serializers"]
+        with self.assertRaises(ValidationError):
+            definable_serializer.build_serializer(base_defn)
+
+    def test_shared_depending_serializers(self):
+        address_defn = {
+            "name": "AddressSerializer",
+            "fields": [{"name": "city", "field": "CharField"}]
+        }
+        person_defn = {
+            "main": {
+                "name": "PersonSerializer",
+                "fields": [{"name": "address", "field": "AddressSerializer"}]
+            },
+            "depending_serializers": [deepcopy(address_defn)]
+        }
+        company_defn = {
+            "main": {
+                "name": "CompanySerializer",
+                "fields": [{"name": "office", "field": "AddressSerializer"}]
+            },
+            "depending_serializers": [deepcopy(address_defn)]
+        }
+
+        registry = definable_serializer._depending_registry
+        definable_serializer.build_serializer.cache_clear()
+        gc.collect()
+        registry_size = len(registry)
+
+        person_kls = definable_serializer.build_serializer(person_defn)
+        company_kls = definable_serializer.build_serializer(company_defn)
+        self.assertIs(
+            person_kls._declared_fields["address"].__class__,
+            company_kls._declared_fields["office"].__class__,
+        )
+
+        # a different content is another class
+        company_defn["depending_serializers"][0]["fields"][0]["name"] = "town"
+        other_kls = definable_serializer.build_serializer(company_defn)
+        self.assertIsNot(
+            person_kls._declared_fields["address"].__class__,
+            other_kls._declared_fields["office"].__class__,
+        )
+
+        # unused depending serializers are released
+        self.assertEqual(len(registry), registry_size + 2)
+        del person_kls, company_kls, other_kls
+        definable_serializer.build_serializer.cache_clear()
+        gc.collect()
+        self.assertEqual(len(registry), registry_size)
+
+    def test_build_serializers_many(self):
+        good_yaml = """
+        main:
+          name: TestSerializer
+          fields:
+            - name: test_field
+              field: CharField
+        """
+        other_yaml = good_yaml.replace("test_field", "other_field")
+        no_main_yaml = good_yaml.replace("main", "not_main")
+        broken_yaml = "main: [{"
+
+        defns = [good_yaml, no_main_yaml, other_yaml, good_yaml, broken_yaml]
+
+        executors = [
+            None,
+            ThreadPoolExecutor(max_workers=2),
+            ProcessPoolExecutor(
+                max_workers=2, mp_context=multiprocessing.get_context("fork")),
+        ]
+
+        for executor in executors:
+            results = definable_serializer.build_serializers_many(
+                defns, executor=executor, format="yaml")
+            if executor is not None:
+                executor.shutdown()
+
+            self.assertEqual(len(results), len(defns))
+            self.assertIn("test_field", results[0].serializer_class().fields)
+            self.assertIn("other_field", results[2].serializer_class().fields)
+            self.assertIs(results[0].serializer_class, results[3].serializer_class)
+
+            for i in (1, 4):
+                self.assertIsNone(results[i].serializer_class)
+                self.assertIsInstance(results[i].error, ValidationError)
+
+            for i in (0, 2, 3):
+                self.assertIsNone(results[i].error)
+
+        # dicts, including an error at build
+        base_defn = yaml.load(good_yaml, Loader=yaml.SafeLoader)
+        wrong_defn = deepcopy(base_defn)
+        wrong_defn["main"]["fields"][0]["field"] = "No Field.. Sorry! :P"
+
+        results = definable_serializer.build_serializers_many(
+            [base_defn, wrong_defn, deepcopy(base_defn)])
+        self.assertIs(results[0].serializer_class, results[2].serializer_class)
+        self.assertIsInstance(results[1].error, ValidationError)
+
+        # any error at build is the result of its definition
+        broken_defn = deepcopy(base_defn)
+        broken_defn["main"]["name"] = "BrokenSerializer"
+        build = definable_serializer._build_serializer
+
+        def _build_serializer(defn_data, *args, **kwargs):
+            if defn_data["main"]["name"] == "BrokenSerializer":
+                raise RuntimeError("broken")
+            return build(defn_data, *args, **kwargs)
+
+        with mock.patch.object(
+                definable_serializer, "_build_serializer", _build_serializer):
+            results = definable_serializer.build_serializers_many(
+                [base_defn, broken_defn, wrong_defn, deepcopy(base_defn)])
+
+        self.assertIsNone(results[1].serializer_class)
+        self.assertIsInstance(results[1].error, ValidationError)
+        self.assertIn("broken", str(results[1].error))
+        self.assertIsInstance(results[2].error, ValidationError)
+        for i in (0, 3):
+            self.assertIsNone(results[i].error)
+            self.assertIn("test_field", results[i].serializer_class().fields)
+
     def test_field_by_package_module_class_string(self):
         base_defn = {
             "main": {
@@ -456,6 +660,27 @@ class TestSerializer(TestCase):
             "'default' is required in 'choices'"
         )
 
+    def test_translation_table(self):
+        yaml_file = os.path.join(TEST_DATA_FILE_DIR, "test_translation.yml")
+        serializer_class = definable_serializer.build_serializer_by_yaml_file(yaml_file)
+
+        table = serializer_class._translation_table
+        self.assertEqual(set(table.keys()), {"default", "ja"})
+        with self.assertRaises(TypeError):
+            table["en"] = tuple()
+
+        request = HttpRequest()
+        with mock.patch.object(
+                serializer_class, "_get_translate_string") as get_translate_string:
+            for lang, suffix in (("ja", "_ja"), ("fr", "_default")):
+                setattr(request, "LANGUAGE_CODE", lang)
+                serializer = serializer_class(context={"request": request})
+                for field_name, field in serializer.fields.items():
+                    self.assertEqual(
+                        field.label, "{}_label{}".format(field_name, suffix))
+
+            self.assertFalse(get_translate_string.called)
+
     def test_date_or_time_field_initial(self):
         base_defn = {
             "main": {
@@ -504,6 +729,56 @@ class TestSerializer(TestCase):
         self.assertEqual(serializer.fields["non_default_time_field"].initial, None)
         self.assertEqual(serializer.fields["non_default_datetime_field"].initial, None)
 
+    def test_relative_date_initial(self):
+        def _defn(field, initial):
+            return {
+                "main": {
+                    "name": "RelativeInitial",
+                    "fields": [{
+                        "name": "field",
+                        "field": field,
+                        "field_kwargs": {"initial": initial},
+                    }],
+                },
+            }
+
+        relative_defn = _defn("DateField", "today")
+        today = datetime.datetime(2000, 1, 2, 3, 4, 5)
+        tomorrow = datetime.datetime(2000, 1, 3, 3, 4, 5)
+
+        # the clock moves forward between the builds
+        with mock.patch("dateparser.parse", side_effect=[today, tomorrow]):
+            first = definable_serializer.build_serializer(relative_defn)
+            second = definable_serializer.build_serializer(relative_defn)
+
+        self.assertEqual(first().fields["field"].initial, today.date())
+        self.assertEqual(second().fields["field"].initial, tomorrow.date())
+
+        # a depending serializer with a relative initial isn't shared
+        defn = {
+            "main": {
+                "name": "Main",
+                "fields": [{"name": "sub", "field": "Sub"}],
+            },
+            "depending_serializers": [
+                dict(_defn("DateTimeField", "1 day ago")["main"], name="Sub")],
+        }
+        with mock.patch("dateparser.parse", side_effect=[today, tomorrow]):
+            first = definable_serializer.build_serializer(defn)
+            second = definable_serializer.build_serializer(defn)
+
+        self.assertEqual(
+            first().fields["sub"].fields["field"].initial, today)
+        self.assertEqual(
+            second().fields["sub"].fields["field"].initial, tomorrow)
+
+        # absolute values and times are still cached
+        for defn in (_defn("DateField", "2000-01-02"),
+                     _defn("TimeField", "12:01:02")):
+            self.assertIs(
+                definable_serializer.build_serializer(defn),
+                definable_serializer.build_serializer(defn))
+
     def test_date_or_time_field_initial_yaml(self):
         yaml_data = """
         main:
@@ -670,6 +945,390 @@ class TestSerializer(TestCase):
                 hasattr(serializer_class(), "AdditionalTestClassForTestAddMoreBaseClassesByCall"))
 
 
+    def test_build_cache(self):
+        definable_serializer.build_serializer.cache_clear()
+
+        base_defn = {
+            "main": {
+                "name": "TestSerializer",
+                "fields": [{"name": "test_field", "field": "CharField"}]
+            }
+        }
+        serializer_kls = definable_serializer.build_serializer(base_defn)
+        self.assertIs(
+            definable_serializer.build_serializer(deepcopy(base_defn)),
+            serializer_kls
+        )
+
+        info = definable_serializer.build_serializer.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+        # changing the caller's data doesn't affect the built class
+        base_defn["main"]["fields"][0]["name"] = "renamed_field"
+        self.assertEqual(
+            serializer_kls.serializer_definition_data["fields"][0]["name"],
+            "test_field"
+        )
+        self.assertIsNot(
+            definable_serializer.build_serializer(base_defn),
+            serializer_kls
+        )
+
+        # base_classes and allow_validate_method are part of the key
+        self.assertIsNot(
+            definable_serializer.build_serializer(
+                base_defn,
+                base_classes=[AdditionalTestClassForTestAddMoreBaseClassesByCall]
+            ),
+            definable_serializer.build_serializer(base_defn)
+        )
+        self.assertIsNot(
+            definable_serializer.build_serializer(
+                base_defn, allow_validate_method=False),
+            definable_serializer.build_serializer(base_defn)
+        )
+
+    def test_concurrent_builds(self):
+        definable_serializer.build_serializer.cache_clear()
+
+        defn = {
+            "main": {
+                "name": "TestSerializer",
+                "fields": [{"name": "test_field", "field": "CharField"}]
+            }
+        }
+        pre_checker = definable_serializer._defn_pre_checker
+        barrier = threading.Barrier(8)
+
+        def _slow_pre_checker(defn_data):
+            # let the other threads reach the build
+            time.sleep(0.2)
+            return pre_checker(defn_data)
+
+        def _build(_):
+            barrier.wait()
+            return definable_serializer.build_serializer(defn)
+
+        with mock.patch.object(
+                definable_serializer, "_defn_pre_checker",
+                side_effect=_slow_pre_checker) as mocked:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(_build, range(8)))
+
+        self.assertEqual(mocked.call_count, 1)
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(len(definable_serializer._build_flight), 0)
+
+        # all the waiting threads get the error of a broken definition
+        broken_defn = {"main": {"name": "Broken", "fields": [
+            {"name": "field", "field": "NoSuchField"}]}}
+        barrier.reset()
+
+        def _build_broken(_):
+            barrier.wait()
+            with self.assertRaises(ValidationError):
+                definable_serializer.build_serializer(broken_defn)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(_build_broken, range(8)))
+        self.assertEqual(len(definable_serializer._build_flight), 0)
+
+
+    def test_artifact_cache(self):
+        defn = {
+            "main": {
+                "name": "TestSerializer",
+                "fields": [{
+                    "name": "test_field",
+                    "field": "CharField",
+                    "field_validate_method": (
+                        "def validate_method(self, value):\n"
+                        "    return value.upper()\n"
+                    ),
+                }]
+            }
+        }
+        caches = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            },
+            "artifacts": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-artifact-cache",
+            },
+        }
+        defn_settings = {"ARTIFACT_CACHE": "artifacts"}
+
+        with self.settings(
+                CACHES=caches, DEFINABLE_SERIALIZER_SETTINGS=defn_settings):
+            definable_serializer.build_serializer.cache_clear()
+            definable_serializer.build_serializer(defn)
+
+            # a new process only creates the classes
+            definable_serializer.build_serializer.cache_clear()
+            definable_serializer._code_cache.clear()
+            with mock.patch.object(
+                    definable_serializer, "_defn_pre_checker") as checker, \
+                    mock.patch("builtins.compile") as compiler:
+                serializer_class = definable_serializer.build_serializer(defn)
+            checker.assert_not_called()
+            compiler.assert_not_called()
+
+            serializer = serializer_class(data={"test_field": "abc"})
+            self.assertTrue(serializer.is_valid())
+            self.assertEqual(serializer.validated_data["test_field"], "ABC")
+
+        definable_serializer.build_serializer.cache_clear()
+
+
+    def test_artifact_dir(self):
+        defn_yaml = """
+        main:
+          name: TestSerializer
+          fields:
+          - name: test_field
+            field: CharField
+            validators:
+            - validator: definable_serializer.tests.test_serializers.CorrectDataValidator
+              args: ["abc"]
+            field_validate_method: |
+              def validate_method(self, value):
+                  return value.upper()
+        """
+
+        with tempfile.TemporaryDirectory() as directory:
+            defn_settings = {"ARTIFACT_DIR": directory}
+            with self.settings(DEFINABLE_SERIALIZER_SETTINGS=defn_settings):
+                definable_serializer.build_serializer.cache_clear()
+                definable_serializer.build_serializer_by_yaml(defn_yaml)
+
+                # a restarted worker doesn't parse, check or compile
+                definable_serializer.build_serializer.cache_clear()
+                definable_serializer._code_cache.clear()
+                reset_resolver()
+                with mock.patch("yaml.load") as loader, \
+                        mock.patch.object(
+                            definable_serializer, "_defn_pre_checker") as checker, \
+                        mock.patch("builtins.compile") as compiler, \
+                        mock.patch("pydoc.locate") as locate:
+                    serializer_class = (
+                        definable_serializer.build_serializer_by_yaml(defn_yaml))
+
+                for mocked in (loader, checker, compiler, locate):
+                    mocked.assert_not_called()
+
+                serializer = serializer_class(data={"test_field": "abc"})
+                self.assertTrue(serializer.is_valid())
+                self.assertEqual(
+                    serializer.validated_data["test_field"], "ABC")
+                self.assertFalse(
+                    serializer_class(data={"test_field": "xyz"}).is_valid())
+
+        definable_serializer.build_serializer.cache_clear()
+
+
+    def test_cache_evict(self):
+        definable_serializer.build_serializer.cache_clear()
+
+        defn = {
+            "main": {
+                "name": "TestSerializer",
+                "fields": [{"name": "test_field", "field": "CharField"}]
+            }
+        }
+        serializer_kls = definable_serializer.build_serializer(defn)
+        definable_serializer.build_serializer(
+            defn, allow_validate_method=False)
+
+        self.assertEqual(definable_serializer.build_serializer.cache_evict(defn), 2)
+        self.assertEqual(definable_serializer.build_serializer.cache_evict(defn), 0)
+        self.assertIsNot(
+            definable_serializer.build_serializer(defn), serializer_kls)
+
+    def test_evicted_classes_in_use(self):
+        definable_serializer.build_serializer.cache_clear()
+
+        def _defn(i):
+            return {"main": {"name": "TestSerializer", "fields": [
+                {"name": "field_{}".format(i), "field": "CharField"}]}}
+
+        serializer_kls = definable_serializer.build_serializer(_defn(0))
+        for i in range(1, definable_serializer.BUILD_CACHE_SIZE + 1):
+            definable_serializer.build_serializer(_defn(i))
+
+        # evicted, but still used here
+        self.assertIs(
+            definable_serializer.build_serializer(_defn(0)), serializer_kls)
+        definable_serializer.build_serializer.cache_clear()
+
+
+    def test_lazy_fields(self):
+        with self.settings(DEFINABLE_SERIALIZER_SETTINGS={"LAZY_FIELDS": True}):
+            serializer_kls = definable_serializer.build_serializer_by_json_file(
+                os.path.join(TEST_DATA_FILE_DIR, "test_need_depending.json")
+            )
+
+            declared_fields = serializer_kls._declared_fields
+            self.assertIsInstance(
+                declared_fields, definable_serializer.LazyDeclaredFields)
+            self.assertEqual(declared_fields.materialized, [])
+
+            self.assertIsInstance(declared_fields["group_name"], CharField)
+            self.assertEqual(declared_fields.materialized, ["group_name"])
+
+            # an instance only copies the fields it uses
+            serializer = serializer_kls()
+            self.assertEqual(list(serializer.fields), list(declared_fields))
+            self.assertEqual(serializer.fields.materialized, [])
+            self.assertEqual(serializer.fields["group_name"].parent, serializer)
+            self.assertEqual(serializer.fields.materialized, ["group_name"])
+            self.assertEqual(declared_fields.materialized, ["group_name"])
+
+            # validation uses every writable field
+            serializer = serializer_kls(data={
+                "group_name": "Test User Group",
+                "person_list": [
+                    {"username_field": "User 0", "email_field": "test-0@example.com"},
+                ]
+            })
+            self.assertTrue(serializer.is_valid())
+            self.assertEqual(
+                declared_fields.materialized, list(declared_fields.keys()))
+
+            # the field errors are raised on first access
+            base_defn = {
+                "main": {
+                    "name": "TestSerializer",
+                    "fields": [{
+                        "name": "test_field",
+                        "field": "CharField",
+                        "field_args": [["lotus", 1, 2, 3]]
+                    }]
+                }
+            }
+            serializer_kls = definable_serializer.build_serializer(base_defn)
+            with self.assertRaises(ValidationError):
+                serializer_kls().fields["test_field"]
+
+            # and on every access, not only the first one
+            with self.assertRaises(ValidationError):
+                serializer_kls(data={"test_field": "test"}).is_valid()
+
+            # the field class is still resolved at build
+            base_defn["main"]["fields"][0]["field"] = "No Field.. Sorry! :P"
+            with self.assertRaises(ValidationError):
+                definable_serializer.build_serializer(base_defn)
+
+    def test_lazy_fields_translation(self):
+        yaml_file = os.path.join(TEST_DATA_FILE_DIR, "test_translation.yml")
+
+        with self.settings(DEFINABLE_SERIALIZER_SETTINGS={"LAZY_FIELDS": True}):
+            serializer_class = definable_serializer.build_serializer_by_yaml_file(yaml_file)
+
+        request = HttpRequest()
+        setattr(request, "LANGUAGE_CODE", "ja")
+        serializer = serializer_class(context={"request": request})
+        self.assertEqual(serializer.fields.materialized, [])
+        self.assertEqual(serializer.fields["test_field"].label, "test_field_label_ja")
+        self.assertEqual(serializer.fields.materialized, ["test_field"])
+
+        # a field set on the instance isn't translated
+        serializer = serializer_class(context={"request": request})
+        serializer.fields["test_field"] = CharField(label="replaced")
+        self.assertEqual(serializer.fields["test_field"].label, "replaced")
+        del serializer.fields["gendar_field"]
+        self.assertNotIn("gendar_field", serializer.fields)
+
+    def test_flyweight_fields(self):
+        yaml_file = os.path.join(TEST_DATA_FILE_DIR, "test_translation.yml")
+        with self.settings(
+                DEFINABLE_SERIALIZER_SETTINGS={"FLYWEIGHT_FIELDS": True}):
+            serializer_class = definable_serializer.build_serializer_by_yaml_file(
+                yaml_file)
+        self.assertTrue(serializer_class.flyweight_fields)
+        self.assertFalse(
+            definable_serializer.build_serializer_by_yaml_file(
+                yaml_file).flyweight_fields)
+
+        request = HttpRequest()
+        setattr(request, "LANGUAGE_CODE", "ja")
+        ja_serializer = serializer_class(context={"request": request})
+        default_serializer = serializer_class()
+
+        ja_field = ja_serializer.fields["gendar_field"]
+        default_field = default_serializer.fields["gendar_field"]
+        declared_field = serializer_class._declared_fields["gendar_field"]
+
+        # the instances share the immutable state, not the translations
+        self.assertIs(ja_field.error_messages, declared_field.error_messages)
+        self.assertEqual(ja_field.label, "gendar_field_label_ja")
+        self.assertEqual(default_field.label, "gendar_field_label_default")
+        self.assertEqual(
+            ja_field.choices["male"], "gendar_field_choice_male_ja")
+        self.assertEqual(
+            default_field.choices["male"], "gendar_field_choice_male_default")
+        self.assertIsNone(declared_field.parent)
+        self.assertIs(ja_field.parent, ja_serializer)
+
+        # the translated choices are shared by the instances of a language
+        other_ja_field = serializer_class(
+            context={"request": request}).fields["gendar_field"]
+        self.assertIs(other_ja_field.choices, ja_field.choices)
+        self.assertIsNot(other_ja_field, ja_field)
+        self.assertIsNot(default_field.choices, ja_field.choices)
+
+    def test_flyweight_fields_validation(self):
+        defn = {
+            "main": {
+                "name": "TestSerializer",
+                "fields": [
+                    {"name": "name", "field": "CharField",
+                     "field_kwargs": {
+                         "max_length": 5,
+                         "style": {"placeholder": {
+                             "default": "name", "ja": "namae"}}}},
+                    {"name": "gender", "field": "ChoiceField",
+                     "field_args": [[["male", "Male"], ["female", "Female"]]]},
+                    {"name": "depending", "field": "DependingSerializer",
+                     "field_kwargs": {"many": True}},
+                ],
+            },
+            "depending_serializers": [{
+                "name": "DependingSerializer",
+                "fields": [{"name": "count", "field": "IntegerField"}],
+            }],
+        }
+        serializer_class = definable_serializer.build_serializer(defn)
+        with self.settings(
+                DEFINABLE_SERIALIZER_SETTINGS={"FLYWEIGHT_FIELDS": True}):
+            flyweight_class = definable_serializer.build_serializer(defn)
+        self.assertIsNot(flyweight_class, serializer_class)
+
+        payloads = [
+            {"name": "taro", "gender": "male", "depending": [{"count": 1}]},
+            {"name": "too long", "gender": "x", "depending": [{"count": "x"}]},
+        ]
+        for data in payloads:
+            serializer = serializer_class(data=data)
+            flyweight = flyweight_class(data=data)
+            self.assertEqual(flyweight.is_valid(), serializer.is_valid())
+            self.assertEqual(flyweight.errors, serializer.errors)
+            self.assertEqual(flyweight.validated_data, serializer.validated_data)
+
+        # the placeholder of one instance doesn't leak to the others
+        request = HttpRequest()
+        setattr(request, "LANGUAGE_CODE", "ja")
+        ja_serializer = flyweight_class(context={"request": request})
+        self.assertEqual(
+            ja_serializer.fields["name"].style["placeholder"], "namae")
+        self.assertEqual(
+            flyweight_class().fields["name"].style["placeholder"], "name")
+
+        # container fields get their own children
+        list_field = ListField(child=CharField())
+        list_copy = definable_serializer._flyweight_copy(list_field)
+        self.assertIs(list_copy.child.parent, list_copy)
+
 
 class AdditionalTestClassForTestAddMoreBaseClassesBySettings:
     """
@@ -684,3 +1343,86 @@ class AdditionalTestClassForTestAddMoreBaseClassesByCall:
     definable_serializer.tests.test_serializers.AdditionalTestClassForTestAddMoreBaseClassesByCall
     """
     AdditionalTestClassForTestAddMoreBaseClassesByCall = True
+
+
+class TestBuildCacheMemory(TestCase):
+
+    def _defn(self, i):
+        return {
+            "main": {
+                "name": "TestSerializer",
+                "fields": [
+                    {"name": "field_{}".format(i), "field": "CharField",
+                     "field_kwargs": {"max_length": 10}},
+                    {"name": "depending", "field": "DependingSerializer"},
+                ],
+            },
+            "depending_serializers": [{
+                "name": "DependingSerializer",
+                "fields": [
+                    {"name": "depending_{}".format(i), "field": "IntegerField"},
+                ],
+            }],
+        }
+
+    def test_memory_stays_flat(self):
+        definable_serializer.build_serializer.cache_clear()
+        base_class = definable_serializer.BaseDefinableSerializer
+        maxsize = definable_serializer.BUILD_CACHE_SIZE
+
+        def _build(start, stop):
+            for i in range(start, stop):
+                definable_serializer.build_serializer(self._defn(i))
+            gc.collect()
+
+        _build(0, 10000)
+        blocks = sys.getallocatedblocks()
+
+        _build(10000, 100000)
+        # the main and depending classes of the cached entries only
+        self.assertLessEqual(len(base_class.__subclasses__()), maxsize * 2 + 1)
+        self.assertEqual(len(definable_serializer._depending_registry), maxsize)
+        self.assertLess(sys.getallocatedblocks() - blocks, blocks // 20)
+
+        definable_serializer.build_serializer.cache_clear()
+
+    def test_memory_budget(self):
+        registry = definable_serializer._build_cache
+        classes = [
+            definable_serializer.build_serializer(self._defn(i))
+            for i in range(3)
+        ]
+        class_size = definable_serializer._approximate_size(classes[0])
+        self.assertGreater(class_size, 0)
+
+        with mock.patch.multiple(
+                registry, maxbytes=class_size * 5 // 2, maxsize=None):
+            registry.clear()
+            for i in range(10):
+                definable_serializer.build_serializer(self._defn(i))
+
+            self.assertEqual(len(registry), 2)
+            self.assertLessEqual(registry.currbytes, registry.maxbytes)
+
+        registry.clear()
+
+    def test_memory_budget_with_lazy_fields(self):
+        registry = definable_serializer._build_cache
+        defn = self._defn(0)
+        defn["main"]["fields"].append({
+            "name": "broken", "field": "CharField",
+            "field_args": [["lotus", 1, 2, 3]]})
+
+        with mock.patch.multiple(registry, maxbytes=2 ** 30), \
+                self.settings(DEFINABLE_SERIALIZER_SETTINGS={"LAZY_FIELDS": True}):
+            registry.clear()
+            serializer_kls = definable_serializer.build_serializer(defn)
+
+            # measured without creating the lazy fields
+            self.assertEqual(serializer_kls._declared_fields.materialized, [])
+            self.assertGreater(registry.currbytes, 0)
+
+            with self.assertRaises(ValidationError):
+                serializer_kls().fields["broken"]
+
+        registry.clear()
@@ -0,0 +1,188 @@
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from .. import serializers as definable_serializer
+from ..streaming import iter_csv, iter_ndjson, validate_file, validate_stream
+
+import io
+import json
+import os
+import tempfile
+
+
+DEFINITION = """
+main:
+  name: Person
+  fields:
+  - name: name
+    field: CharField
+  - name: age
+    field: IntegerField
+    field_kwargs:
+      min_value: 0
+  - name: nickname
+    field: CharField
+    field_kwargs:
+      required: false
+  - name: address
+    field: Address
+    field_kwargs:
+      required: false
+depending_serializers:
+- name: Address
+  fields:
+  - name: city
+    field: CharField
+"""
+
+
+NDJSON = """\
+{"name": "taro", "age": 20}
+
+{"name": "jiro", "age": -1}
+{"name": "saburo", "age": 3, "address": {"city": "tokyo"}}
+{broken
+"""
+
+
+CSV = """\
+name,age,nickname,address.city
+taro,20,,tokyo
+jiro,-1,jj,kyoto
+"hanako
+kojima",30,,osaka
+shiro
+"""
+
+
+class TestStreaming(TestCase):
+
+    def setUp(self):
+        self.serializer_class = definable_serializer.build_serializer_by_yaml(
+            DEFINITION)
+
+    def test_iter_ndjson(self):
+        records = list(iter_ndjson(io.StringIO(NDJSON)))
+        self.assertEqual([line_no for line_no, _ in records], [1, 3, 4, 5])
+        self.assertEqual(records[0][1], {"name": "taro", "age": 20})
+        self.assertIsInstance(records[3][1], ValueError)
+
+    def test_iter_csv(self):
+        records = list(iter_csv(io.StringIO(CSV)))
+        self.assertEqual([line_no for line_no, _ in records], [2, 3, 4, 6])
+        self.assertEqual(records[2][1]["name"], "hanako\nkojima")
+        self.assertIsInstance(records[3][1], ValueError)
+        self.assertEqual(list(iter_csv(io.StringIO(""))), [])
+
+    def test_validate_ndjson(self):
+        results = list(validate_stream(
+            self.serializer_class, io.StringIO(NDJSON)))
+
+        self.assertEqual(
+            [(line_no, bool(result.errors)) for line_no, result in results],
+            [(1, False), (3, True), (4, False), (5, True)]
+        )
+        self.assertEqual(results[0][1].validated_data, {"name": "taro", "age": 20})
+        self.assertIn("age", results[1][1].errors)
+        self.assertEqual(
+            results[2][1].validated_data["address"], {"city": "tokyo"})
+        self.assertEqual(
+            results[3][1].errors["non_field_errors"][0].code, "parse_error")
+
+    def test_validate_csv(self):
+        results = list(validate_stream(
+            self.serializer_class, io.StringIO(CSV), format="csv"))
+
+        self.assertEqual(
+            [(line_no, bool(result.errors)) for line_no, result in results],
+            [(2, False), (3, True), (4, False), (6, True)]
+        )
+        # empty cells of optional fields are omitted
+        self.assertEqual(results[0][1].validated_data, {
+            "name": "taro", "age": 20, "address": {"city": "tokyo"}})
+        self.assertEqual(results[1][1].errors.keys(), {"age"})
+        self.assertEqual(results[2][1].validated_data, {
+            "name": "hanako\nkojima", "age": 30, "address": {"city": "osaka"}})
+
+    def test_validate_stream_is_lazy(self):
+        def _lines():
+            yield '{"name": "taro", "age": 20}\n'
+            raise AssertionError("read too far")
+
+        results = validate_stream(self.serializer_class, _lines())
+        line_no, result = next(results)
+        self.assertEqual(line_no, 1)
+        self.assertFalse(result.errors)
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            list(validate_stream(
+                self.serializer_class, io.StringIO(""), format="xml"))
+
+
+class TestValidateRecordsCommand(TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.definition_path = self._write("definition.yml", DEFINITION)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _write(self, name, text):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, "w", newline="") as fh:
+            fh.write(text)
+        return path
+
+    def test_validate_file(self):
+        path = self._write("records.csv", CSV)
+        serializer_class = definable_serializer.build_serializer_by_yaml(
+            DEFINITION)
+        self.assertEqual(
+            [line_no for line_no, _ in validate_file(serializer_class, path)],
+            [2, 3, 4, 6]
+        )
+
+    def test_valid_file(self):
+        path = self._write("records.ndjson", '{"name": "taro", "age": 20}\n')
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        call_command(
+            "validate_records", path, definition=self.definition_path,
+            stdout=stdout, stderr=stderr)
+
+        self.assertEqual(stdout.getvalue(), "")
+        self.assertIn("1 records, 0 invalid", stderr.getvalue())
+
+    def test_invalid_records(self):
+        path = self._write("records.ndjson", NDJSON)
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "validate_records", path, definition=self.definition_path,
+                stdout=stdout, stderr=stderr)
+
+        lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([line["line"] for line in lines], [3, 5])
+        self.assertIn("age", lines[0]["errors"])
+        self.assertIn("4 records, 2 invalid", stderr.getvalue())
+
+    def test_no_definition(self):
+        path = self._write("records.ndjson", "")
+        with self.assertRaises(CommandError):
+            call_command("validate_records", path)
+
+    def test_max_errors(self):
+        path = self._write("records.csv", CSV)
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "validate_records", path, definition=self.definition_path,
+                max_errors=1, stdout=stdout, stderr=stderr)
+
+        self.assertEqual(len(stdout.getvalue().splitlines()), 1)
+        self.assertIn("2 records, 1 invalid", stderr.getvalue())
@@ -0,0 +1,267 @@
+from django.test import TestCase
+from django.http import QueryDict
+
+from .. import serializers as definable_serializer
+from ..validation import ValidationResult, Validator, compile_validation
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+
+
+TEST_DATA_FILE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "data"
+)
+
+
+DEFINITION = """
+main:
+  name: Survey
+  fields:
+  - name: name
+    field: CharField
+    field_kwargs:
+      max_length: 10
+  - name: comment
+    field: definable_serializer.extra_fields.TextField
+    field_kwargs:
+      required: false
+      allow_blank: true
+  - name: age
+    field: IntegerField
+    field_kwargs:
+      min_value: 0
+      max_value: 150
+      allow_null: true
+  - name: score
+    field: DecimalField
+    field_kwargs:
+      max_digits: 5
+      decimal_places: 2
+      required: false
+  - name: agree
+    field: definable_serializer.extra_fields.CheckRequiredField
+  - name: subscribe
+    field: BooleanField
+    field_kwargs:
+      default: false
+  - name: gender
+    field: definable_serializer.extra_fields.RadioField
+    field_args:
+    - [[male, Male], [female, Female]]
+  - name: fruits
+    field: definable_serializer.extra_fields.MultipleCheckboxField
+    field_args:
+    - [[apple, Apple], [orange, Orange]]
+  - name: color
+    field: definable_serializer.extra_fields.ChoiceRequiredField
+    field_args:
+    - [[null, '---'], [red, Red], [blue, Blue]]
+  - name: birthday
+    field: DateField
+    field_kwargs:
+      required: false
+  - name: code
+    field: CharField
+    field_kwargs:
+      required: false
+    field_validate_method: |
+      def validate_method(self, value):
+          from rest_framework import serializers
+          if value and not value.isupper():
+              raise serializers.ValidationError("upper case only")
+          return value.lower()
+  - name: address
+    field: Address
+    field_kwargs:
+      required: false
+  - name: members
+    field: Member
+    field_kwargs:
+      many: true
+      required: false
+  serializer_validate_method: |
+    def validate_method(self, data):
+        from rest_framework import serializers
+        if data.get("name") == "admin":
+            raise serializers.ValidationError("reserved name")
+        return data
+depending_serializers:
+- name: Address
+  fields:
+  - name: city
+    field: CharField
+  - name: zip_code
+    field: RegexField
+    field_args:
+    - '^[0-9]{3}-[0-9]{4}$'
+- name: Member
+  fields:
+  - name: email
+    field: EmailField
+  - name: role
+    field: ChoiceField
+    field_args:
+    - [[owner, Owner], [member, Member]]
+    field_kwargs:
+      default: member
+"""
+
+
+VALID = {
+    "name": "taro",
+    "comment": "",
+    "age": "20",
+    "score": "12.50",
+    "agree": "true",
+    "gender": "male",
+    "fruits": ["apple", "orange"],
+    "color": "red",
+    "birthday": "2000-01-01",
+    "code": "ABC",
+    "address": {"city": "tokyo", "zip_code": "123-4567"},
+    "members": [{"email": "a@example.com"}, {"email": "b@example.com", "role": "owner"}],
+}
+
+
+PAYLOADS = [
+    VALID,
+    {},
+    [],
+    "not a mapping",
+    dict(VALID, name="admin"),
+    dict(VALID, name=""),
+    dict(VALID, name="   "),
+    dict(VALID, name=None),
+    dict(VALID, name="too long name"),
+    dict(VALID, age=None),
+    dict(VALID, age=-1),
+    dict(VALID, age="abc"),
+    dict(VALID, score="1234.5"),
+    dict(VALID, agree=False),
+    dict(VALID, subscribe="maybe"),
+    dict(VALID, gender="unknown"),
+    dict(VALID, fruits="apple"),
+    dict(VALID, fruits=["banana"]),
+    dict(VALID, color=""),
+    dict(VALID, birthday="yesterday"),
+    dict(VALID, code="abc"),
+    dict(VALID, address="tokyo"),
+    dict(VALID, address={"city": "tokyo", "zip_code": "1234567"}),
+    dict(VALID, address=None),
+    dict(VALID, members={"email": "a@example.com"}),
+    dict(VALID, members=[{"email": "a@example.com"}, {"email": "wrong"}]),
+    dict(VALID, members=[{"email": "a@example.com", "role": "admin"}]),
+    dict(VALID, members=[]),
+]
+
+
+class TestCompileValidation(TestCase):
+
+    def assertSameAsIsValid(self, serializer_class, payloads, **kwargs):
+        validate = compile_validation(serializer_class, **kwargs)
+
+        for data in payloads:
+            serializer = serializer_class(data=data, **kwargs)
+            serializer.is_valid()
+
+            result = validate(data)
+            self.assertIsInstance(result, ValidationResult)
+            self.assertEqual(result.validated_data, serializer.validated_data)
+            self.assertEqual(result.errors, serializer.errors)
+            self.assertEqual(
+                json.dumps(result.errors, sort_keys=True, default=repr),
+                json.dumps(serializer.errors, sort_keys=True, default=repr)
+            )
+
+    def test_same_as_is_valid(self):
+        serializer_class = definable_serializer.build_serializer_by_yaml(
+            DEFINITION)
+        self.assertSameAsIsValid(serializer_class, PAYLOADS)
+
+    def test_partial(self):
+        serializer_class = definable_serializer.build_serializer_by_yaml(
+            DEFINITION)
+        self.assertSameAsIsValid(
+            serializer_class, [{}, {"age": "abc"}, {"name": "jiro"}],
+            partial=True)
+
+    def test_html_input(self):
+        serializer_class = definable_serializer.build_serializer_by_yaml(
+            DEFINITION)
+
+        data = QueryDict(mutable=True)
+        data.update({
+            "name": "taro", "age": "20", "agree": "on", "gender": "male",
+            "color": "blue", "address.city": "tokyo",
+            "address.zip_code": "123-4567",
+        })
+        data.setlist("fruits", ["apple", "orange"])
+        self.assertSameAsIsValid(serializer_class, [data])
+
+    def test_all_type_fields(self):
+        serializer_class = definable_serializer.build_serializer_by_json_file(
+            os.path.join(TEST_DATA_FILE_DIR, "test_all_type_fields.json"))
+        self.assertSameAsIsValid(serializer_class, [{}, {
+            "boolean_field": True,
+            "nullboolean_field": None,
+            "char_field": "char",
+            "email_field": "test@example.com",
+            "regex_field": "abc",
+            "slug_field": "slug-slug",
+            "url_field": "http://example.com",
+            "uuid_field": "2a47a0e4-65e1-4b64-b1a5-31e3a6f4f1b1",
+            "filepath_field": "/tmp",
+            "ipaddress_field": "127.0.0.1",
+            "integer_field": 1,
+            "decimal_field": "1.00",
+            "datetime_field": "2000-01-01T00:00:00",
+            "date_field": "2000-01-01",
+            "time_field": "00:00",
+            "duration_field": "1 00:00:00",
+            "choice_field": 1,
+            "multiple_choice_field": [1, 2],
+            "json_field": {"a": 1},
+            "readonly_field": "ignored",
+        }])
+
+
+class TestValidator(TestCase):
+
+    def setUp(self):
+        self.serializer_class = definable_serializer.build_serializer_by_yaml(
+            DEFINITION)
+
+    def test_validate(self):
+        validator = self.serializer_class.validator()
+        self.assertIsInstance(validator, Validator)
+
+        for data in PAYLOADS:
+            serializer = self.serializer_class(data=data)
+            serializer.is_valid()
+
+            validated_data, errors = validator.validate(data)
+            self.assertEqual(validated_data, serializer.validated_data)
+            self.assertEqual(errors, serializer.errors)
+
+        self.assertEqual(
+            validator.validate_many(PAYLOADS[:3]),
+            [validator.validate(data) for data in PAYLOADS[:3]]
+        )
+
+    def test_no_state_between_calls(self):
+        validator = self.serializer_class.validator(partial=True)
+
+        self.assertTrue(validator.validate({"age": "abc"}).errors)
+        self.assertEqual(validator.validate({"name": "jiro"}), ({"name": "jiro"}, {}))
+
+    def test_threads(self):
+        validator = self.serializer_class.validator()
+        payloads = PAYLOADS * 20
+        expected = [validator.validate(data) for data in payloads]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(validator.validate, payloads))
+
+        self.assertEqual(results, expected)
@@ -0,0 +1,174 @@
+from django.apps import apps
+from django.db import OperationalError, connections
+from django.test import TestCase
+
+from .. import serializers as definable_serializer
+from .. import warmup as warmup_module
+from ..warmup import warmup
+from .test_models import ExampleJSONModel, _correct_single_definition_data
+
+from copy import deepcopy
+from unittest import mock
+import gc
+import json
+import os
+import tempfile
+import weakref
+
+
+YAML_DEFINITION = """
+main:
+  name: YamlSerializer
+  fields:
+  - name: title
+    field: CharField
+"""
+
+
+class TestWarmup(TestCase):
+
+    def setUp(self):
+        definable_serializer.build_serializer.cache_clear()
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        for name, text in (
+                ("a.yml", YAML_DEFINITION),
+                ("b.json", json.dumps(_correct_single_definition_data)),
+                ("broken.yml", "main: [{")):
+            with open(os.path.join(self.tmp_dir.name, name), "w") as fh:
+                fh.write(text)
+
+    def test_warmup(self):
+        ExampleJSONModel.objects.create(
+            foo_bar_baz=deepcopy(_correct_single_definition_data))
+        defn = deepcopy(_correct_single_definition_data)
+        defn["main"]["fields"][0]["name"] = "other_field"
+        ExampleJSONModel.objects.create(foo_bar_baz=defn)
+
+        report = warmup(
+            models=["definable_serializer.ExampleJSONModel"],
+            files=[os.path.join(self.tmp_dir.name, "*")],
+            freeze=False,
+        )
+
+        # b.json and the first model definition are the same class
+        self.assertEqual(report.definitions, 3)
+        self.assertEqual(len(report.errors), 1)
+        self.assertTrue(report.errors[0][0].endswith("broken.yml"))
+        self.assertFalse(report.frozen)
+        self.assertGreater(report.elapsed, 0)
+
+        # the built classes are in the build cache
+        info = definable_serializer.build_serializer.cache_info()
+        self.assertEqual(info.currsize, 3)
+
+    def test_more_definitions_than_the_build_cache(self):
+        count = definable_serializer.BUILD_CACHE_SIZE + 10
+        directory = os.path.join(self.tmp_dir.name, "many")
+        os.mkdir(directory)
+
+        for i in range(count):
+            defn = deepcopy(_correct_single_definition_data)
+            defn["main"]["fields"][0]["name"] = "field_{}".format(i)
+            with open(os.path.join(directory, "{:04d}.json".format(i)), "w") as fh:
+                json.dump(defn, fh)
+
+        report = warmup(files=[os.path.join(directory, "*.json")], freeze=False)
+        self.assertEqual(report.definitions, count)
+
+        refs = [weakref.ref(kls) for kls in warmup_module._warmed_classes]
+        gc.collect()
+        self.assertTrue(all(ref() is not None for ref in refs))
+
+        # the evicted classes are found again instead of built
+        self.assertIs(
+            definable_serializer.build_serializer_by_json_file(
+                os.path.join(directory, "0000.json")),
+            refs[0]()
+        )
+
+        # the next warm-up replaces the kept classes
+        report = warmup(files=[os.path.join(self.tmp_dir.name, "a.yml")],
+                        freeze=False)
+        self.assertEqual(report.definitions, 1)
+        self.assertEqual(len(warmup_module._warmed_classes), 1)
+
+    def test_errors_of_sources(self):
+        report = warmup(
+            models=["definable_serializer.NoSuchModel", "broken"],
+            files=[os.path.join(self.tmp_dir.name, "missing.yml")],
+            freeze=False,
+        )
+        self.assertEqual(report.definitions, 0)
+        self.assertEqual(len(report.errors), 3)
+
+    def test_database_error(self):
+        def _model_builds(model_spec):
+            raise OperationalError("no such table")
+            yield
+
+        with mock.patch(
+                "definable_serializer.warmup._model_builds",
+                side_effect=_model_builds) as model_builds:
+            report = warmup(
+                models=["definable_serializer.A", "definable_serializer.B"],
+                files=[os.path.join(self.tmp_dir.name, "a.yml")],
+                freeze=False,
+            )
+
+        # the other models are skipped, not the files
+        model_builds.assert_called_once_with("definable_serializer.A")
+        self.assertEqual(report.definitions, 1)
+        self.assertEqual(len(report.errors), 1)
+        self.assertIsInstance(report.errors[0][1], OperationalError)
+
+    def test_settings_and_freeze(self):
+        defn_settings = {
+            "WARMUP_FILES": [os.path.join(self.tmp_dir.name, "a.yml")],
+        }
+
+        with self.settings(DEFINABLE_SERIALIZER_SETTINGS=defn_settings), \
+                mock.patch("gc.freeze") as freeze:
+            report = warmup()
+
+        freeze.assert_called_once_with()
+        self.assertEqual(report.definitions, 1)
+        self.assertTrue(report.frozen)
+
+    def test_app_ready(self):
+        app_config = apps.get_app_config("definable_serializer")
+
+        with mock.patch("definable_serializer.warmup.warmup") as mocked:
+            app_config.ready()
+            mocked.assert_not_called()
+
+        defn_settings = {
+            "WARMUP_ON_READY": True,
+            "WARMUP_FILES": [os.path.join(self.tmp_dir.name, "*")],
+        }
+        with self.settings(DEFINABLE_SERIALIZER_SETTINGS=defn_settings), \
+                mock.patch("gc.freeze"), \
+                mock.patch.object(connections, "close_all") as close_all, \
+                self.assertLogs("definable_serializer.apps") as logs:
+            app_config.ready()
+
+        close_all.assert_called_once_with()
+        self.assertEqual(len(logs.records), 2)
+        self.assertEqual(logs.records[0].levelname, "INFO")
+        self.assertIn("warmed 2 definitions", logs.records[0].getMessage())
+        self.assertEqual(logs.records[1].levelname, "WARNING")
+        self.assertIn("broken.yml", logs.records[1].getMessage())
+
+        # an unexpected error is logged, not raised
+        with self.settings(DEFINABLE_SERIALIZER_SETTINGS=defn_settings), \
+                mock.patch("definable_serializer.warmup.warmup",
+                           side_effect=RuntimeError("broken")), \
+                mock.patch.object(connections, "close_all") as close_all, \
+                self.assertLogs("definable_serializer.apps") as logs:
+            app_config.ready()
+
+        close_all.assert_called_once_with()
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(logs.records[0].levelname, "ERROR")
@@ -0,0 +1,283 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
+
+from rest_framework import serializers as rf_serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import (
+    CharField, Field, SkipField, empty, get_error_detail, set_value)
+from rest_framework.serializers import as_serializer_error
+from rest_framework.settings import api_settings
+from rest_framework.utils import html
+
+from collections import OrderedDict, namedtuple
+from collections.abc import Mapping
+
+
+__all__ = (
+    "ValidationResult",
+    "Validator",
+    "compile_validation",
+)
+
+
+ValidationResult = namedtuple("ValidationResult", ("validated_data", "errors"))
+
+
+def _overrides(obj, base, name):
+    return getattr(type(obj), name) is not getattr(base, name)
+
+
+def _compile_field(field):
+    """
+    Return a function equivalent to ``field.run_validation``.
+    """
+    if isinstance(field, rf_serializers.ListSerializer):
+        return _compile_list_serializer(field)
+
+    if isinstance(field, rf_serializers.Serializer):
+        return _compile_serializer(field)
+
+    generic = field.run_validation
+
+    if _overrides(field, Field, "validate_empty_values"):
+        return generic
+
+    if type(field).run_validation is CharField.run_validation:
+        trim_whitespace = field.trim_whitespace
+    elif type(field).run_validation is Field.run_validation:
+        trim_whitespace = None
+    else:
+        return generic
+
+    to_internal_value = field.to_internal_value
+    run_validators = field.run_validators
+    has_validators = bool(field.validators) or _overrides(
+        field, Field, "run_validators")
+
+    def run_validation(data=empty):
+        # empty, null and blank values have their own rules (required,
+        # allow_null, allow_blank, default), leave them to the field
+        if data is empty or data is None:
+            return generic(data)
+
+        if trim_whitespace is not None and (
+                data == '' or (trim_whitespace and str(data).strip() == '')):
+            return generic(data)
+
+        value = to_internal_value(data)
+        if has_validators:
+            run_validators(value)
+        return value
+
+    return run_validation
+
+
+def _serializer_run_validation(serializer, base, to_internal_value):
+    """
+    ``base.run_validation`` with to_internal_value replaced.
+    """
+    validate_empty_values = serializer.validate_empty_values
+
+    run_validators = None
+    if serializer.validators or _overrides(serializer, base, "run_validators"):
+        run_validators = serializer.run_validators
+
+    validate = None
+    if _overrides(serializer, base, "validate"):
+        validate = serializer.validate
+
+    def run_validation(data=empty):
+        (is_empty_value, data) = validate_empty_values(data)
+        if is_empty_value:
+            return data
+
+        value = to_internal_value(data)
+        try:
+            if run_validators is not None:
+                run_validators(value)
+            if validate is not None:
+                value = validate(value)
+            assert value is not None, '.validate() should return the validated data'
+        except (ValidationError, DjangoValidationError) as exc:
+            raise ValidationError(detail=as_serializer_error(exc))
+
+        return value
+
+    return run_validation
+
+
+def _compile_serializer(serializer, run_validations=None):
+    """
+    ``run_validations`` replaces the compiled run_validation of the given
+    field names.
+    """
+    run_validations = run_validations or dict()
+
+    if (_overrides(serializer, rf_serializers.Serializer, "run_validation") or
+            _overrides(serializer, rf_serializers.Serializer, "to_internal_value")):
+        return serializer.run_validation
+
+    entries = list()
+    for field in serializer._writable_fields:
+        field_name = field.field_name
+        entries.append((
+            field_name,
+            field,
+            _overrides(field, Field, "get_value"),
+            run_validations.get(field_name, None) or _compile_field(field),
+            getattr(serializer, "validate_" + field_name, None),
+            field.source_attrs,
+            len(field.source_attrs) == 1 and field.source_attrs[0],
+        ))
+
+    error_messages = serializer.error_messages
+
+    def to_internal_value(data):
+        if not isinstance(data, Mapping):
+            message = error_messages['invalid'].format(
+                datatype=type(data).__name__
+            )
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [message]
+            }, code='invalid')
+
+        html_input = html.is_html_input(data)
+        ret = OrderedDict()
+        errors = OrderedDict()
+
+        for (field_name, field, custom_get_value, run_validation,
+             validate_method, source_attrs, source_attr) in entries:
+
+            if custom_get_value or html_input:
+                primitive_value = field.get_value(data)
+            else:
+                primitive_value = data.get(field_name, empty)
+
+            try:
+                validated_value = run_validation(primitive_value)
+                if validate_method is not None:
+                    validated_value = validate_method(validated_value)
+            except ValidationError as exc:
+                errors[field_name] = exc.detail
+            except DjangoValidationError as exc:
+                errors[field_name] = get_error_detail(exc)
+            except SkipField:
+                pass
+            else:
+                if source_attr:
+                    ret[source_attr] = validated_value
+                else:
+                    set_value(ret, source_attrs, validated_value)
+
+        if errors:
+            raise ValidationError(errors)
+
+        return ret
+
+    return _serializer_run_validation(
+        serializer, rf_serializers.Serializer, to_internal_value)
+
+
+def _compile_list_serializer(list_serializer):
+    if (_overrides(list_serializer, rf_serializers.ListSerializer, "run_validation") or
+            _overrides(list_serializer, rf_serializers.ListSerializer, "to_internal_value")):
+        return list_serializer.run_validation
+
+    child_run_validation = _compile_field(list_serializer.child)
+    error_messages = list_serializer.error_messages
+    allow_empty = list_serializer.allow_empty
+
+    def to_internal_value(data):
+        if html.is_html_input(data):
+            data = html.parse_html_list(data, default=[])
+
+        if not isinstance(data, list):
+            message = error_messages['not_a_list'].format(
+                input_type=type(data).__name__
+            )
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [message]
+            }, code='not_a_list')
+
+        if not allow_empty and len(data) == 0:
+            message = error_messages['empty']
+            raise ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [message]
+            }, code='empty')
+
+        ret = []
+        errors = []
+
+        for item in data:
+            try:
+                validated = child_run_validation(item)
+            except ValidationError as exc:
+                errors.append(exc.detail)
+            else:
+                ret.append(validated)
+                errors.append({})
+
+        if any(errors):
+            raise ValidationError(errors)
+
+        return ret
+
+    return _serializer_run_validation(
+        list_serializer, rf_serializers.ListSerializer, to_internal_value)
+
+
+def _as_result(run_validation):
+    def validate(data):
+        try:
+            validated_data = run_validation(data)
+        except ValidationError as exc:
+            return ValidationResult({}, exc.detail)
+
+        return ValidationResult(validated_data, {})
+
+    return validate
+
+
+def compile_validation(serializer_class, context=None, partial=False):
+    """
+    Return a function which validates a payload the same way as
+    ``serializer_class(data=data).is_valid()`` and returns a
+    ``ValidationResult(validated_data, errors)``.
+
+    The fields are bound once to a prototype serializer, so the per call
+    cost of copying the declared fields is gone, and the common fields are
+    validated without the generic ``run_validation`` dispatch. Validate
+    methods receive the prototype as ``self``, which has the given
+    ``context`` but no ``initial_data``.
+    """
+    prototype = serializer_class(context=context or {}, partial=partial)
+    return _as_result(_compile_field(prototype))
+
+
+class Validator:
+    """
+    Validate payloads against a serializer class whose fields are bound
+    once, see ``compile_validation``.
+
+    A validator keeps no state between calls: it doesn't need a reset and
+    one validator can be shared by threads.
+    """
+
+    def __init__(self, serializer_class, context=None, partial=False):
+        self.serializer_class = serializer_class
+        self.context = context
+        self.partial = partial
+        self._validate = compile_validation(
+            serializer_class, context=context, partial=partial)
+
+    def validate(self, data):
+        """
+        Return ``ValidationResult(validated_data, errors)`` of a payload.
+        """
+        return self._validate(data)
+
+    def validate_many(self, payloads):
+        return [self._validate(data) for data in payloads]
+
+    def __repr__(self):
+        return "<{} for {}>".format(
+            self.__class__.__name__, self.serializer_class.__name__)
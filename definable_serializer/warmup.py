@@ -0,0 +1,148 @@
+from django.apps import apps
+from django.conf import settings as dj_settings
+from django.db import DatabaseError
+
+from .models.fields import AbstractDefinableSerializerField
+from .serializers import (
+    build_serializer,
+    build_serializer_by_json_file,
+    build_serializer_by_yaml_file,
+)
+
+from collections import OrderedDict, namedtuple
+
+import functools
+import gc
+import glob
+import os
+import time
+
+
+__all__ = (
+    "WarmupReport",
+    "warmup",
+)
+
+
+WarmupReport = namedtuple(
+    "WarmupReport", ("definitions", "errors", "elapsed", "frozen"))
+
+# the classes of the last warm-up, kept even when the build cache evicts
+# them so the workers share them instead of building them again
+_warmed_classes = list()
+
+
+def _model_fields(model_spec):
+    """
+    Return the model and its definition fields of "app_label.Model" or
+    "app_label.Model.field_name".
+    """
+    parts = model_spec.split(".")
+    if len(parts) not in (2, 3):
+        raise ValueError(
+            "'{}' is not app_label.Model or app_label.Model.field".format(
+                model_spec))
+
+    model = apps.get_model(parts[0], parts[1])
+    if len(parts) == 3:
+        return model, [model._meta.get_field(parts[2])]
+
+    return model, [
+        field for field in model._meta.fields
+        if isinstance(field, AbstractDefinableSerializerField)
+    ]
+
+
+def _model_builds(model_spec):
+    model, fields = _model_fields(model_spec)
+
+    for field in fields:
+        values = model._default_manager.values_list(
+            field.attname, flat=True).iterator()
+
+        for defn_data in values:
+            if not defn_data:
+                continue
+
+            yield "{}.{}".format(model_spec, field.name), functools.partial(
+                build_serializer,
+                defn_data,
+                base_classes=getattr(field, "base_classes", list()),
+                allow_validate_method=getattr(
+                    field, "allow_validate_method", True),
+            )
+
+
+def _file_builds(pattern):
+    for path in sorted(glob.glob(pattern)) or [pattern]:
+        if os.path.splitext(path)[1].lower() == ".json":
+            yield path, functools.partial(build_serializer_by_json_file, path)
+        else:
+            yield path, functools.partial(build_serializer_by_yaml_file, path)
+
+
+def warmup(models=None, files=None, freeze=True):
+    """
+    Build the definitions stored in ``models`` and ``files`` before the
+    server forks its workers, then move the objects to the permanent
+    generation with ``gc.freeze()`` so the workers share their memory
+    pages copy-on-write. The built classes are kept until the next
+    warm-up, whatever the size of the build cache.
+
+    ``models`` are "app_label.Model" (every definition field of the model)
+    or "app_label.Model.field" strings, ``files`` are paths or glob
+    patterns of YAML and JSON files. They default to the ``WARMUP_MODELS``
+    and ``WARMUP_FILES`` settings. A broken definition doesn't stop the
+    warm-up, its error is in the returned ``WarmupReport``, whose
+    ``definitions`` is the number of kept classes. After a database
+    error, the remaining models are skipped.
+    """
+    defn_settings = getattr(dj_settings, "DEFINABLE_SERIALIZER_SETTINGS", {})
+    if models is None:
+        models = defn_settings.get("WARMUP_MODELS", [])
+    if files is None:
+        files = defn_settings.get("WARMUP_FILES", [])
+
+    start = time.perf_counter()
+    serializer_classes = OrderedDict()
+    errors = list()
+
+    sources = [(spec, _model_builds) for spec in models]
+    sources += [(pattern, _file_builds) for pattern in files]
+    database_error = False
+
+    for source, builds in sources:
+        if database_error and builds is _model_builds:
+            continue
+
+        try:
+            for name, build in builds(source):
+                try:
+                    serializer_class = build()
+                    # create the lazy fields too
+                    list(serializer_class().fields.values())
+                except Exception as e:
+                    errors.append((name, e))
+                else:
+                    # the same definition may be in several places
+                    serializer_classes[serializer_class] = None
+
+        except DatabaseError as e:
+            # no database or no tables yet, e.g. in migrate or collectstatic
+            errors.append((source, e))
+            database_error = True
+
+        except Exception as e:
+            # a missing model or field
+            errors.append((source, e))
+
+    _warmed_classes[:] = serializer_classes
+
+    frozen = False
+    if freeze and hasattr(gc, "freeze"):
+        gc.collect()
+        gc.freeze()
+        frozen = True
+
+    return WarmupReport(
+        len(_warmed_classes), errors, time.perf_counter() - start, frozen)
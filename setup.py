@@ -39,6 +39,9 @@ setup(
         "six>=1.13.0",
         "dateparser==0.7.2",
     ],
+    extras_require={
+        "numpy": ["numpy"],
+    },
     classifiers=[
         'Development Status :: 4 - Beta',
         'Environment :: Web Environment',